@@ -0,0 +1,40 @@
+"""Add partial indexes for active (not soft deleted) rows
+
+Revision ID: b7e3d41c9a05
+Revises: 6ec8342dbd56
+Create Date: 2026-10-18 10:12:31.204117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3d41c9a05'
+down_revision: Union[str, None] = '6ec8342dbd56'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE_ROWS = {'sqlite_where': sa.text('is_deleted = 0'), 'postgresql_where': sa.text('NOT is_deleted')}
+
+
+def upgrade() -> None:
+    # reports filteren op warehouse + maand, de orders lijst sorteert standaard op order_date
+    op.create_index('ix_orders_active_warehouse_id_order_date', 'orders', ['warehouse_id', 'order_date'],
+                    unique=False, **ACTIVE_ROWS)
+    op.create_index('ix_orders_active_order_date', 'orders', ['order_date'],
+                    unique=False, **ACTIVE_ROWS)
+    # dubbele reference check bij batch aanmaken
+    op.create_index('ix_orders_active_reference', 'orders', ['reference'],
+                    unique=False, **ACTIVE_ROWS)
+    op.create_index('ix_items_active_supplier_id', 'items', ['supplier_id'],
+                    unique=False, **ACTIVE_ROWS)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_items_active_supplier_id', table_name='items')
+    op.drop_index('ix_orders_active_reference', table_name='orders')
+    op.drop_index('ix_orders_active_order_date', table_name='orders')
+    op.drop_index('ix_orders_active_warehouse_id_order_date', table_name='orders')
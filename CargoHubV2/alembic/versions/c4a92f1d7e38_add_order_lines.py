@@ -0,0 +1,86 @@
+"""Move order items from the orders.items JSON column to an order_lines table
+
+Revision ID: c4a92f1d7e38
+Revises: b7e3d41c9a05
+Create Date: 2026-10-18 14:21:07.518220
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a92f1d7e38'
+down_revision: Union[str, None] = 'b7e3d41c9a05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# orders per insert tijdens de backfill
+BATCH_SIZE = 5000
+
+
+def parse_items(items):
+    # de loader sloeg items op als json string binnen de JSON kolom, de API als lijst
+    while isinstance(items, str):
+        items = json.loads(items)
+    return items or []
+
+
+def upgrade() -> None:
+    order_lines = op.create_table(
+        'order_lines',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('order_id', sa.Integer(), nullable=False),
+        sa.Column('item_uid', sa.String(), nullable=False),
+        sa.Column('amount', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['order_id'], ['orders.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_order_lines_order_id'), 'order_lines', ['order_id'], unique=False)
+    op.create_index('ix_order_lines_item_uid_order_id', 'order_lines', ['item_uid', 'order_id'], unique=False)
+
+    # backfill uit de JSON kolom, in batches zodat niet alle orders tegelijk in het geheugen staan
+    conn = op.get_bind()
+    orders = sa.table('orders', sa.column('id', sa.Integer), sa.column('items', sa.JSON))
+    result = conn.execution_options(stream_results=True).execute(
+        sa.select(orders.c.id, orders.c['items']).order_by(orders.c.id))
+    while True:
+        batch = result.fetchmany(BATCH_SIZE)
+        if not batch:
+            break
+        lines = [
+            {"order_id": order_id, "item_uid": item["item_id"], "amount": item["amount"]}
+            for order_id, items in batch for item in parse_items(items)
+        ]
+        if lines:
+            conn.execute(order_lines.insert(), lines)
+
+    with op.batch_alter_table('orders') as batch_op:
+        batch_op.drop_column('items')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('orders') as batch_op:
+        batch_op.add_column(sa.Column('items', sa.JSON(), nullable=True))
+
+    conn = op.get_bind()
+    orders = sa.table('orders', sa.column('id', sa.Integer), sa.column('items', sa.JSON))
+    order_lines = sa.table('order_lines', sa.column('order_id', sa.Integer), sa.column('item_uid', sa.String),
+                           sa.column('amount', sa.Integer), sa.column('id', sa.Integer))
+    items = {}
+    for order_id, item_uid, amount in conn.execute(
+            sa.select(order_lines.c.order_id, order_lines.c.item_uid, order_lines.c.amount)
+            .order_by(order_lines.c.order_id, order_lines.c.id)):
+        items.setdefault(order_id, []).append({"item_id": item_uid, "amount": amount})
+    if items:
+        conn.execute(
+            orders.update().where(orders.c.id == sa.bindparam('order_id')).values(items=sa.bindparam('order_items')),
+            [{"order_id": order_id, "order_items": order_items} for order_id, order_items in items.items()]
+        )
+
+    op.drop_index('ix_order_lines_item_uid_order_id', table_name='order_lines')
+    op.drop_index(op.f('ix_order_lines_order_id'), table_name='order_lines')
+    op.drop_table('order_lines')
@@ -0,0 +1,62 @@
+"""Add the item -> shipments reverse index
+
+Revision ID: d81f5b2c6a47
+Revises: c4a92f1d7e38
+Create Date: 2026-10-18 15:02:44.930183
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd81f5b2c6a47'
+down_revision: Union[str, None] = 'c4a92f1d7e38'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# shipments per insert tijdens de backfill
+BATCH_SIZE = 5000
+
+
+def parse_items(items):
+    # de loader sloeg items op als json string binnen de JSON kolom, de API als lijst
+    while isinstance(items, str):
+        items = json.loads(items)
+    return items or []
+
+
+def upgrade() -> None:
+    index_table = op.create_table(
+        'shipment_item_index',
+        sa.Column('item_uid', sa.String(), nullable=False),
+        sa.Column('shipment_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['shipment_id'], ['shipments.id']),
+        sa.PrimaryKeyConstraint('item_uid', 'shipment_id')
+    )
+    op.create_index(op.f('ix_shipment_item_index_shipment_id'), 'shipment_item_index', ['shipment_id'],
+                    unique=False)
+
+    conn = op.get_bind()
+    shipments = sa.table('shipments', sa.column('id', sa.Integer), sa.column('items', sa.JSON))
+    result = conn.execution_options(stream_results=True).execute(
+        sa.select(shipments.c.id, shipments.c['items']).order_by(shipments.c.id))
+    while True:
+        batch = result.fetchmany(BATCH_SIZE)
+        if not batch:
+            break
+        rows = [
+            {"shipment_id": shipment_id, "item_uid": item_uid}
+            for shipment_id, items in batch
+            for item_uid in dict.fromkeys(item["item_id"] for item in parse_items(items))
+        ]
+        if rows:
+            conn.execute(index_table.insert(), rows)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_shipment_item_index_shipment_id'), table_name='shipment_item_index')
+    op.drop_table('shipment_item_index')
@@ -0,0 +1,68 @@
+"""Add the daily_order_rollup table for reports
+
+Revision ID: e5c07a3b9d12
+Revises: d81f5b2c6a47
+Create Date: 2026-10-18 16:40:12.385904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5c07a3b9d12'
+down_revision: Union[str, None] = 'd81f5b2c6a47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ROLLUP_FIELDS = ['orders_done', 'items_sold', 'total_revenue', 'total_discount', 'total_tax', 'total_surcharge']
+# kolommen in orders voor total_revenue .. total_surcharge
+ORDER_TOTALS = ['total_amount', 'total_discount', 'total_tax', 'total_surcharge']
+
+
+def upgrade() -> None:
+    rollup = op.create_table(
+        'daily_order_rollup',
+        sa.Column('warehouse_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('orders_done', sa.Integer(), nullable=False),
+        sa.Column('items_sold', sa.Integer(), nullable=False),
+        sa.Column('total_revenue', sa.Float(), nullable=False),
+        sa.Column('total_discount', sa.Float(), nullable=False),
+        sa.Column('total_tax', sa.Float(), nullable=False),
+        sa.Column('total_surcharge', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('warehouse_id', 'day')
+    )
+    op.create_index(op.f('ix_daily_order_rollup_day'), 'daily_order_rollup', ['day'], unique=False)
+
+    # backfill met een INSERT ... SELECT, zelfde query als rollup_service.rebuild_rollup
+    orders = sa.table('orders', sa.column('id', sa.Integer), sa.column('warehouse_id', sa.Integer),
+                      sa.column('order_date', sa.DateTime), sa.column('is_deleted', sa.Boolean),
+                      *[sa.column(field, sa.Float) for field in ORDER_TOTALS])
+    order_lines = sa.table('order_lines', sa.column('order_id', sa.Integer), sa.column('amount', sa.Integer))
+    items_per_order = (
+        sa.select(sa.func.sum(order_lines.c.amount))
+        .where(order_lines.c.order_id == orders.c.id)
+        .correlate(orders)
+        .scalar_subquery()
+    )
+    day = sa.func.date(orders.c.order_date)
+    query = (
+        sa.select(
+            orders.c.warehouse_id,
+            day,
+            sa.func.count(orders.c.id),
+            sa.func.coalesce(sa.func.sum(items_per_order), 0),
+            *[sa.func.coalesce(sa.func.sum(orders.c[field]), 0) for field in ORDER_TOTALS],
+        )
+        .where(orders.c.is_deleted == sa.false())
+        .group_by(orders.c.warehouse_id, day)
+    )
+    op.get_bind().execute(rollup.insert().from_select(['warehouse_id', 'day', *ROLLUP_FIELDS], query))
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_daily_order_rollup_day'), table_name='daily_order_rollup')
+    op.drop_table('daily_order_rollup')
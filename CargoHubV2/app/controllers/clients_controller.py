@@ -1,9 +1,15 @@
-from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Response
 from sqlalchemy.orm import Session
 from CargoHubV2.app.database import get_db
 from CargoHubV2.app.schemas.clients_schema import *
 from CargoHubV2.app.services.clients_service import *
 from typing import Optional, List
+from CargoHubV2.app.services.pagination_service import set_next_cursor, CURSOR_DESCRIPTION
+from CargoHubV2.app.services.filtering_service import filter_params
+from CargoHubV2.app.models import Client
+from CargoHubV2.app.services.response_service import orm_response
+from CargoHubV2.app.services.projection_service import parse_fields, FIELDS_DESCRIPTION
+
 
 router = APIRouter(
     prefix="/api/v2/clients",
@@ -23,20 +29,27 @@ def create_client_endpoint(
 
 @router.get("/")
 def get_clients(
+    response: Response,
     id: Optional[int] = None,
     offset: int = 0,
     limit: int = 100,
     sort_by: Optional[str] = "id",
     order: Optional[str] = "asc",
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    filters: list = Depends(filter_params),
     db: Session = Depends(get_db),
     api_key: str = Header(...),
 ):
+    fields = parse_fields(fields, Client)
     if id:
         client = get_client(db, id)
         if not client:
             raise HTTPException(status_code=404, detail="Client not found")
-        return client
-    return get_all_clients(db, offset, limit, sort_by, order)
+        return orm_response(client, Client, fields=fields)
+    rows = get_all_clients(db, offset, limit, sort_by, order, cursor=cursor, fields=fields, filters=filters)
+    set_next_cursor(response, rows, sort_by, order, limit, cursor)
+    return orm_response(rows, Client, response, fields=fields)
 
 
 @router.get("/{country}")
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Response
 from sqlalchemy.orm import Session
 from typing import Optional
 from ..services.docks_service import (
@@ -10,6 +10,12 @@ from ..services.docks_service import (
 )
 from ..schemas.docks_schema import DockCreate, DockUpdate
 from ..database import get_db
+from CargoHubV2.app.services.pagination_service import set_next_cursor, CURSOR_DESCRIPTION
+from CargoHubV2.app.services.filtering_service import filter_params
+from CargoHubV2.app.models import Dock
+from CargoHubV2.app.services.response_service import orm_response
+from CargoHubV2.app.services.projection_service import parse_fields, FIELDS_DESCRIPTION
+
 
 router = APIRouter(
     prefix="/api/v2/docks",
@@ -19,26 +25,33 @@ router = APIRouter(
 
 @router.get("/")
 def get_docks(
+    response: Response,
     db: Session = Depends(get_db),
     code: Optional[str] = None,
     offset: int = 0,
     limit: int = 100,
     sort_by: Optional[str] = "id",  # Default sorting column is `id`
     order: Optional[str] = "asc",  # Default sorting order is `asc`
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    filters: list = Depends(filter_params),
     api_key: str = Header(...),
 ):
     """
     Retrieve docks with optional filtering by code, pagination, and sorting.
     """
+    fields = parse_fields(fields, Dock)
     # If `code` is provided, retrieve a single dock by code
     if code:
         dock = get_dock_by_code(db, code)
         if dock is None:
             raise HTTPException(status_code=404, detail="Dock not found")
-        return dock
+        return orm_response(dock, Dock, fields=fields)
 
     # Otherwise, retrieve all docks with sorting and pagination
-    return get_all_docks(db, offset=offset, limit=limit, sort_by=sort_by, order=order)
+    rows = get_all_docks(db, offset=offset, limit=limit, sort_by=sort_by, order=order, cursor=cursor, fields=fields, filters=filters)
+    set_next_cursor(response, rows, sort_by, order, limit, cursor)
+    return orm_response(rows, Dock, response, fields=fields)
 
 
 @router.post("/")
@@ -1,10 +1,17 @@
-from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Response
 from sqlalchemy.orm import Session
-from CargoHubV2.app.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from CargoHubV2.app.database import get_db, get_async_db
 from CargoHubV2.app.schemas.inventories_schema import InventoryResponse, InventoryCreate, InventoryUpdate
 from CargoHubV2.app.schemas.locations_schema import Location
 from CargoHubV2.app.services import inventories_service
 from typing import Optional, List
+from CargoHubV2.app.services.pagination_service import set_next_cursor, CURSOR_DESCRIPTION
+from CargoHubV2.app.services.filtering_service import filter_params
+from CargoHubV2.app.models import Inventory
+from CargoHubV2.app.services.response_service import orm_response
+from CargoHubV2.app.services.projection_service import parse_fields, FIELDS_DESCRIPTION
+
 
 router = APIRouter(
     prefix="/api/v2/inventories",
@@ -23,21 +30,28 @@ def create_inventory(
 
 
 @router.get("/")
-def get_inventories(
+async def get_inventories(
+    response: Response,
     item_reference: Optional[str] = None,
     offset: int = 0,
     limit: int = 100,
     sort_by: Optional[str] = "id",
     order: Optional[str] = "asc",
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    filters: list = Depends(filter_params),
+    db: AsyncSession = Depends(get_async_db),
     api_key: str = Header(...),
 ):
+    fields = parse_fields(fields, Inventory)
     if item_reference:
-        inven = inventories_service.get_inventory(db, item_reference)
+        inven = await inventories_service.get_inventory_async(db, item_reference)
         if not inven:
             raise HTTPException(status_code=404, detail="Inventory not found")
-        return inven
-    return inventories_service.get_all_inventories(db, offset, limit, sort_by, order)
+        return orm_response(inven, Inventory, fields=fields)
+    rows = await inventories_service.get_all_inventories_async(db, offset, limit, sort_by, order, cursor=cursor, fields=fields, filters=filters)
+    set_next_cursor(response, rows, sort_by, order, limit, cursor)
+    return orm_response(rows, Inventory, response, fields=fields)
 
 
 @router.put("/{item_reference}", response_model=InventoryResponse)
@@ -1,9 +1,13 @@
-from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Response
 from sqlalchemy.orm import Session
 from CargoHubV2.app.database import get_db
 from CargoHubV2.app.schemas.item_groups_schema import ItemGroupCreate, ItemGroupUpdate, ItemGroupResponse
 from CargoHubV2.app.services.item_groups_service import create_item_group, get_item_group, get_all_item_groups, update_item_group, delete_item_group
 from typing import Optional, List
+from CargoHubV2.app.services.pagination_service import set_next_cursor, CURSOR_DESCRIPTION
+from CargoHubV2.app.services.filtering_service import filter_params
+from CargoHubV2.app.services.response_service import orm_response
+from CargoHubV2.app.services.projection_service import parse_fields, FIELDS_DESCRIPTION
 
 
 router = APIRouter(
@@ -24,20 +28,27 @@ def create_item_group_endpoint(
 
 @router.get("/", response_model=List[ItemGroupResponse])
 def get_item_groups(
+    response: Response,
     id: Optional[int] = None,
     offset: int = 0,
     limit: int = 100,
     sort_by: Optional[str] = "id",
     order: Optional[str] = "asc",
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    filters: list = Depends(filter_params),
     db: Session = Depends(get_db),
     api_key: str = Header(...),
 ):
+    fields = parse_fields(fields, ItemGroupResponse)
     if id:
         item_group = get_item_group(db, id)
         if not item_group:
             raise HTTPException(status_code=404, detail="Item group not found")
-        return [item_group]
-    return get_all_item_groups(db, offset, limit, sort_by, order)
+        return orm_response([item_group], ItemGroupResponse, fields=fields)
+    rows = get_all_item_groups(db, offset, limit, sort_by, order, cursor=cursor, fields=fields, filters=filters)
+    set_next_cursor(response, rows, sort_by, order, limit, cursor)
+    return orm_response(rows, ItemGroupResponse, response, fields=fields)
 
 
 @router.put("/{id}")
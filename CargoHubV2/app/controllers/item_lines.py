@@ -1,9 +1,14 @@
-from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Response
 from sqlalchemy.orm import Session
 from CargoHubV2.app.database import get_db
 from CargoHubV2.app.schemas.item_lines_schema import ItemLineCreate, ItemLineUpdate, ItemLineResponse
 from CargoHubV2.app.services.item_lines_service import create_item_line, get_item_line, get_all_item_lines, update_item_line, delete_item_line
 from typing import Optional, List
+from CargoHubV2.app.services.pagination_service import set_next_cursor, CURSOR_DESCRIPTION
+from CargoHubV2.app.services.filtering_service import filter_params
+from CargoHubV2.app.models import ItemLine
+from CargoHubV2.app.services.response_service import orm_response
+from CargoHubV2.app.services.projection_service import parse_fields, FIELDS_DESCRIPTION
 
 
 router = APIRouter(
@@ -24,20 +29,27 @@ def create_item_line_endpoint(
 
 @router.get("/")
 def get_item_lines(
+    response: Response,
     id: Optional[int] = None,
     offset: int = 0,
     limit: int = 100,
     sort_by: Optional[str] = "id",  
     order: Optional[str] = "asc",  
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    filters: list = Depends(filter_params),
     db: Session = Depends(get_db),
     api_key: str = Header(...),
 ):
+    fields = parse_fields(fields, ItemLine)
     if id:
         item_line = get_item_line(db, id)
         if not item_line:
             raise HTTPException(status_code=404, detail="Item line not found")
-        return item_line
-    return get_all_item_lines(db, offset, limit, sort_by, order)
+        return orm_response(item_line, ItemLine, fields=fields)
+    rows = get_all_item_lines(db, offset, limit, sort_by, order, cursor=cursor, fields=fields, filters=filters)
+    set_next_cursor(response, rows, sort_by, order, limit, cursor)
+    return orm_response(rows, ItemLine, response, fields=fields)
 
 
 @router.put("/{id}")
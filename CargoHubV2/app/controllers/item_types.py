@@ -1,9 +1,14 @@
-from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Response
 from sqlalchemy.orm import Session
 from CargoHubV2.app.database import get_db
 from CargoHubV2.app.schemas.item_types_schema import ItemTypeCreate, ItemTypeUpdate, ItemTypeResponse
 from CargoHubV2.app.services.item_types_service import create_item_type, get_item_type, get_all_item_types, update_item_type, delete_item_type
 from typing import Optional, List
+from CargoHubV2.app.services.pagination_service import set_next_cursor, CURSOR_DESCRIPTION
+from CargoHubV2.app.services.filtering_service import filter_params
+from CargoHubV2.app.services.response_service import orm_response
+from CargoHubV2.app.services.projection_service import parse_fields, FIELDS_DESCRIPTION
+
 
 router = APIRouter(
     prefix="/api/v2/item_types",  # Use underscore (_) instead of hyphen (-)
@@ -23,20 +28,27 @@ def create_item_type_endpoint(
 
 @router.get("/", response_model=List[ItemTypeResponse])
 def get_item_types(
+    response: Response,
     id: Optional[int] = None,
     offset: int = 0,
     limit: int = 100,
     sort_by: Optional[str] = "id",
     order: Optional[str] = "asc",
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    filters: list = Depends(filter_params),
     db: Session = Depends(get_db),
     api_key: str = Header(...),
 ):
+    fields = parse_fields(fields, ItemTypeResponse)
     if id:
         item_type = get_item_type(db, id)
         if not item_type:
             raise HTTPException(status_code=404, detail="Item type not found")
-        return [item_type]
-    return get_all_item_types(db, offset, limit, sort_by, order)
+        return orm_response([item_type], ItemTypeResponse, fields=fields)
+    rows = get_all_item_types(db, offset, limit, sort_by, order, cursor=cursor, fields=fields, filters=filters)
+    set_next_cursor(response, rows, sort_by, order, limit, cursor)
+    return orm_response(rows, ItemTypeResponse, response, fields=fields)
 
 
 @router.put("/{id}")
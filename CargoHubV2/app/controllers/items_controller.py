@@ -1,10 +1,16 @@
-from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Response
 from sqlalchemy.orm import Session
 from CargoHubV2.app.database import get_db
 from CargoHubV2.app.schemas.items_schema import *
 from CargoHubV2.app.services.items_service import *
 
 from typing import Optional, List
+from CargoHubV2.app.services.pagination_service import set_next_cursor, CURSOR_DESCRIPTION
+from CargoHubV2.app.services.filtering_service import filter_params
+from CargoHubV2.app.models import Item
+from CargoHubV2.app.services.response_service import orm_response
+from CargoHubV2.app.services.projection_service import parse_fields, FIELDS_DESCRIPTION
+
 
 router = APIRouter(
     prefix="/api/v2/items",
@@ -24,23 +30,51 @@ def create_item_endpoint(
 
 @router.get("/")
 def get_items(
+    response: Response,
     code: Optional[str] = None,
     offset: int = 0,
     limit: int = 100,
     sort_by: Optional[str] = "uid",
     order: Optional[str] = "asc",
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    filters: list = Depends(filter_params),
     db: Session = Depends(get_db),
     api_key: str = Header(...),
 ):
+    fields = parse_fields(fields, Item)
     if code:
         item = get_item(db, code)
         if not item:
             raise HTTPException(status_code=404, detail="Item not found")
-        return item
-    return get_all_items(db, offset, limit, sort_by or "id", order)
+        return orm_response(item, Item, fields=fields)
+    rows = get_all_items(db, offset, limit, sort_by or "id", order, cursor=cursor, fields=fields, filters=filters)
+    set_next_cursor(response, rows, sort_by, order, limit, cursor)
+    return orm_response(rows, Item, response, fields=fields)
+
 
 
 
+@router.get("/{code}/orders")
+def get_orders_for_item_endpoint(
+    code: str,
+    open_only: bool = True,
+    db: Session = Depends(get_db),
+    api_key: str = Header(...),
+):
+    # code of uid van het item, open_only laat Delivered orders weg
+    return get_orders_for_item(db, code, open_only)
+
+
+@router.get("/{code}/shipments")
+def get_shipments_for_item_endpoint(
+    code: str,
+    open_only: bool = True,
+    db: Session = Depends(get_db),
+    api_key: str = Header(...),
+):
+    return get_shipments_for_item(db, code, open_only)
+
 
 @router.put("/{code}", response_model=ItemResponse)
 def update_item_endpoint(
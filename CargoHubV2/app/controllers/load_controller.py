@@ -1,7 +1,7 @@
 from fastapi import APIRouter, HTTPException, Depends, Header
 from sqlalchemy.orm import Session
 from CargoHubV2.app.database import get_db
-from CargoHubV2.app.services.loader_service import load
+from CargoHubV2.app.services.loader_service import load, CHUNK_SIZE
 from typing import Optional, List
 
 router = APIRouter(
@@ -11,5 +11,13 @@ router = APIRouter(
 
 
 @router.post("/",)
-def load_from_json(path, db: Session = Depends(get_db), api_key: str = Header(...)):
-    return load(path, db)
+def load_from_json(
+    path,
+    chunk_size: int = CHUNK_SIZE,
+    resume: bool = True,
+    parallel: bool = False,
+    workers: Optional[int] = None,
+    db: Session = Depends(get_db),
+    api_key: str = Header(...)
+):
+    return load(path, db, chunk_size, resume, parallel, workers)
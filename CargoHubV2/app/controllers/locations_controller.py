@@ -1,10 +1,15 @@
-from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Response
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from CargoHubV2.app.services import locations_service
 from CargoHubV2.app.schemas import locations_schema
-from CargoHubV2.app.database import get_db
+from CargoHubV2.app.database import get_db, get_async_db
 from typing import Optional
 from typing import List
+from CargoHubV2.app.services.pagination_service import set_next_cursor, CURSOR_DESCRIPTION
+from CargoHubV2.app.services.filtering_service import filter_params
+from CargoHubV2.app.services.response_service import orm_response
+from CargoHubV2.app.services.projection_service import parse_fields, FIELDS_DESCRIPTION
 
 
 router = APIRouter(
@@ -14,36 +19,44 @@ router = APIRouter(
 
 
 @router.get("/", response_model=List[locations_schema.Location])
-def get_all_locations(
+async def get_all_locations(
+    response: Response,
     offset: int = 0,
     limit: int = 100,
     sort_by: Optional[str] = "id",
     order: Optional[str] = "asc",
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    filters: list = Depends(filter_params),
+    db: AsyncSession = Depends(get_async_db),
     api_key: str = Header(...),
 ):
-    return locations_service.get_all_locations(db, offset=offset, limit=limit, sort_by=sort_by, order=order)
+    fields = parse_fields(fields, locations_schema.Location)
+    rows = await locations_service.get_all_locations_async(db, offset=offset, limit=limit, sort_by=sort_by, order=order,
+                                                           cursor=cursor, fields=fields, filters=filters)
+    set_next_cursor(response, rows, sort_by, order, limit, cursor)
+    return orm_response(rows, locations_schema.Location, response, fields=fields)
 
 
 @router.get("/{id}", response_model=locations_schema.Location)
-def get_location_by_id(id: int, db: Session = Depends(get_db), api_key: str = Header(...)):
-    location = locations_service.get_location_by_id(db, id)
+async def get_location_by_id(id: int, db: AsyncSession = Depends(get_async_db), api_key: str = Header(...)):
+    location = await locations_service.get_location_by_id_async(db, id)
     if not location:
         raise HTTPException(status_code=404, detail="Location id not found")
     return location
 
 
 @router.get("/warehouse/{warehouse_id}", response_model=List[locations_schema.Location])
-def get_locations_by_warehouse_id(
+async def get_locations_by_warehouse_id(
     warehouse_id: int,
     offset: int = 0,
     limit: int = 100,
     sort_by: Optional[str] = "id",
     order: Optional[str] = "asc",
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     api_key: str = Header(...),
 ):
-    return locations_service.get_locations_by_warehouse_id(db, warehouse_id, offset=offset, limit=limit, sort_by=sort_by, order=order)
+    return await locations_service.get_locations_by_warehouse_id_async(db, warehouse_id, offset=offset, limit=limit, sort_by=sort_by, order=order)
 
 
 @router.post("/")
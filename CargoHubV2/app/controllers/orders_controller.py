@@ -1,10 +1,15 @@
-from fastapi import APIRouter, HTTPException, Depends, Header, Query
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Response
 from sqlalchemy.orm import Session
-from CargoHubV2.app.database import get_db
-from CargoHubV2.app.schemas.orders_schema import OrderResponse, OrderCreate, OrderUpdate
+from sqlalchemy.ext.asyncio import AsyncSession
+from CargoHubV2.app.database import get_db, get_async_db
+from CargoHubV2.app.schemas.orders_schema import OrderResponse, OrderCreate, OrderUpdate, OrderBatchResult
 from CargoHubV2.app.services.orders_service import *
-from typing import List, Optional
+from typing import List, Optional, Union
 from datetime import datetime
+from CargoHubV2.app.services.pagination_service import set_next_cursor, CURSOR_DESCRIPTION
+from CargoHubV2.app.services.filtering_service import filter_params
+from CargoHubV2.app.services.response_service import orm_response
+from CargoHubV2.app.services.projection_service import parse_fields, FIELDS_DESCRIPTION
 
 router = APIRouter(
     prefix="/api/v2/orders",
@@ -12,34 +17,51 @@ router = APIRouter(
 )
 
 
-@router.post("/")
+@router.post("/", response_model=OrderResponse)
 def create_order_endpoint(
     order_data: OrderCreate,
     db: Session = Depends(get_db),
     api_key: str = Header(...),
 ):
     order = create_order(db, order_data.model_dump())
-    return order
+    return orm_response(order, OrderResponse)
+
+
+@router.post("/batch", response_model=List[OrderBatchResult])
+def create_orders_batch_endpoint(
+    orders_data: List[OrderCreate],
+    chunk_size: int = Query(BATCH_CHUNK_SIZE, ge=1, description="Number of orders committed per transaction"),
+    db: Session = Depends(get_db),
+    api_key: str = Header(...),
+):
+    return create_orders_batch(db, [order_data.model_dump() for order_data in orders_data], chunk_size)
 
 
-@router.get("/")
-def get_orders(
+@router.get("/", response_model=Union[OrderResponse, List[OrderResponse]])
+async def get_orders(
+    response: Response,
     id: Optional[int] = None,
     date: Optional[datetime] = Query(None, description="Filter orders by a specific date"),
     offset: int = 0,
     limit: int = 100,
     sort_by: Optional[str] = "order_date",
     sort_order: Optional[str] = "asc",
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    filters: list = Depends(filter_params),
+    db: AsyncSession = Depends(get_async_db),
     api_key: str = Header(...),
 ):
+    fields = parse_fields(fields, OrderResponse)
     if id:
-        order = get_order(db, id)
-        return order
-    orders = get_all_orders(db, date=date, offset=offset, limit=limit, sort_by=sort_by, sort_order=sort_order)
+        order = await get_order_async(db, id)
+        return orm_response(order, OrderResponse, fields=fields)
+    orders = await get_all_orders_async(db, date=date, offset=offset, limit=limit, sort_by=sort_by,
+                                        sort_order=sort_order, cursor=cursor, fields=fields, filters=filters)
     if not orders:
         raise HTTPException(status_code=404, detail="No orders found for the specified date")
-    return orders
+    set_next_cursor(response, orders, sort_by, sort_order, limit, cursor)
+    return orm_response(orders, OrderResponse, response, fields=fields)
 
 
 @router.get("/{id}/items")
@@ -55,7 +77,7 @@ def get_order_items(
     return items
 
 
-@router.put("/{id}")
+@router.put("/{id}", response_model=OrderResponse)
 def update_order_endpoint(
     id: int,
     order_data: OrderUpdate,
@@ -65,7 +87,7 @@ def update_order_endpoint(
     order = update_order(db, id, order_data)
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
-    return order
+    return orm_response(order, OrderResponse)
 
 
 @router.delete("/{id}")
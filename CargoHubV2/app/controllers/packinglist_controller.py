@@ -1,8 +1,9 @@
 from fastapi import APIRouter, HTTPException, Depends, Header
 from sqlalchemy.orm import Session
 from CargoHubV2.app.database import get_db
-from CargoHubV2.app.services import packinglist_service
+from CargoHubV2.app.services import job_service
 from CargoHubV2.app.models.orders_model import Order
+from CargoHubV2.app.schemas.orders_schema import PackingWave
 from fastapi.responses import FileResponse
 from pathlib import Path
 
@@ -18,12 +19,27 @@ def create_packing_list(
     db: Session = Depends(get_db),
     api_key: str = Header(...),
 ):
+    # packing lists (pdfkit, jinja2) pas laden bij de eerste aanvraag, niet bij het opstarten
+    from CargoHubV2.app.services import packinglist_service
+
     order = db.query(Order).filter(Order.id == order_id).first()
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
     return packinglist_service.generate_packing_list(order)
 
 
+@router.post("/wave")
+def create_wave_packing_list(
+    wave: PackingWave,
+    db: Session = Depends(get_db),
+    api_key: str = Header(...),
+):
+    from CargoHubV2.app.services import packinglist_service
+
+    # een PDF met de packing lists van alle orders in de wave
+    return packinglist_service.generate_wave_packing_list(db, wave.order_ids, wave.warehouse_id, wave.order_status)
+
+
 @router.get("/get-pdf/{filename}")
 def get_pdf(filename: str, api_key: str = Header(...)):
     PDF_DIR = Path("generated_pdfs")
@@ -40,4 +56,5 @@ def get_pdf(filename: str, api_key: str = Header(...)):
             pdf_path, media_type="application/pdf",
             filename=sanitized_filename)
     else:
-        raise HTTPException(status_code=404, detail="PDF not found")
+        # nog bezig, mislukt of onbekend
+        return job_service.pdf_status_response(sanitized_filename)
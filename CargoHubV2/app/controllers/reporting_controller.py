@@ -2,7 +2,7 @@ from fastapi import APIRouter, HTTPException, Depends, Header
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 from CargoHubV2.app.database import get_db
-from CargoHubV2.app.services import reporting_service
+from CargoHubV2.app.services import job_service
 from typing import List, Optional
 from pathlib import Path
 
@@ -19,6 +19,8 @@ def generate_report_by_warehouse(
     year_to_report: int = 2024,
     api_key: str = Header(...),
         month_to_report: int = 9):
+    # reports (pdfkit, jinja2, charts) pas laden bij het eerste report, niet bij het opstarten
+    from CargoHubV2.app.services import reporting_service
 
     response = reporting_service.report_for_warehouse(db, warehouse_id, year_to_report, month_to_report)
     return reporting_service.generate_pdf(response)
@@ -28,12 +30,12 @@ def generate_report_by_warehouse(
 def generate_general_report(
     db: Session = Depends(get_db),
     year_to_report: int = 2024,
-    month_to_report: int = 9,
-    offset: int = 0,
     api_key: str = Header(...),
-        limit: int = 100):
+        month_to_report: int = 9):
+    from CargoHubV2.app.services import reporting_service
 
-    response = reporting_service.general_report(db, year_to_report, month_to_report, offset, limit)
+    # totalen over alle orders van de maand, offset/limit gelden niet meer voor een report
+    response = reporting_service.general_report(db, year_to_report, month_to_report)
     return reporting_service.generate_pdf(response)
 
 
@@ -52,4 +54,5 @@ def get_pdf(filename: str, api_key: str = Header(...)):
             pdf_path,
             media_type="application/pdf", filename=sanitized_filename)
     else:
-        raise HTTPException(status_code=404, detail="PDF not found")
+        # nog bezig, mislukt of onbekend
+        return job_service.pdf_status_response(sanitized_filename)
@@ -1,9 +1,15 @@
-from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Response
 from sqlalchemy.orm import Session
-from CargoHubV2.app.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from CargoHubV2.app.database import get_db, get_async_db
 from CargoHubV2.app.schemas.shipments_schema import *
 from CargoHubV2.app.services.shipments_service import *
-from typing import Optional, List
+from typing import Optional, List, Union
+from CargoHubV2.app.services.pagination_service import set_next_cursor, CURSOR_DESCRIPTION
+from CargoHubV2.app.services.filtering_service import filter_params
+from CargoHubV2.app.services.response_service import orm_response
+from CargoHubV2.app.services.projection_service import parse_fields, FIELDS_DESCRIPTION
+
 
 router = APIRouter(
     prefix="/api/v2/shipments",
@@ -18,25 +24,33 @@ def create_shipment_endpoint(
     api_key: str = Header(...),
 ):
     shipment = create_shipment(db, shipment_data.model_dump())
-    return shipment
+    return orm_response(shipment, ShipmentResponse)
 
 
-@router.get("/")
-def get_shipments(
+@router.get("/", response_model=Union[ShipmentListResponse, List[ShipmentListResponse]])
+async def get_shipments(
+    response: Response,
     id: Optional[int] = None,
     offset: int = 0,
     limit: int = 100,
     sort_by: Optional[str] = "id",
     order: Optional[str] = "asc",
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    filters: list = Depends(filter_params),
+    db: AsyncSession = Depends(get_async_db),
     api_key: str = Header(...),
 ):
+    fields = parse_fields(fields, ShipmentListResponse)
     if id:
-        shipment = get_shipment(db, id)
+        shipment = await get_shipment_async(db, id)
         if not shipment:
             raise HTTPException(status_code=404, detail="Shipment not found")
-        return shipment
-    return get_all_shipments(db, offset=offset, limit=limit, sort_by=sort_by, order=order)
+        return orm_response(shipment, ShipmentListResponse, fields=fields)
+    rows = await get_all_shipments_async(db, offset=offset, limit=limit, sort_by=sort_by, order=order, cursor=cursor,
+                                         fields=fields, filters=filters)
+    set_next_cursor(response, rows, sort_by, order, limit, cursor)
+    return orm_response(rows, ShipmentListResponse, response, fields=fields)
 
 
 @router.put("/{id}", response_model=ShipmentResponse)
@@ -49,7 +63,7 @@ def update_shipment_endpoint(
     shipment = update_shipment(db, id, shipment_data)
     if not shipment:
         raise HTTPException(status_code=404, detail="Shipment not found")
-    return shipment
+    return orm_response(shipment, ShipmentResponse)
 
 
 @router.delete("/{id}")
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Response
 from sqlalchemy.orm import Session
 from CargoHubV2.app.schemas.suppliers_schema import *
 from CargoHubV2.app.schemas import items_schema 
@@ -6,6 +6,11 @@ from CargoHubV2.app.database import get_db
 from CargoHubV2.app.services.suppliers_service import * 
 from CargoHubV2.app.services import suppliers_service
 from typing import Optional, List
+from CargoHubV2.app.services.pagination_service import set_next_cursor, CURSOR_DESCRIPTION
+from CargoHubV2.app.services.filtering_service import filter_params
+from CargoHubV2.app.models import Supplier
+from CargoHubV2.app.services.response_service import orm_response
+from CargoHubV2.app.services.projection_service import parse_fields, FIELDS_DESCRIPTION
 
 
 router = APIRouter(
@@ -16,20 +21,27 @@ router = APIRouter(
 
 @router.get("/")
 def get_suppliers(
+    response: Response,
     code: Optional[str] = None,
     offset: int = 0,
     limit: int = 100,
     sort_by: Optional[str] = "id",
     order: Optional[str] = "asc",
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    filters: list = Depends(filter_params),
     db: Session = Depends(get_db),
     api_key: str = Header(...),
 ):
+    fields = parse_fields(fields, Supplier)
     if code:
         supplier = get_supplier(db, code)
         if not supplier:
             raise HTTPException(status_code=404, detail="Supplier not found")
-        return supplier
-    return get_all_suppliers(db, offset=offset, limit=limit, sort_by=sort_by, order=order)
+        return orm_response(supplier, Supplier, fields=fields)
+    rows = get_all_suppliers(db, offset=offset, limit=limit, sort_by=sort_by, order=order, cursor=cursor, fields=fields, filters=filters)
+    set_next_cursor(response, rows, sort_by, order, limit, cursor)
+    return orm_response(rows, Supplier, response, fields=fields)
 
 
 @router.post("/", response_model=SuppliersResponse)
@@ -1,9 +1,14 @@
-from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Response
 from sqlalchemy.orm import Session
 from CargoHubV2.app.services import transfers_service
 from CargoHubV2.app.schemas import transfers_schema
 from CargoHubV2.app.database import get_db
 from typing import Optional
+from CargoHubV2.app.services.pagination_service import set_next_cursor, CURSOR_DESCRIPTION
+from CargoHubV2.app.services.filtering_service import filter_params
+from CargoHubV2.app.models import Transfer
+from CargoHubV2.app.services.response_service import orm_response
+from CargoHubV2.app.services.projection_service import parse_fields, FIELDS_DESCRIPTION
 
 
 router = APIRouter(
@@ -20,20 +25,27 @@ def create_transfer(transfer: transfers_schema.TransferCreate, db: Session = Dep
 
 @router.get("/")
 def get_transfers(
+    response: Response,
     db: Session = Depends(get_db),
     id: Optional[int] = None,
     offset: int = 0,
     limit: int = 100,
     sort_by: Optional[str] = "id",
     order: Optional[str] = "asc",
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    filters: list = Depends(filter_params),
     api_key: str = Header(...),
 ):
+    fields = parse_fields(fields, Transfer)
     if id:
         transfer = transfers_service.get_transfer(db, id)
         if not transfer:
             raise HTTPException(status_code=404, detail="Transfer not found")
-        return transfer
-    return transfers_service.get_all_transfers(db, offset=offset, limit=limit, sort_by=sort_by, order=order)
+        return orm_response(transfer, Transfer, fields=fields)
+    rows = transfers_service.get_all_transfers(db, offset=offset, limit=limit, sort_by=sort_by, order=order, cursor=cursor, fields=fields, filters=filters)
+    set_next_cursor(response, rows, sort_by, order, limit, cursor)
+    return orm_response(rows, Transfer, response, fields=fields)
 
 
 @router.delete("/{id}")
@@ -1,9 +1,13 @@
-from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Response
 from sqlalchemy.orm import Session
 from CargoHubV2.app.services import warehouses_service
 from CargoHubV2.app.schemas import warehouses_schema
 from CargoHubV2.app.database import get_db
-from typing import Optional
+from typing import Optional, List, Union
+from CargoHubV2.app.services.pagination_service import set_next_cursor, CURSOR_DESCRIPTION
+from CargoHubV2.app.services.filtering_service import filter_params
+from CargoHubV2.app.services.response_service import orm_response
+from CargoHubV2.app.services.projection_service import parse_fields, FIELDS_DESCRIPTION
 
 
 router = APIRouter(
@@ -12,22 +16,30 @@ router = APIRouter(
 )
 
 
-@router.get("/")
+@router.get("/", response_model=Union[warehouses_schema.WarehouseResponse, List[warehouses_schema.WarehouseResponse]])
 def get_warehouses(
+    response: Response,
     db: Session = Depends(get_db),
     code: Optional[str] = None,
     offset: int = 0,
     limit: int = 100,
     sort_by: Optional[str] = "id",
     order: Optional[str] = "asc",
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    filters: list = Depends(filter_params),
     api_key: str = Header(...),
 ):
+    fields = parse_fields(fields, warehouses_schema.WarehouseResponse)
     if code:
         warehouse = warehouses_service.get_warehouse_by_code(db, code)
         if warehouse is None:
             raise HTTPException(status_code=404, detail="Warehouse not found")
-        return warehouse
-    return warehouses_service.get_all_warehouses(db, offset=offset, limit=limit, sort_by=sort_by, order=order)
+        return orm_response(warehouse, warehouses_schema.WarehouseResponse, fields=fields)
+    rows = warehouses_service.get_all_warehouses(db, offset=offset, limit=limit, sort_by=sort_by, order=order,
+                                                 cursor=cursor, fields=fields, filters=filters)
+    set_next_cursor(response, rows, sort_by, order, limit, cursor)
+    return orm_response(rows, warehouses_schema.WarehouseResponse, response, fields=fields)
 
 
 @router.post("/")
@@ -1,9 +1,12 @@
 # app/database.py
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, make_url, Index, JSON, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from dotenv import load_dotenv
+from CargoHubV2.app import config
 
 
 # environment variabelen inladen
@@ -13,15 +16,110 @@ load_dotenv()
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 relative_db_url = "sqlite:///./Cargo_Database.db"
 
-# database path voor CargoHubV2 root
-SQL_URL = relative_db_url.replace("sqlite:///./", f"sqlite:///{BASE_DIR}/")
+# database path voor CargoHubV2 root, tenzij DATABASE_URL een andere database kiest
+SQL_URL = config.DATABASE_URL or relative_db_url.replace("sqlite:///./", f"sqlite:///{BASE_DIR}/")
 
-# nieuw sqlite engine, hoort bij sqlalchemy
-engine = create_engine(SQL_URL, connect_args={"check_same_thread": False})
+# async driver per backend
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+# pragmas per profiel, worden op elke nieuwe connectie gezet
+SQLITE_PROFILES = {
+    # sqlite standaard: rollback journal en fsync bij elke commit
+    "legacy": {},
+    # WAL: lezers worden niet geblokkeerd door een schrijver, NORMAL doet alleen fsync bij checkpoints
+    "tuned": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64 * 1024,  # negatief is in KiB
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    # WAL, maar na elke commit een fsync
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -64 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+}
+
+
+def sqlite_pragmas(profile: str = None, overrides: dict = None) -> dict:
+    profile = profile or config.SQLITE_PROFILE
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(f"Unknown SQLITE_PROFILE {profile!r}, choose from {', '.join(SQLITE_PROFILES)}")
+    return {**SQLITE_PROFILES[profile], **(config.SQLITE_PRAGMAS if overrides is None else overrides)}
+
+
+def apply_sqlite_pragmas(engine, pragmas: dict):
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma, value in pragmas.items():
+            cursor.execute(f"PRAGMA {pragma}={value}")
+        cursor.close()
+    return engine
+
+
+def is_sqlite(url) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+def engine_options(url) -> dict:
+    if is_sqlite(url):
+        return {"connect_args": {"check_same_thread": False}}
+    return {
+        "pool_size": config.DB_POOL_SIZE,
+        "max_overflow": config.DB_MAX_OVERFLOW,
+        "pool_timeout": config.DB_POOL_TIMEOUT,
+        "pool_recycle": config.DB_POOL_RECYCLE,
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+    }
+
+
+def async_url(url):
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend}")
+    return url.set(drivername=ASYNC_DRIVERS[backend])
+
+
+def make_engine(url=SQL_URL):
+    engine = create_engine(url, **engine_options(url))
+    if is_sqlite(url):
+        apply_sqlite_pragmas(engine, sqlite_pragmas())
+    return engine
+
+
+def make_async_engine(url=SQL_URL):
+    engine = create_async_engine(async_url(url), **engine_options(url))
+    if is_sqlite(url):
+        apply_sqlite_pragmas(engine.sync_engine, sqlite_pragmas())
+    return engine
+
+
+# sync engine, hoort bij sqlalchemy
+engine = make_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# async engine op dezelfde database voor de async endpoints, scripts blijven de sync engine gebruiken
+async_engine = make_async_engine()
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
 
+# JSON kolommen, op postgres als JSONB (binair, te indexeren)
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
+# partial index over alleen niet verwijderde rijen, de services filteren bijna altijd op is_deleted
+def active_index(name: str, *columns):
+    return Index(name, *columns, sqlite_where=text("is_deleted = 0"), postgresql_where=text("NOT is_deleted"))
+
+
 # voor database sessions in fastAPI
 def get_db():
     db = SessionLocal()
@@ -29,3 +127,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
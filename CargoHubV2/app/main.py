@@ -1,4 +1,4 @@
-from fastapi import FastAPI, Request, HTTPException, Response
+from fastapi import FastAPI, Request
 from CargoHubV2.app.controllers import item_groups
 from CargoHubV2.app.controllers import item_lines
 from CargoHubV2.app.controllers import item_types
@@ -15,14 +15,18 @@ from CargoHubV2.app.controllers import orders_controller
 from CargoHubV2.app.controllers import reporting_controller
 from CargoHubV2.app.controllers import packinglist_controller
 from CargoHubV2.app.controllers import docks_controller
+from CargoHubV2.app.services import auth_service, job_service
 
 import os
 from dotenv import load_dotenv
 from starlette.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 import logging
 
 
-app = FastAPI()
+# orjson voor alle JSON responses, veel sneller dan json.dumps bij grote lijsten
+app = FastAPI(default_response_class=ORJSONResponse)
 # welke port hij runt kan je bij command aanpassen
 # default port is localhost:8000
 
@@ -52,6 +56,15 @@ load_dotenv()
 warehouse_manager = os.getenv("WAREHOUSE_MANAGER")
 floor_manager = os.getenv("FLOOR_MANAGER")
 employee = os.getenv("EMPLOYEE")
+
+# route -> rollen tabel, een keer gebouwd bij het opstarten
+# overige keys komen uit de api_keys tabel (via een cache in auth_service)
+route_table = auth_service.build_route_table()
+auth_service.set_static_roles({
+    "warehouse_manager": warehouse_manager,
+    "floor_manager": floor_manager,
+    "employee": employee,
+})
 '''
 print(warehouse_manager)
 print(floor_manager)
@@ -72,66 +85,23 @@ async def stat():
 @app.on_event("shutdown")
 async def shutdown():
     # Close any resources (e.g., database connections, files, sockets) here
+    job_service.shutdown()
     print("Shutting down gracefully...")
 
 
 @app.middleware("http")
 async def api_key_middleware(request: Request, call_next):
-    # anders kan de documentatie niet bereikt worden
-    excluded = ["/favicon.ico", "/openapi.json", "/docs"]
-
-    w_man_only = ["v2/reports", "v2/warehouses", "v2/clients", "v2/suppliers"]
-    all_managers = ["v2/item_groups", "v2/item_lines", "v2/item_types", "v2/items",
-                    "v2/shipments", "v2/docks"]
-    all = ["v2/locations", "v2/transfers", "v2/orders", "v2/inventories",
-           "v2/packinglist"]
-
-    try:
-        x_api_key = request.headers.get("api-key")
-        if request.url.path in excluded:
-            return await call_next(request)
-        response: Response = await call_next(request)
-
-        if not x_api_key:
-            logger.warning("Missing API key")
-            response.status_code = 422
-            raise HTTPException(status_code=422, detail="Missing API key")
-
-        if any(path in request.url.path for path in w_man_only):
-
-            if x_api_key != warehouse_manager:
-                logger.warning("Invalid API key")
-                response.status_code = 403
-                raise HTTPException(
-                    status_code=403,
-                    detail="Invalid API key, need to be Warehouse manager")
-
-        if any(path in request.url.path for path in all_managers):
-
-            if x_api_key != warehouse_manager and x_api_key != floor_manager:
-                logger.warning("Invalid API key")
-                response.status_code = 403
-                raise HTTPException(
-                    status_code=403,
-                    detail="Invalid API key, only Floor/Warehouse managers")
-
-        if any(path in request.url.path for path in all):
-
-            if x_api_key != warehouse_manager and x_api_key != floor_manager and x_api_key != employee:
-                logger.warning("Invalid API key")
-                response.status_code = 403
-                raise HTTPException(
-                    status_code=403,
-                    detail="Invalid API key, need to be employee of CargoHub")
-
-        return response
-
-    except HTTPException as http_exc:
-
-        logger.error(f"HTTPException raised: {http_exc.detail}")
-        return JSONResponse(
-            status_code=http_exc.status_code, content={"detail": http_exc.detail}
-        )
-    except Exception as exc:
-        logger.exception("Unexpected error occurred in middleware")
-        raise exc
+    # autorisatie gebeurt voor de handler, geweigerde requests komen er dus nooit in
+    api_key = request.headers.get("api-key")
+    role = None
+    if api_key:
+        hit, role = auth_service.cached_role(api_key)
+        if not hit:
+            # database lookup niet op de event loop, daarna staat de key in de cache
+            role = await run_in_threadpool(auth_service.resolve_role, api_key)
+    error = auth_service.authorize(route_table, request.url.path, api_key, lambda key: role)
+    if error:
+        status_code, detail = error
+        logger.warning(f"Rejected request to {request.url.path}: {detail}")
+        return JSONResponse(status_code=status_code, content={"detail": detail})
+    return await call_next(request)
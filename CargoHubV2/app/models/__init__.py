@@ -11,5 +11,8 @@ from .api_keys_model import APIKey
 from .inventories_model import Inventory
 from .clients_model import Client
 from .shipments_model import Shipment
+from .shipment_item_index_model import ShipmentItemIndex
 from .orders_model import Order
+from .order_lines_model import OrderLine
 from .docks_model import Dock
+from .daily_order_rollup_model import DailyOrderRollup
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, Float, Date
+from ..database import Base
+
+
+class DailyOrderRollup(Base):
+    # totalen van de (niet verwijderde) orders per warehouse per dag, voor de reports
+    __tablename__ = "daily_order_rollup"
+
+    # warehouse_id eerst, zo is de primary key ook de index voor reports per warehouse
+    warehouse_id = Column(Integer, primary_key=True)
+    day = Column(Date, primary_key=True, index=True)
+    orders_done = Column(Integer, nullable=False, default=0)
+    items_sold = Column(Integer, nullable=False, default=0)
+    total_revenue = Column(Float, nullable=False, default=0)
+    total_discount = Column(Float, nullable=False, default=0)
+    total_tax = Column(Float, nullable=False, default=0)
+    total_surcharge = Column(Float, nullable=False, default=0)
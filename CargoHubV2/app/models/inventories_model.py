@@ -1,7 +1,7 @@
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, JSON, Boolean
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Boolean
 from sqlalchemy.orm import relationship
 from datetime import datetime
-from ..database import Base
+from ..database import Base, JSONType
 
 
 class Inventory(Base):
@@ -10,7 +10,7 @@ class Inventory(Base):
     item_id = Column(String, ForeignKey('items.uid'), unique=True, nullable=False)
     description = Column(String, nullable=True)
     item_reference = Column(String, unique=True)
-    locations = Column(JSON)
+    locations = Column(JSONType)
     total_on_hand = Column(Integer)
     total_expected = Column(Integer)
     total_ordered = Column(Integer)
@@ -1,11 +1,14 @@
 from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Boolean
 from sqlalchemy.orm import relationship
 from datetime import datetime
-from ..database import Base
+from ..database import Base, active_index
 
 
 class Item(Base):
     __tablename__ = "items"
+    __table_args__ = (
+        active_index("ix_items_active_supplier_id", "supplier_id"),
+    )
 
     uid = Column(String, primary_key=True, index=True)
     code = Column(String, unique=True, index=True)
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, JSON, Float
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float
 from typing import Dict
-from ..database import Base
+from ..database import Base, JSONType
 from sqlalchemy.orm import relationship
 
 
@@ -15,5 +15,5 @@ class Location(Base):
     created_at = Column(DateTime, index=True)
     updated_at = Column(DateTime, index=True)
     is_deleted = Column(Boolean, default=False, nullable=False, server_default='0')
-    stock: Dict[str, int] = Column(JSON)
+    stock: Dict[str, int] = Column(JSONType)
     max_weight = Column(Float)
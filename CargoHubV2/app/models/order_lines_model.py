@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
+from ..database import Base
+
+
+class OrderLine(Base):
+    __tablename__ = "order_lines"
+    __table_args__ = (
+        # "welke orders bevatten item X", de order_id zit in de index zodat de orders tabel niet nodig is
+        Index("ix_order_lines_item_uid_order_id", "item_uid", "order_id"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    order_id = Column(Integer, ForeignKey("orders.id"), nullable=False, index=True)
+    # geen foreign key naar items, orders uit de json data verwijzen soms naar onbekende items
+    item_uid = Column(String, nullable=False)
+    amount = Column(Integer, nullable=False)
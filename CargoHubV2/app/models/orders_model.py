@@ -1,11 +1,17 @@
-from sqlalchemy import Column, String, Integer, Float, DateTime, JSON, ForeignKey, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Boolean
+from sqlalchemy.orm import relationship, query_expression
 from datetime import datetime
-from ..database import Base
+from ..database import Base, JSONType, active_index
+from .order_lines_model import OrderLine
 
 
 class Order(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        active_index("ix_orders_active_warehouse_id_order_date", "warehouse_id", "order_date"),
+        active_index("ix_orders_active_order_date", "order_date"),
+        active_index("ix_orders_active_reference", "reference"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     source_id = Column(Integer, nullable=False)
     order_date = Column(DateTime, nullable=False)
@@ -19,7 +25,7 @@ class Order(Base):
     warehouse_id = Column(Integer, ForeignKey("warehouses.id"), nullable=False)
     ship_to = Column(Integer, nullable=True)
     bill_to = Column(Integer, nullable=True)
-    shipment_id = Column(JSON, nullable=True)
+    shipment_id = Column(JSONType, nullable=True)
     total_amount = Column(Float, nullable=False)
     total_discount = Column(Float, nullable=True)
     total_tax = Column(Float, nullable=True)
@@ -27,7 +33,20 @@ class Order(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow,
                         onupdate=datetime.utcnow)
-    items = Column(JSON, nullable=True)
     is_deleted = Column(Boolean, default=False, nullable=False, server_default='0')
 
     warehouse = relationship("Warehouse")
+    # selectin: een extra query per lijst orders, geen lazy load per order (en werkt ook async)
+    lines = relationship("OrderLine", order_by=OrderLine.id, cascade="all, delete-orphan", lazy="selectin")
+
+    # shipment_id als tekst, alleen gevuld door response_service.json_as_text in list queries
+    shipment_id_json = query_expression()
+
+    # zelfde vorm als de oude items JSON kolom: [{"item_id": ..., "amount": ...}]
+    @property
+    def items(self):
+        return [{"item_id": line.item_uid, "amount": line.amount} for line in self.lines]
+
+    @items.setter
+    def items(self, items):
+        self.lines = [OrderLine(item_uid=item["item_id"], amount=item["amount"]) for item in items or []]
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, Integer, String, ForeignKey
+from ..database import Base
+
+
+class ShipmentItemIndex(Base):
+    # reverse index item -> shipments, de items zelf blijven in Shipment.items staan
+    __tablename__ = "shipment_item_index"
+
+    # item_uid eerst, zo is de primary key ook de index voor "welke shipments bevatten item X"
+    item_uid = Column(String, primary_key=True)
+    shipment_id = Column(Integer, ForeignKey("shipments.id"), primary_key=True, index=True)
@@ -1,5 +1,7 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, JSON, Boolean
-from ..database import Base
+from sqlalchemy import Column, Integer, String, DateTime, Float, Boolean
+from sqlalchemy.orm import relationship, query_expression
+from ..database import Base, JSONType
+from .shipment_item_index_model import ShipmentItemIndex
 from datetime import datetime
 
 
@@ -7,7 +9,7 @@ class Shipment(Base):
     __tablename__ = "shipments"
 
     id = Column(Integer, primary_key=True, index=True)
-    order_id = Column(JSON)
+    order_id = Column(JSONType)
     source_id = Column(Integer, index=True)
     order_date = Column(DateTime, index=True)
     request_date = Column(DateTime, index=True)
@@ -22,8 +24,14 @@ class Shipment(Base):
     transfer_mode = Column(String, index=True)
     total_package_count = Column(Integer)
     total_package_weight = Column(Float)
-    items = Column(JSON)
+    items = Column(JSONType)
     created_at = Column(DateTime, default=datetime.now)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
     is_deleted = Column(Boolean, default=False, nullable=False, server_default='0')
 
+    # bijgehouden door shipments_service.index_shipment_items
+    item_index = relationship("ShipmentItemIndex", cascade="all, delete-orphan")
+
+    # JSON kolommen als tekst, alleen gevuld door response_service.json_as_text in list queries
+    order_id_json = query_expression()
+    items_json = query_expression()
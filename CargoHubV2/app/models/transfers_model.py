@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, JSON, DateTime, Boolean
-from ..database import Base
+from sqlalchemy import Column, Integer, String, DateTime, Boolean
+from ..database import Base, JSONType
 from datetime import datetime
 
 
@@ -14,4 +14,4 @@ class Transfer(Base):
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
     is_deleted = Column(Boolean, default=False, nullable=False, server_default='0')
-    items = Column(JSON, index=True)
+    items = Column(JSONType, index=True)
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, JSON, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Boolean
 from sqlalchemy.orm import relationship
-from ..database import Base
+from ..database import Base, JSONType
 from datetime import datetime
 
 
@@ -15,8 +15,8 @@ class Warehouse(Base):
     city = Column(String, index=True)
     province = Column(String, index=True)
     country = Column(String, index=True)
-    contact = Column(JSON, index=True)
-    forbidden_classifications = Column(JSON, nullable=True)
+    contact = Column(JSONType, index=True)
+    forbidden_classifications = Column(JSONType, nullable=True)
     created_at = Column(DateTime, default=datetime.now)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
     is_deleted = Column(Boolean, default=False, nullable=False, server_default='0')
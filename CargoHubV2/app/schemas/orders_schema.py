@@ -1,4 +1,4 @@
-from pydantic import BaseModel, StringConstraints
+from pydantic import BaseModel, StringConstraints, model_validator
 from typing_extensions import Annotated
 from typing import List, Optional, Dict
 from datetime import datetime
@@ -65,6 +65,30 @@ class OrderResponse(OrderBase):
     id: int
     created_at: datetime
     updated_at: datetime
+    # de order routes gaven altijd alle kolommen terug, ook is_deleted
+    is_deleted: bool = False
 
     class Config:
         orm_mode = True
+
+
+class OrderBatchResult(BaseModel):
+    index: int
+    reference: str
+    status_code: int
+    detail: str
+    id: Optional[int] = None
+
+
+class PackingWave(BaseModel):
+    # order_ids, of alle orders van een warehouse (met order_status)
+    order_ids: Optional[List[int]] = None
+    warehouse_id: Optional[int] = None
+    order_status: Optional[StatusType] = None
+
+    @model_validator(mode="after")
+    def one_selector(self):
+        # precies een van de twee, anders werd warehouse_id stilletjes genegeerd
+        if bool(self.order_ids) == (self.warehouse_id is not None):
+            raise ValueError("Give either order_ids or a warehouse_id for the wave")
+        return self
@@ -105,3 +105,8 @@ class ShipmentResponse(ShipmentBase):
 
     class Config:
         orm_mode = True
+
+
+class ShipmentListResponse(ShipmentResponse):
+    # GET /shipments gaf altijd alle kolommen terug, ook is_deleted (POST en PUT niet)
+    is_deleted: bool = False
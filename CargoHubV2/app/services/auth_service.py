@@ -0,0 +1,200 @@
+import time
+import logging
+from threading import Lock
+from collections import OrderedDict
+from typing import Callable, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+from fastapi import HTTPException, status
+from CargoHubV2.app import config
+from CargoHubV2.app.database import SessionLocal
+from CargoHubV2.app.models.api_keys_model import APIKey
+
+# paden zonder api key, anders kan de documentatie niet bereikt worden
+EXCLUDED_PATHS = frozenset(["/favicon.ico", "/openapi.json", "/docs"])
+
+# per route prefix welke rollen erbij mogen, en de melding als dat niet zo is
+ROUTE_RULES = [
+    (["warehouse_manager"], "Invalid API key, need to be Warehouse manager",
+     ["/api/v2/reports", "/api/v2/warehouses", "/api/v2/clients", "/api/v2/suppliers", "/api/v2/load"]),
+    (["warehouse_manager", "floor_manager"], "Invalid API key, only Floor/Warehouse managers",
+     ["/api/v2/item_groups", "/api/v2/item_lines", "/api/v2/item_types", "/api/v2/items",
+      "/api/v2/shipments", "/api/v2/docks"]),
+    (["warehouse_manager", "floor_manager", "employee"], "Invalid API key, need to be employee of CargoHub",
+     ["/api/v2/locations", "/api/v2/transfers", "/api/v2/orders", "/api/v2/inventories",
+      "/api/v2/packinglist"]),
+]
+
+logger = logging.getLogger("uvicorn.error")
+
+# sleutel in een trie node waar de regel voor die prefix staat
+RULE = "__rule__"
+
+
+class TTLCache:
+    # LRU cache met verloop tijd, ook None (onbekende key) wordt bewaard
+    def __init__(self, maxsize: int, ttl: float, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.entries = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, key) -> tuple:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return False, None
+            expires, value = entry
+            if expires <= self.clock():
+                del self.entries[key]
+                return False, None
+            self.entries.move_to_end(key)
+            return True, value
+
+    def set(self, key, value):
+        with self.lock:
+            self.entries[key] = (self.clock() + self.ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+key_cache = TTLCache(config.API_KEY_CACHE_SIZE, config.API_KEY_CACHE_TTL)
+# keys uit de env variabelen, die hebben geen database record nodig
+static_roles = {}
+metrics = {"hits": 0, "misses": 0, "lookup_seconds": 0.0}
+metrics_hook: Optional[Callable[[str, float], None]] = None
+
+
+def set_static_roles(role_keys: dict):
+    static_roles.clear()
+    static_roles.update({key: role for role, key in role_keys.items() if key})
+
+
+def set_metrics_hook(hook: Optional[Callable[[str, float], None]]):
+    # hook(naam, waarde), bijv. voor prometheus/statsd
+    global metrics_hook
+    metrics_hook = hook
+
+
+def cache_stats() -> dict:
+    lookups = metrics["hits"] + metrics["misses"]
+    return {
+        "hits": metrics["hits"],
+        "misses": metrics["misses"],
+        "hit_ratio": metrics["hits"] / lookups if lookups else 0.0,
+        "avg_lookup_seconds": metrics["lookup_seconds"] / lookups if lookups else 0.0,
+    }
+
+
+def record_lookup(hit: bool, seconds: float):
+    metrics["hits" if hit else "misses"] += 1
+    metrics["lookup_seconds"] += seconds
+    if metrics_hook is not None:
+        metrics_hook("api_key.lookup_seconds", seconds)
+        metrics_hook("api_key.cache_hit_ratio", cache_stats()["hit_ratio"])
+
+
+def cached_role(api_key: str) -> tuple:
+    # (gevonden, rol) zonder database, een gevonden None is een bekende foute key
+    start = time.perf_counter()
+    if api_key in static_roles:
+        hit, role = True, static_roles[api_key]
+    else:
+        hit, role = key_cache.get(api_key)
+    if hit:
+        record_lookup(True, time.perf_counter() - start)
+    return hit, role
+
+
+def fetch_role(db: Session, api_key: str) -> Optional[str]:
+    row = db.query(APIKey.role).filter(APIKey.key == api_key, APIKey.is_active == True).first()
+    return row.role if row else None
+
+
+def resolve_role(api_key: str, session_factory: Optional[Callable[[], Session]] = None) -> Optional[str]:
+    hit, role = cached_role(api_key)
+    if hit:
+        return role
+
+    start = time.perf_counter()
+    db = (session_factory or SessionLocal)()
+    try:
+        role = fetch_role(db, api_key)
+    except SQLAlchemyError:
+        # niet cachen, de volgende lookup probeert het opnieuw
+        logger.exception("API key lookup failed")
+        return None
+    finally:
+        db.close()
+    # ook onbekende keys cachen, anders kost elk fout request een query
+    key_cache.set(api_key, role)
+    record_lookup(False, time.perf_counter() - start)
+    return role
+
+
+def deactivate_api_key(db: Session, api_key: str):
+    try:
+        record = db.query(APIKey).filter(APIKey.key == api_key, APIKey.is_active == True).first()
+        if not record:
+            raise HTTPException(status_code=404, detail="API key not found")
+        record.is_active = False
+        db.commit()
+    except SQLAlchemyError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while deactivating the API key."
+        )
+    # direct uit de cache, niet wachten op de TTL
+    key_cache.invalidate(api_key)
+    return {"detail": "API key deactivated"}
+
+
+def split_path(path: str) -> list:
+    return [segment for segment in path.split("/") if segment]
+
+
+def build_route_table(rules: list = ROUTE_RULES) -> dict:
+    # trie op path segmenten, een keer bij het opstarten gebouwd
+    trie = {}
+    for roles, detail, prefixes in rules:
+        for prefix in prefixes:
+            node = trie
+            for segment in split_path(prefix):
+                node = node.setdefault(segment, {})
+            node[RULE] = (frozenset(roles), detail)
+    return trie
+
+
+def lookup_route(trie: dict, path: str) -> Optional[tuple]:
+    # de diepste prefix met een regel wint
+    node, rule = trie, None
+    for segment in split_path(path):
+        node = node.get(segment)
+        if node is None:
+            break
+        rule = node.get(RULE, rule)
+    return rule
+
+
+def authorize(trie: dict, path: str, api_key: Optional[str],
+              role_for: Callable[[str], Optional[str]] = resolve_role) -> Optional[tuple]:
+    # geeft (status code, detail) terug als het request geweigerd moet worden
+    if path in EXCLUDED_PATHS:
+        return None
+    if not api_key:
+        return 422, "Missing API key"
+    rule = lookup_route(trie, path)
+    if rule is not None and role_for(api_key) not in rule[0]:
+        return 403, rule[1]
+    return None
@@ -0,0 +1,167 @@
+import io
+import math
+import base64
+from xml.sax.saxutils import escape
+from CargoHubV2.app import config
+
+BAR_CATEGORIES = ["Total Revenue", "Total Discount", "Total Tax", "Total Surcharge"]
+PIE_LABELS = ["Items Sold", "Remaining"]
+BAR_COLOR = "#51d3f5"
+PIE_COLORS = [BAR_COLOR, "gray"]
+
+# zelfde formaat als de matplotlib figures (6x4 inch op 100 dpi)
+WIDTH, HEIGHT = 600, 400
+
+
+def chart_values(data: dict):
+    bar_values = [
+        float(data["total_revenue"]),
+        float(data["total_discount"]),
+        float(data["total_tax"]),
+        float(data["total_surcharge"]),
+    ]
+    items_sold = int(data["amount_of_items_sold"])
+    pie_sizes = [items_sold, max(0, 100 - items_sold)]
+    return bar_values, pie_sizes
+
+
+def data_uri(mime: str, content: bytes) -> str:
+    return f"data:{mime};base64,{base64.b64encode(content).decode('utf-8')}"
+
+
+def svg_document(body: list) -> bytes:
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{WIDTH}" height="{HEIGHT}" '
+        f'viewBox="0 0 {WIDTH} {HEIGHT}" font-family="Arial, sans-serif">'
+        + "".join(body) + "</svg>"
+    ).encode("utf-8")
+
+
+def svg_text(x: float, y: float, text: str, size: int = 12, anchor: str = "middle", extra: str = "") -> str:
+    return (f'<text x="{x:.1f}" y="{y:.1f}" font-size="{size}" text-anchor="{anchor}"{extra}>'
+            f'{escape(text)}</text>')
+
+
+def nice_step(maximum: float) -> float:
+    # stapgrootte voor ~5 ticks op de y-as: 1, 2 of 5 keer een macht van 10
+    raw = maximum / 5
+    magnitude = 10 ** math.floor(math.log10(raw))
+    return next(step * magnitude for step in (1, 2, 5, 10) if step * magnitude >= raw)
+
+
+def svg_bar_chart(values: list) -> bytes:
+    left, right, top, bottom = 80, 20, 40, 60
+    plot_width, plot_height = WIDTH - left - right, HEIGHT - top - bottom
+    step = nice_step(max(values)) if max(values) > 0 else 1
+    axis_max = step * max(1, math.ceil(max(values) / step))
+
+    body = [svg_text(WIDTH / 2, 24, "Financial Summary", 16)]
+    # y-as met ticks
+    ticks = int(round(axis_max / step))
+    for n in range(ticks + 1):
+        y = top + plot_height - plot_height * n / ticks
+        body.append(f'<line x1="{left - 4}" y1="{y:.1f}" x2="{left}" y2="{y:.1f}" stroke="black"/>')
+        body.append(svg_text(left - 8, y + 4, f"{step * n:g}", 10, "end"))
+    body.append(f'<line x1="{left}" y1="{top}" x2="{left}" y2="{top + plot_height}" stroke="black"/>')
+    body.append(f'<line x1="{left}" y1="{top + plot_height}" x2="{left + plot_width}" '
+                f'y2="{top + plot_height}" stroke="black"/>')
+
+    slot = plot_width / len(values)
+    for index, (category, value) in enumerate(zip(BAR_CATEGORIES, values)):
+        height = plot_height * max(value, 0) / axis_max
+        x = left + slot * index + slot * 0.1
+        body.append(f'<rect x="{x:.1f}" y="{top + plot_height - height:.1f}" width="{slot * 0.8:.1f}" '
+                    f'height="{height:.1f}" fill="{BAR_COLOR}"/>')
+        body.append(svg_text(x + slot * 0.4, top + plot_height + 16, category, 10))
+
+    body.append(svg_text(left + plot_width / 2, HEIGHT - 12, "Categories"))
+    body.append(svg_text(18, top + plot_height / 2, "Amount", 12, "middle",
+                         f' transform="rotate(-90 18 {top + plot_height / 2:.1f})"'))
+    return svg_document(body)
+
+
+def svg_pie_chart(sizes: list) -> bytes:
+    cx, cy, radius = WIDTH / 2, HEIGHT / 2 + 15, 140
+    body = [svg_text(WIDTH / 2, 24, "Item Sales Distribution", 16)]
+    total = sum(sizes)
+    if total <= 0:
+        body.append(f'<circle cx="{cx}" cy="{cy}" r="{radius}" fill="{PIE_COLORS[1]}"/>')
+        return svg_document(body)
+
+    # tegen de klok in vanaf 140 graden, zoals startangle=140 bij matplotlib
+    angle = 140.0
+    for label, size, color in zip(PIE_LABELS, sizes, PIE_COLORS):
+        if size <= 0:
+            continue
+        sweep = 360.0 * size / total
+        middle = math.radians(angle + sweep / 2)
+        if sweep >= 360:
+            body.append(f'<circle cx="{cx}" cy="{cy}" r="{radius}" fill="{color}"/>')
+        else:
+            start, end = math.radians(angle), math.radians(angle + sweep)
+            # svg y-as wijst naar beneden, dus y = cy - sin
+            x1, y1 = cx + radius * math.cos(start), cy - radius * math.sin(start)
+            x2, y2 = cx + radius * math.cos(end), cy - radius * math.sin(end)
+            large_arc = 1 if sweep > 180 else 0
+            body.append(f'<path d="M {cx} {cy} L {x1:.1f} {y1:.1f} A {radius} {radius} 0 {large_arc} 0 '
+                        f'{x2:.1f} {y2:.1f} Z" fill="{color}"/>')
+        body.append(svg_text(cx + radius * 0.6 * math.cos(middle), cy - radius * 0.6 * math.sin(middle) + 4,
+                             f"{100 * size / total:.1f}%"))
+        body.append(svg_text(cx + radius * 1.15 * math.cos(middle), cy - radius * 1.15 * math.sin(middle) + 4,
+                             label, 12, "start" if math.cos(middle) >= 0 else "end"))
+        angle += sweep
+    return svg_document(body)
+
+
+def svg_charts(data: dict) -> dict:
+    bar_values, pie_sizes = chart_values(data)
+    return {
+        "bar_chart": data_uri("image/svg+xml", svg_bar_chart(bar_values)),
+        "pie_chart": data_uri("image/svg+xml", svg_pie_chart(pie_sizes)),
+    }
+
+
+def png(figure) -> bytes:
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format="png")
+    return buffer.getvalue()
+
+
+def matplotlib_charts(data: dict) -> dict:
+    # pas hier importeren, matplotlib kost ruim een halve seconde bij het opstarten
+    # Figure + Agg canvas zonder pyplot: geen globale state, dus veilig in threads
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    bar_values, pie_sizes = chart_values(data)
+
+    # Genereer bar chart
+    bar_figure = Figure(figsize=(6, 4))
+    FigureCanvasAgg(bar_figure)
+    axes = bar_figure.add_subplot()
+    axes.bar(BAR_CATEGORIES, bar_values, color=BAR_COLOR)
+    axes.set_title("Financial Summary")
+    axes.set_xlabel("Categories")
+    axes.set_ylabel("Amount")
+
+    # Genereer pie chart
+    pie_figure = Figure(figsize=(6, 4))
+    FigureCanvasAgg(pie_figure)
+    axes = pie_figure.add_subplot()
+    axes.pie(pie_sizes, labels=PIE_LABELS, autopct="%1.1f%%", startangle=140, colors=PIE_COLORS)
+    axes.set_title("Item Sales Distribution")
+
+    return {
+        "bar_chart": data_uri("image/png", png(bar_figure)),
+        "pie_chart": data_uri("image/png", png(pie_figure)),
+    }
+
+
+CHART_BACKENDS = {"svg": svg_charts, "matplotlib": matplotlib_charts}
+
+
+def create_charts(data: dict, backend: str = None) -> dict:
+    backend = backend or config.CHART_BACKEND
+    if backend not in CHART_BACKENDS:
+        raise ValueError(f"Unknown CHART_BACKEND {backend!r}, choose from {', '.join(CHART_BACKENDS)}")
+    return CHART_BACKENDS[backend](data)
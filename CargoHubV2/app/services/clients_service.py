@@ -3,6 +3,9 @@ from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from CargoHubV2.app.models.clients_model import Client
 from CargoHubV2.app.schemas.clients_schema import ClientResponse, ClientUpdate
 from CargoHubV2.app.services.sorting_service import apply_sorting
+from CargoHubV2.app.services.filtering_service import apply_filters
+from CargoHubV2.app.services.projection_service import load_fields
+from CargoHubV2.app.services.pagination_service import apply_keyset
 from fastapi import HTTPException, status
 from datetime import datetime
 from typing import Optional
@@ -70,10 +73,18 @@ def get_all_clients(
     offset: int = 0,
     limit: int = 100,
     sort_by: Optional[str] = "id",
-    order: Optional[str] = "asc"
+    order: Optional[str] = "asc",
+    cursor: Optional[str] = None,
+    fields: Optional[tuple] = None,
+    filters: Optional[list] = None
 ):
     try:
         query = db.query(Client).filter(Client.is_deleted == False)
+        query = apply_filters(query, Client, filters)
+        if fields:
+            query = query.options(*load_fields(Client, fields, sort_by))
+        if cursor is not None:
+            return apply_keyset(query, Client, sort_by, order, cursor).limit(limit).all()
         if sort_by:
             query = apply_sorting(query, Client, sort_by, order)
         return query.offset(offset).limit(limit).all()
@@ -2,9 +2,13 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from fastapi import HTTPException, status
 from datetime import datetime
+from typing import Optional
 from ..models.docks_model import Dock
 from ..schemas.docks_schema import DockCreate, DockUpdate
 from CargoHubV2.app.services.sorting_service import apply_sorting  # Import sorting helper function
+from CargoHubV2.app.services.filtering_service import apply_filters
+from CargoHubV2.app.services.projection_service import load_fields
+from CargoHubV2.app.services.pagination_service import apply_keyset
 
 
 def create_dock(db: Session, dock_data: DockCreate):    
@@ -43,10 +47,18 @@ def get_all_docks(
     offset: int = 0, 
     limit: int = 100, 
     sort_by: str = "id", 
-    order: str = "asc"
+    order: str = "asc",
+    cursor: Optional[str] = None,
+    fields: Optional[tuple] = None,
+    filters: Optional[list] = None
 ):
     try:
         query = db.query(Dock).filter(Dock.is_deleted == False)  # Filter out deleted docks
+        query = apply_filters(query, Dock, filters)
+        if fields:
+            query = query.options(*load_fields(Dock, fields, sort_by))
+        if cursor is not None:
+            return apply_keyset(query, Dock, sort_by, order, cursor).limit(limit).all()
         query = apply_sorting(query, Dock, sort_by, order)
         return query.offset(offset).limit(limit).all()
     except ValueError as e:
@@ -0,0 +1,74 @@
+from datetime import date, datetime
+from typing import Optional
+from sqlalchemy import JSON, inspect
+from fastapi import HTTPException, Request
+
+# veld__op=waarde, bijv. warehouse_id__eq=3, order_status__in=Pending,Packed, order_date__gte=2024-09-01
+FILTER_OPERATORS = ("eq", "in", "gte", "lte", "contains")
+# maximaal aantal waarden in een __in filter
+MAX_IN_VALUES = 1000
+TRUE_VALUES = ("true", "1", "yes")
+FALSE_VALUES = ("false", "0", "no")
+
+
+def filter_params(request: Request) -> list:
+    # dependency voor list routes: alle query parameters met __ erin, de rest (offset, limit, ...) hoort bij de route
+    return [(key, value) for key, value in request.query_params.multi_items() if "__" in key]
+
+
+def filter_column(model, key: str):
+    field, _, operator = key.rpartition("__")
+    if operator not in FILTER_OPERATORS:
+        raise HTTPException(status_code=400, detail=f"Invalid filter operator: {operator}")
+    # net als apply_sorting gevalideerd, maar alleen echte kolommen (geen relaties of properties)
+    mapper = inspect(model)
+    if field not in mapper.columns:
+        raise HTTPException(status_code=400, detail=f"Invalid filter attribute: {field}")
+    column = getattr(model, field)
+    if isinstance(mapper.columns[field].type, JSON):
+        raise HTTPException(status_code=400, detail=f"Cannot filter on JSON attribute: {field}")
+    return column, operator
+
+
+def convert_value(column, value: str):
+    # query parameters zijn strings, omzetten naar het type van de kolom
+    python_type = column.type.python_type
+    try:
+        if python_type is bool:
+            if value.lower() not in TRUE_VALUES + FALSE_VALUES:
+                raise ValueError(value)
+            return value.lower() in TRUE_VALUES
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        if python_type is date:
+            return date.fromisoformat(value)
+        return python_type(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid value for {column.key}: {value}")
+
+
+def filter_predicate(model, key: str, value: str):
+    column, operator = filter_column(model, key)
+    if operator == "in":
+        values = [item for item in value.split(",") if item]
+        if not values or len(values) > MAX_IN_VALUES:
+            raise HTTPException(status_code=400, detail=f"Filter {key} needs 1 to {MAX_IN_VALUES} values")
+        return column.in_([convert_value(column, item) for item in values])
+    if operator == "contains":
+        # LIKE '%waarde%', kan geen index gebruiken, combineer het liefst met een ander filter
+        if column.type.python_type is not str:
+            raise HTTPException(status_code=400, detail=f"Filter {key} only works on text attributes")
+        return column.contains(value, autoescape=True)
+    converted = convert_value(column, value)
+    if operator == "gte":
+        return column >= converted
+    if operator == "lte":
+        return column <= converted
+    return column == converted
+
+
+def apply_filters(query, model, filters: Optional[list] = None):
+    # filters: [(veld__op, waarde), ...], alles met AND, direct op de kolommen zodat de indexen bruikbaar zijn
+    if not filters:
+        return query
+    return query.filter(*(filter_predicate(model, key, value) for key, value in filters))
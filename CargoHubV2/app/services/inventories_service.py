@@ -1,7 +1,12 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from CargoHubV2.app.models.inventories_model import Inventory
 from CargoHubV2.app.services.sorting_service import apply_sorting
+from CargoHubV2.app.services.filtering_service import apply_filters
+from CargoHubV2.app.services.projection_service import load_fields
+from CargoHubV2.app.services.pagination_service import apply_keyset
 from CargoHubV2.app.schemas.inventories_schema import InventoryUpdate, InventoryResponse
 from fastapi import HTTPException, status
 from datetime import datetime
@@ -47,10 +52,15 @@ def get_all_inventories(
     offset: int = 0,
     limit: int = 100,
     sort_by: Optional[str] = "id",
-    order: Optional[str] = "asc"
+    order: Optional[str] = "asc",
+    cursor: Optional[str] = None,
+    filters: Optional[list] = None
 ):
     try:
         query = db.query(Inventory).filter(Inventory.is_deleted == False)
+        query = apply_filters(query, Inventory, filters)
+        if cursor is not None:
+            return apply_keyset(query, Inventory, sort_by, order, cursor).limit(limit).all()
         if sort_by:
             query = apply_sorting(query, Inventory, sort_by, order)
         return query.offset(offset).limit(limit).all()
@@ -63,6 +73,53 @@ def get_all_inventories(
         )
 
 
+async def get_inventory_async(db: AsyncSession, item_reference: str):
+    try:
+        inventory = (await db.execute(select(Inventory).filter(
+            Inventory.item_id == item_reference, Inventory.is_deleted == False
+        ))).scalars().first()
+        if not inventory:
+            raise HTTPException(status_code=404, detail="inventory not found")
+        return inventory
+    except SQLAlchemyError:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while retrieving the inventory."
+        )
+
+
+async def get_all_inventories_async(
+    db: AsyncSession,
+    offset: int = 0,
+    limit: int = 100,
+    sort_by: Optional[str] = "id",
+    order: Optional[str] = "asc",
+    cursor: Optional[str] = None,
+    fields: Optional[tuple] = None,
+    filters: Optional[list] = None
+):
+    try:
+        query = select(Inventory).filter(Inventory.is_deleted == False)
+        query = apply_filters(query, Inventory, filters)
+        if fields:
+            # alleen de gevraagde kolommen (locations is JSON)
+            query = query.options(*load_fields(Inventory, fields, sort_by))
+        if cursor is not None:
+            query = apply_keyset(query, Inventory, sort_by, order, cursor)
+        else:
+            if sort_by:
+                query = apply_sorting(query, Inventory, sort_by, order)
+            query = query.offset(offset)
+        return (await db.execute(query.limit(limit))).scalars().all()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except SQLAlchemyError:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while retrieving inventories."
+        )
+
+
 def update_inventory(db: Session, item_reference: str, inven_data: dict):
     try:
         inventory = db.query(Inventory).filter(Inventory.item_id == item_reference).first()
@@ -2,6 +2,9 @@ from sqlalchemy.orm import Session
 from CargoHubV2.app.models.item_groups_model import ItemGroup
 from CargoHubV2.app.schemas.item_groups_schema import ItemGroupUpdate
 from CargoHubV2.app.services.sorting_service import apply_sorting
+from CargoHubV2.app.services.filtering_service import apply_filters
+from CargoHubV2.app.services.projection_service import load_fields
+from CargoHubV2.app.services.pagination_service import apply_keyset
 
 from typing import List, Optional
 from sqlalchemy.exc import SQLAlchemyError
@@ -25,10 +28,18 @@ def get_all_item_groups(
     offset: int = 0,
     limit: int = 100,
     sort_by: Optional[str] = "id",
-    order: Optional[str] = "asc"
+    order: Optional[str] = "asc",
+    cursor: Optional[str] = None,
+    fields: Optional[tuple] = None,
+    filters: Optional[list] = None
 ) -> List[ItemGroup]:
     try:
         query = db.query(ItemGroup).filter(ItemGroup.is_deleted == False)
+        query = apply_filters(query, ItemGroup, filters)
+        if fields:
+            query = query.options(*load_fields(ItemGroup, fields, sort_by))
+        if cursor is not None:
+            return apply_keyset(query, ItemGroup, sort_by, order, cursor).limit(limit).all()
         if sort_by:
             query = apply_sorting(query, ItemGroup, sort_by, order)
         return query.offset(offset).limit(limit).all()
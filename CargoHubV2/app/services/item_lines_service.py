@@ -3,6 +3,9 @@ from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from CargoHubV2.app.models.item_lines_model import ItemLine
 from CargoHubV2.app.schemas.item_lines_schema import ItemLineUpdate
 from CargoHubV2.app.services.sorting_service import apply_sorting
+from CargoHubV2.app.services.filtering_service import apply_filters
+from CargoHubV2.app.services.projection_service import load_fields
+from CargoHubV2.app.services.pagination_service import apply_keyset
 
 from typing import List, Optional
 from fastapi import HTTPException, status
@@ -33,10 +36,18 @@ def get_all_item_lines(
     offset: int = 0,
     limit: int = 100,
     sort_by: Optional[str] = "id",
-    order: Optional[str] = "asc"
+    order: Optional[str] = "asc",
+    cursor: Optional[str] = None,
+    fields: Optional[tuple] = None,
+    filters: Optional[list] = None
 ) -> List[ItemLine]:
     try:
         query = db.query(ItemLine).filter(ItemLine.is_deleted == False)
+        query = apply_filters(query, ItemLine, filters)
+        if fields:
+            query = query.options(*load_fields(ItemLine, fields, sort_by))
+        if cursor is not None:
+            return apply_keyset(query, ItemLine, sort_by, order, cursor).limit(limit).all()
         if sort_by:
             query = apply_sorting(query, ItemLine, sort_by, order)
         return query.offset(offset).limit(limit).all()
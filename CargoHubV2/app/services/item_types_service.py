@@ -2,6 +2,9 @@ from sqlalchemy.orm import Session
 from CargoHubV2.app.models.item_types_model import ItemType
 from CargoHubV2.app.schemas.item_types_schema import ItemTypeUpdate
 from CargoHubV2.app.services.sorting_service import apply_sorting
+from CargoHubV2.app.services.filtering_service import apply_filters
+from CargoHubV2.app.services.projection_service import load_fields
+from CargoHubV2.app.services.pagination_service import apply_keyset
 
 from typing import List, Optional
 from sqlalchemy.exc import SQLAlchemyError
@@ -28,10 +31,18 @@ def get_all_item_types(
     offset: int = 0,
     limit: int = 100,
     sort_by: Optional[str] = "id",
-    order: Optional[str] = "asc"
+    order: Optional[str] = "asc",
+    cursor: Optional[str] = None,
+    fields: Optional[tuple] = None,
+    filters: Optional[list] = None
 ) -> List[ItemType]:
     try:
         query = db.query(ItemType).filter(ItemType.is_deleted == False)
+        query = apply_filters(query, ItemType, filters)
+        if fields:
+            query = query.options(*load_fields(ItemType, fields, sort_by))
+        if cursor is not None:
+            return apply_keyset(query, ItemType, sort_by, order, cursor).limit(limit).all()
         if sort_by:
             query = apply_sorting(query, ItemType, sort_by, order)
         return query.offset(offset).limit(limit).all()
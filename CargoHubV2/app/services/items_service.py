@@ -1,9 +1,17 @@
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from CargoHubV2.app.models.items_model import Item
 from CargoHubV2.app.models.warehouses_model import Warehouse
+from CargoHubV2.app.models.orders_model import Order
+from CargoHubV2.app.models.order_lines_model import OrderLine
+from CargoHubV2.app.models.shipments_model import Shipment
+from CargoHubV2.app.models.shipment_item_index_model import ShipmentItemIndex
 from CargoHubV2.app.schemas.items_schema import ItemUpdate
 from CargoHubV2.app.services.sorting_service import apply_sorting
+from CargoHubV2.app.services.filtering_service import apply_filters
+from CargoHubV2.app.services.projection_service import load_fields
+from CargoHubV2.app.services.pagination_service import apply_keyset
 
 from fastapi import HTTPException, status
 from datetime import datetime
@@ -23,9 +31,14 @@ def get_item(db: Session, code: str):
         )
 
 
-def get_all_items(db: Session, offset: int = 0, limit: int = 100, sort_by: Optional[str] = "id", order: Optional[str] = "asc"):
+def get_all_items(db: Session, offset: int = 0, limit: int = 100, sort_by: Optional[str] = "id", order: Optional[str] = "asc", cursor: Optional[str] = None, fields: Optional[tuple] = None, filters: Optional[list] = None):
     try:
         query = db.query(Item).filter(Item.is_deleted == False)
+        query = apply_filters(query, Item, filters)
+        if fields:
+            query = query.options(*load_fields(Item, fields, sort_by))
+        if cursor is not None:
+            return apply_keyset(query, Item, sort_by, order, cursor).limit(limit).all()
         sorted_query = apply_sorting(query, Item, sort_by, order)
         return sorted_query.offset(offset).limit(limit).all()
     except ValueError as e:
@@ -101,4 +114,51 @@ def delete_item(db: Session, code: str):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred while deleting the item."
-        )
\ No newline at end of file
+        )
+
+
+def get_item_uid(db: Session, code: str) -> str:
+    # orders en shipments verwijzen naar de uid, de API gebruikt meestal de code
+    row = db.query(Item.uid).filter(or_(Item.code == code, Item.uid == code), Item.is_deleted == False).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Item not found")
+    return row.uid
+
+
+def get_orders_for_item(db: Session, code: str, open_only: bool = True):
+    item_uid = get_item_uid(db, code)
+    try:
+        # (item_uid, order_id) index op order_lines, daarna per order een primary key lookup
+        query = (
+            db.query(OrderLine.order_id)
+            .join(Order, Order.id == OrderLine.order_id)
+            .filter(OrderLine.item_uid == item_uid, Order.is_deleted == False)
+        )
+        if open_only:
+            query = query.filter(Order.order_status != "Delivered")
+        order_ids = [row.order_id for row in query.distinct().order_by(OrderLine.order_id).all()]
+    except SQLAlchemyError:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while retrieving orders for the item."
+        )
+    return {"item_id": item_uid, "order_ids": order_ids}
+
+
+def get_shipments_for_item(db: Session, code: str, open_only: bool = True):
+    item_uid = get_item_uid(db, code)
+    try:
+        query = (
+            db.query(ShipmentItemIndex.shipment_id)
+            .join(Shipment, Shipment.id == ShipmentItemIndex.shipment_id)
+            .filter(ShipmentItemIndex.item_uid == item_uid, Shipment.is_deleted == False)
+        )
+        if open_only:
+            query = query.filter(Shipment.shipment_status != "Delivered")
+        shipment_ids = [row.shipment_id for row in query.order_by(ShipmentItemIndex.shipment_id).all()]
+    except SQLAlchemyError:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while retrieving shipments for the item."
+        )
+    return {"item_id": item_uid, "shipment_ids": shipment_ids}
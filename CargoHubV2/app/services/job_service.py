@@ -0,0 +1,147 @@
+import os
+import json
+import hashlib
+import logging
+import threading
+import multiprocessing
+
+from pathlib import Path
+from concurrent.futures import Future, ProcessPoolExecutor
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from CargoHubV2.app import config
+
+# zoveel afgeronde jobs blijven bewaard voor de status in get-pdf
+JOBS_KEPT = 1000
+
+logger = logging.getLogger("uvicorn.error")
+
+pool = None
+jobs = {}  # job id (pdf filename) -> Future
+jobs_lock = threading.Lock()
+
+
+def get_pool() -> ProcessPoolExecutor:
+    global pool
+    if pool is None:
+        # spawn i.p.v. fork: de API heeft threads en database connecties die niet mee gekopieerd moeten worden
+        pool = ProcessPoolExecutor(max_workers=config.PDF_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    return pool
+
+
+def shutdown(wait: bool = False):
+    global pool
+    if pool is not None:
+        pool.shutdown(wait=wait, cancel_futures=True)
+        pool = None
+
+
+def run_inline(func, *args) -> Future:
+    future = Future()
+    try:
+        future.set_result(func(*args))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def prune_jobs():
+    # oudste afgeronde jobs eerst, dicts houden de volgorde van toevoegen aan
+    for job_id in [job_id for job_id, future in jobs.items() if future.done()][:max(0, len(jobs) - JOBS_KEPT)]:
+        del jobs[job_id]
+
+
+def submit(job_id: str, func, *args) -> Future:
+    with jobs_lock:
+        future = jobs.get(job_id)
+        if future is not None and not future.done():
+            # dezelfde PDF wordt al gemaakt
+            return future
+        if config.PDF_WORKERS == 0:
+            future = run_inline(func, *args)
+        else:
+            if sum(not future.done() for future in jobs.values()) >= config.PDF_QUEUE_SIZE:
+                raise HTTPException(status_code=503, detail="Too many PDF jobs queued, try again later")
+            future = get_pool().submit(func, *args)
+        jobs[job_id] = future
+        prune_jobs()
+    future.add_done_callback(lambda future: log_job(job_id, future))
+    return future
+
+
+def log_job(job_id: str, future: Future):
+    # in het API process, met de tijden per stap uit de worker (render functies geven die terug)
+    if future.cancelled() or future.exception():
+        logger.warning(f"PDF job {job_id} failed: {'cancelled' if future.cancelled() else future.exception()}")
+        return
+    timing = future.result() if isinstance(future.result(), dict) else {}
+    logger.info(f"PDF job {job_id} done: " + ", ".join(f"{stage} {ms:.1f} ms" for stage, ms in timing.items()))
+
+
+def job_status(job_id: str):
+    future = jobs.get(job_id)
+    if future is None:
+        return None, None
+    return future_status(future)
+
+
+def future_status(future: Future):
+    if not future.done():
+        return "pending", None
+    if future.cancelled() or future.exception():
+        return "failed", "cancelled" if future.cancelled() else str(future.exception())
+    return "done", None
+
+
+def content_version(content: dict) -> str:
+    # de PDF hangt alleen af van content, een hash daarvan is de data-versie
+    return hashlib.sha1(json.dumps(content, sort_keys=True, default=str).encode()).hexdigest()[:12]
+
+
+def render_to_file(render, content: dict, pdf_path: str):
+    # draait in een worker process
+    path = Path(pdf_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # eerst naar een tijdelijk bestand, get-pdf mag nooit een half geschreven PDF zien
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        timing = render(content, str(tmp_path))
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    # oudere versies van dezelfde PDF opruimen
+    prefix = path.name.rsplit("_", 1)[0]
+    for old_path in path.parent.glob(f"{prefix}_*.pdf"):
+        if old_path != path:
+            old_path.unlink(missing_ok=True)
+    return timing
+
+
+def queue_pdf(render, content: dict, pdf_dir: Path, pdf_prefix: str, url_base: str, message: str):
+    pdf_filename = f"{pdf_prefix}_{content_version(content)}.pdf"
+    pdf_path = pdf_dir/pdf_filename
+    pdf_url = f"{url_base}/{pdf_filename}"
+
+    # zelfde content: de PDF van de vorige keer is nog goed
+    if pdf_path.exists():
+        return JSONResponse({"message": message, "pdf_url": pdf_url})
+
+    future = submit(pdf_filename, render_to_file, render, content, str(pdf_path))
+    status, error = future_status(future)
+    # zonder workers (PDF_WORKERS=0) is de job al klaar of mislukt
+    if status == "done":
+        return JSONResponse({"message": message, "pdf_url": pdf_url})
+    if status == "failed":
+        return JSONResponse(status_code=500, content={"job_id": pdf_filename, "status": "failed", "detail": error})
+    return JSONResponse(status_code=202, content={
+        "message": "PDF generation queued.", "job_id": pdf_filename, "status": "pending", "pdf_url": pdf_url})
+
+
+def pdf_status_response(job_id: str):
+    # voor get-pdf als de PDF (nog) niet bestaat
+    status, error = job_status(job_id)
+    if status == "pending":
+        return JSONResponse(status_code=202, content={"job_id": job_id, "status": "pending"})
+    if status == "failed":
+        return JSONResponse(status_code=500, content={"job_id": job_id, "status": "failed", "detail": error})
+    raise HTTPException(status_code=404, detail="PDF not found")
@@ -2,15 +2,25 @@ from CargoHubV2.app.models import *
 from fastapi import HTTPException, status
 from fastapi.responses import JSONResponse
 from datetime import datetime
+from sqlalchemy import Integer, insert, select, text
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 # from CargoHubV2.app.models import (items_model, item_groups_model, item_lines_model,
 #                                    item_types_model, warehouses_model, transfers_model,
-#                                    locations_model, suppliers_model, shipments_model, 
+#                                    locations_model, suppliers_model, shipments_model,
 #                                    clients_model, inventories_model, orders_model)
 import os
+import re
 import json
-from tqdm import tqdm
+import time
+from functools import lru_cache
+from queue import Empty, Full
+from typing import Optional
+from graphlib import TopologicalSorter
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from CargoHubV2.app import config
+from CargoHubV2.app.services.rollup_service import rebuild_rollup
 
 model_mapping = {
         "items.json": items_model.Item,
@@ -27,58 +37,393 @@ model_mapping = {
         "orders.json": orders_model.Order
     }
 
+# aantal records per insert + commit
+CHUNK_SIZE = 5000
+# aantal tekens dat per keer uit een json file gelezen wordt
+READ_SIZE = 1 << 16
+# houdt per file bij hoeveel records al gecommit zijn, zodat een afgebroken load verder kan
+CHECKPOINT_FILE = ".load_checkpoint.json"
 
-def load(path: str, db: Session):
-    base_dir = os.path.abspath(os.path.join(__file__, "C:/Users/mauri/source/repos/HR Jaar 2/CargoHub"))
+BASE_DIR = os.path.abspath(os.path.join(__file__, "C:/Users/mauri/source/repos/HR Jaar 2/CargoHub"))
 
-    for file in model_mapping:
-        json_file_path = os.path.join(base_dir, "data", file)
+# aantal chunks dat een worker vooruit mag parsen bij parallel laden
+QUEUE_SIZE = 4
+QUEUE_POLL = 0.1
+# timestamps komen in exports vaak terug, dus geparste waardes bewaren
+DATETIME_CACHE_SIZE = 65536
 
-        with open(json_file_path, 'r') as json_file:
-            data = json.load(json_file)
+WHITESPACE = re.compile(r"[ \t\n\r]*")
 
-        id_tracker = set()
 
-        for num, record in tqdm(enumerate(data, start=1), desc=f"Processing {file}"):
-            if file == "orders.json":
-                original_id = record["id"]
+def iter_json_array(json_file, read_size: int = READ_SIZE):
+    # leest een json array element voor element, zonder de hele file in het geheugen
+    decoder = json.JSONDecoder()
+    buffer, pos, eof, started = "", 0, False, False
+    while True:
+        pos = WHITESPACE.match(buffer, pos).end()
+        if pos < len(buffer):
+            char = buffer[pos]
+            if not started:
+                if char != "[":
+                    raise ValueError("Expected a JSON array")
+                started = True
+                pos += 1
+                continue
+            if char == "]":
+                return
+            if char == ",":
+                pos += 1
+                continue
+            try:
+                obj, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                # een getal aan het einde van de buffer kan nog doorlopen
+                if end < len(buffer) or eof:
+                    yield obj
+                    pos = end
+                    continue
+        elif eof:
+            raise ValueError("Unexpected end of JSON array")
 
-                while record["id"] in id_tracker:
-                    record["id"] = num
-                
-                id_tracker.add(record["id"])
-                if record["id"] != original_id:
-                    print(f"Adjusted ID from {original_id} to {record['id']}")
+        chunk = json_file.read(read_size)
+        eof = not chunk
+        buffer = buffer[pos:] + chunk
+        pos = 0
 
-            try:
-                # Parse datetime fields
-                if "created_at" in record:
-                    record["created_at"] = parse_iso_datetime(record["created_at"])
-                if "updated_at" in record:
-                    record["updated_at"] = parse_iso_datetime(record["updated_at"], default_now=True)
-                if "order_date" in record:
-                    record["order_date"] = parse_iso_datetime(record["order_date"])
-                if "request_date" in record:
-                    record["request_date"] = parse_iso_datetime(record["request_date"])
-                if "shipment_date" in record:
-                    record["shipment_date"] = parse_iso_datetime(record["shipment_date"])
-
-                # Handle nested JSON fields (e.g., items)
-                if "items" in record and isinstance(record["items"], (list, dict)):
-                    record["items"] = json.dumps(record["items"])
-
-                obj = model_mapping[file](**record)
-                db.add(obj)
-                # db.flush()
 
+def read_checkpoint(data_dir: str) -> dict:
+    checkpoint_path = os.path.join(data_dir, CHECKPOINT_FILE)
+    if not os.path.exists(checkpoint_path):
+        return {}
+    with open(checkpoint_path, "r") as checkpoint_file:
+        return json.load(checkpoint_file)
+
+
+def write_checkpoint(data_dir: str, checkpoint: dict):
+    checkpoint_path = os.path.join(data_dir, CHECKPOINT_FILE)
+    tmp_path = checkpoint_path + ".tmp"
+    with open(tmp_path, "w") as checkpoint_file:
+        json.dump(checkpoint, checkpoint_file)
+    os.replace(tmp_path, checkpoint_path)
+
+
+def adjust_order_id(record: dict, num: int, id_tracker: set):
+    original_id = record["id"]
+
+    while record["id"] in id_tracker:
+        record["id"] = num
+
+    id_tracker.add(record["id"])
+    if record["id"] != original_id:
+        print(f"Adjusted ID from {original_id} to {record['id']}")
+
+
+def prepare_record(record: dict, columns: set) -> dict:
+    unknown = set(record) - columns
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+
+    # Parse datetime fields
+    if "created_at" in record:
+        record["created_at"] = parse_iso_datetime(record["created_at"])
+    if "updated_at" in record:
+        record["updated_at"] = parse_iso_datetime(record["updated_at"], default_now=True)
+    if "order_date" in record:
+        record["order_date"] = parse_iso_datetime(record["order_date"])
+    if "request_date" in record:
+        record["request_date"] = parse_iso_datetime(record["request_date"])
+    if "shipment_date" in record:
+        record["shipment_date"] = parse_iso_datetime(record["shipment_date"])
+
+    # items niet als json string opslaan, de JSON kolom serialiseert zelf (anders komt er een string uit de API)
+    return record
+
+
+def insert_chunk(db: Session, table, rows: list) -> int:
+    # executemany per groep records met dezelfde velden, anders vult Core ontbrekende velden niet met defaults
+    groups = {}
+    for row in rows:
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+    try:
+        for group in groups.values():
+            db.execute(insert(table), group)
+        db.commit()
+        return 0
+    except SQLAlchemyError:
+        db.rollback()
+
+    # de chunk record voor record opnieuw, zodat alleen de foute records overgeslagen worden
+    errors = 0
+    for row in rows:
+        try:
+            db.execute(insert(table), [row])
+            db.commit()
+        except SQLAlchemyError as e:
+            db.rollback()
+            errors += 1
+            print(f"Error inserting record: {row}\n{e}")
+    return errors
+
+
+def child_rows(file: str, rows: list):
+    # rijen voor de tabel die bij de records van deze file hoort: (tabel, foreign key, rijen)
+    if file == "orders.json":
+        return OrderLine.__table__, "order_id", [
+            {"order_id": row["id"], "item_uid": item["item_id"], "amount": item["amount"]}
+            for row in rows for item in row.pop("items", None) or []
+        ]
+    if file == "shipments.json":
+        return ShipmentItemIndex.__table__, "shipment_id", [
+            {"shipment_id": row["id"], "item_uid": item_uid}
+            for row in rows for item_uid in dict.fromkeys(item["item_id"] for item in row.get("items") or [])
+        ]
+    return None
+
+
+def insert_rows(db: Session, file: str, rows: list) -> int:
+    table = model_mapping[file].__table__
+    children = child_rows(file, rows)
+    errors = insert_chunk(db, table, rows)
+    if children is None:
+        return errors
+
+    child_table, key, child = children
+    if errors:
+        # geen rijen voor records die niet geladen konden worden
+        loaded = set(db.scalars(select(table.c.id).where(table.c.id.in_({row[key] for row in child}))))
+        child = [row for row in child if row[key] in loaded]
+    return errors + insert_chunk(db, child_table, child)
+
+
+def iter_prepared_chunks(json_file_path: str, file: str, done: int, chunk_size: int, progress: bool = True):
+    # geeft (laatste record nummer, records, fouten) per chunk terug
+    # tqdm pas hier importeren, alleen nodig als er geladen wordt
+    from tqdm import tqdm
+
+    columns = set(model_mapping[file].__table__.columns.keys())
+    id_tracker = set()
+    errors = 0
+    rows = []
+    num = done
+
+    with open(json_file_path, "r") as json_file:
+        records = enumerate(iter_json_array(json_file), start=1)
+        for num, record in tqdm(records, desc=f"Processing {file}", disable=not progress):
+            if file == "orders.json":
+                adjust_order_id(record, num, id_tracker)
+            # al gecommit bij een vorige run
+            if num <= done:
+                continue
+
+            try:
+                # orderregels gaan naar de order_lines tabel, zie insert_rows
+                items = record.pop("items", None) if file == "orders.json" else None
+                row = prepare_record(record, columns)
+                if items:
+                    row["items"] = items
+                rows.append(row)
             except Exception as e:
-                db.rollback()
+                errors += 1
                 print(f"Error inserting record: {record}\n{e}")
 
+            if len(rows) >= chunk_size:
+                yield num, rows, errors
+                rows, errors = [], 0
+
+    if rows or errors:
+        yield num, rows, errors
+
+
+def load_file(db: Session, json_file_path: str, file: str, done: int, chunk_size: int, on_chunk) -> dict:
+    stats = {"rows": 0, "errors": 0, "seconds": 0.0}
+    start = time.perf_counter()
+
+    for num, rows, errors in iter_prepared_chunks(json_file_path, file, done, chunk_size):
+        stats["errors"] += errors + insert_rows(db, file, rows)
+        stats["rows"] += len(rows)
+        on_chunk(num)
+    on_chunk(None)
+
+    stats["seconds"] = time.perf_counter() - start
+    return stats
+
+
+def file_dependencies() -> dict:
+    # welke files eerst geladen moeten zijn, op basis van de foreign keys in Base.metadata
+    files_by_table = {model.__tablename__: file for file, model in model_mapping.items()}
+    dependencies = {}
+    for file, model in model_mapping.items():
+        table = Base.metadata.tables[model.__tablename__]
+        dependencies[file] = {
+            files_by_table[fk.column.table.name]
+            for fk in table.foreign_keys
+            if fk.column.table.name in files_by_table and files_by_table[fk.column.table.name] != file
+        }
+    return dependencies
+
+
+def put_message(queue, cancel, message) -> bool:
+    # niet eeuwig blokkeren op een volle queue als de load afgebroken is
+    while not cancel.is_set():
+        try:
+            queue.put(message, timeout=QUEUE_POLL)
+            return True
+        except Full:
+            continue
+    return False
+
+
+def convert_file(json_file_path: str, file: str, done: int, chunk_size: int, queue, cancel):
+    # draait in een worker process: parsen en omzetten, de inserts doet het hoofdprocess
+    start = time.perf_counter()
     try:
-        db.commit()
-        return "Data successfully loaded."
-    except SQLAlchemyError as e:
+        for chunk in iter_prepared_chunks(json_file_path, file, done, chunk_size, progress=False):
+            if not put_message(queue, cancel, ("chunk", *chunk)):
+                return
+        put_message(queue, cancel, ("done", time.perf_counter() - start))
+    except Exception as e:
+        put_message(queue, cancel, ("error", f"{file}: {e}"))
+
+
+def next_message(queue, future):
+    while True:
+        try:
+            return queue.get(timeout=QUEUE_POLL)
+        except Empty:
+            # worker is gestopt zonder done/error bericht
+            if future.done() and queue.empty():
+                raise ValueError(f"Worker stopped unexpectedly: {future.exception()}")
+
+
+def load_parallel(db: Session, files: dict, chunk_size: int, on_chunk, workers: Optional[int] = None) -> dict:
+    dependencies = file_dependencies()
+    order = [file for file in TopologicalSorter(dependencies).static_order() if file in files]
+    stats = {}
+
+    # spawn i.p.v. fork: load draait in een API thread met open database connecties,
+    # de workers (convert_file) en de manager importeren deze module opnieuw
+    context = multiprocessing.get_context("spawn")
+    with context.Manager() as manager, ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        cancel = manager.Event()
+        queues, futures = {}, {}
+        # in topologische volgorde submitten, dan draait de file waar het hoofdprocess op wacht altijd al
+        for file in order:
+            json_file_path, done = files[file]
+            queues[file] = manager.Queue(maxsize=QUEUE_SIZE)
+            futures[file] = pool.submit(convert_file, json_file_path, file, done, chunk_size, queues[file], cancel)
+
+        try:
+            # een file tegelijk inserten, zo blijven writes naar dezelfde tabel achter elkaar
+            for file in order:
+                file_stats = {"rows": 0, "errors": 0, "seconds": 0.0, "parse_seconds": 0.0}
+                while True:
+                    message = next_message(queues[file], futures[file])
+                    if message[0] == "error":
+                        raise ValueError(message[1])
+                    if message[0] == "done":
+                        file_stats["parse_seconds"] = message[1]
+                        break
+                    _, num, rows, errors = message
+                    start = time.perf_counter()
+                    file_stats["errors"] += errors + insert_rows(db, file, rows)
+                    file_stats["rows"] += len(rows)
+                    file_stats["seconds"] += time.perf_counter() - start
+                    on_chunk(file, num)
+                on_chunk(file, None)
+                stats[file] = file_stats
+        except BaseException:
+            cancel.set()
+            raise
+    return stats
+
+
+def sequence_column(table) -> Optional[str]:
+    # alleen een enkele integer primary key heeft een sequence (items heeft uid als key)
+    columns = list(table.primary_key.columns)
+    if len(columns) != 1 or not isinstance(columns[0].type, Integer):
+        return None
+    return columns[0].name
+
+
+def reset_sequences(db: Session, files):
+    # op postgres lopen de id sequences niet mee met expliciete ids uit de json files
+    if db.get_bind().dialect.name != "postgresql":
+        return
+    for file in files:
+        table = model_mapping[file].__table__
+        column = sequence_column(table)
+        if column is None:
+            continue
+        db.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table.name}', '{column}'), "
+            f"COALESCE(MAX({column}), 0) + 1, false) FROM {table.name}"
+        ))
+    db.commit()
+
+
+def print_load_stats(stats: dict, wall_clock: float):
+    for file, file_stats in stats.items():
+        rate = file_stats["rows"] / file_stats["seconds"] if file_stats["seconds"] else 0
+        print(f"{file:<20} {file_stats['rows']:>9} rows {file_stats['errors']:>6} errors "
+              f"{file_stats['seconds']:>8.2f}s {rate:>10.0f} rows/s")
+    print(f"{'total':<20} {sum(s['rows'] for s in stats.values()):>9} rows {wall_clock:>23.2f}s wall clock")
+
+
+def resolve_data_dir(path: Optional[str]) -> str:
+    # path is relatief aan de data map, niets daarbuiten: de load leest die map en schrijft er de checkpoint in
+    root = os.path.realpath(config.LOAD_DATA_DIR or os.path.join(BASE_DIR, "data"))
+    if not path:
+        return root
+    data_dir = os.path.realpath(os.path.join(root, path))
+    if os.path.commonpath([root, data_dir]) != root:
+        raise HTTPException(status_code=400, detail="Invalid load path, must be inside the data directory")
+    return data_dir if os.path.isdir(data_dir) else root
+
+
+def load(path: str, db: Session, chunk_size: int = CHUNK_SIZE, resume: bool = True,
+         parallel: bool = False, workers: Optional[int] = None):
+    data_dir = resolve_data_dir(path)
+
+    checkpoint = read_checkpoint(data_dir) if resume else {}
+
+    def on_chunk(file, num):
+        # -1 betekent dat de hele file geladen is
+        checkpoint[file] = -1 if num is None else num
+        write_checkpoint(data_dir, checkpoint)
+
+    # files die (nog) geladen moeten worden, met het aantal records dat al gecommit is
+    files = {}
+    for file in model_mapping:
+        json_file_path = os.path.join(data_dir, file)
+        if not os.path.exists(json_file_path):
+            print(f"Skipping {file}, file not found")
+            continue
+        done = checkpoint.get(file, 0)
+        if done == -1:
+            print(f"Skipping {file}, already loaded")
+            continue
+        files[file] = (json_file_path, done)
+
+    start = time.perf_counter()
+    try:
+        if parallel:
+            stats = load_parallel(db, files, chunk_size, on_chunk, workers)
+        else:
+            stats = {}
+            for file, (json_file_path, done) in files.items():
+                stats[file] = load_file(
+                    db, json_file_path, file, done, chunk_size, lambda num, file=file: on_chunk(file, num))
+        # alle volledig geladen files, ook uit een eerdere run die na het laden (bijv. in
+        # reset_sequences of de rollup) afgebroken is, die files staan niet meer in files
+        loaded = [file for file in model_mapping if checkpoint.get(file) == -1]
+        reset_sequences(db, loaded)
+        # orders worden direct ge-insert, de rollup voor de reports daarna in een keer opbouwen
+        if "orders.json" in loaded:
+            rebuild_rollup(db)
+    except (OSError, ValueError, SQLAlchemyError) as e:
         db.rollback()
         print(f"error detected: {e}")
 
@@ -86,19 +431,57 @@ def load(path: str, db: Session):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={"error": str(e)}
         )
-    return "hij is klaar met loaden"
+    print_load_stats(stats, time.perf_counter() - start)
 
+    # alles geladen, volgende load begint weer opnieuw
+    checkpoint_path = os.path.join(data_dir, CHECKPOINT_FILE)
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    return "Data successfully loaded."
 
-def parse_iso_datetime(value, default_now=False):
+
+def parse_fixed_datetime(value: str):
+    # snelle route voor de drie vaste formats, geeft None als de string er niet precies op lijkt
+    length = len(value)
+    if length < 10 or value[4] != "-" or value[7] != "-":
+        return None
+    if length == 10:
+        # "%Y-%m-%d"
+        return datetime.fromisoformat(value)
+    if length not in (19, 20) or value[13] != ":" or value[16] != ":":
+        return None
+    if length == 20 and value[10] == "T" and value[19] == "Z":
+        # "%Y-%m-%dT%H:%M:%SZ", zonder tijdzone net als strptime
+        return datetime.fromisoformat(value[:19])
+    if length == 19 and value[10] == " ":
+        # "%Y-%m-%d %H:%M:%S"
+        return datetime.fromisoformat(value)
+    return None
+
+
+@lru_cache(maxsize=DATETIME_CACHE_SIZE)
+def parse_datetime_cached(value):
+    try:
+        parsed = parse_fixed_datetime(value)
+        if parsed is not None:
+            return parsed
+    except ValueError:
+        pass
+    # strptime accepteert ook bijv. maanden zonder voorloopnul, die gaan via de oude route
     try:
         return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
     except ValueError:
         try:
             return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
         except ValueError:
-            try:
-                return datetime.strptime(value, "%Y-%m-%d")
-            except ValueError:
-                if default_now:
-                    return datetime.now()
-                raise ValueError(f"Invalid datetime format: {value}")
\ No newline at end of file
+            return datetime.strptime(value, "%Y-%m-%d")
+
+
+def parse_iso_datetime(value, default_now=False):
+    try:
+        return parse_datetime_cached(value)
+    except ValueError:
+        # niet cachen, anders blijft datetime.now() hangen op de eerste aanroep
+        if default_now:
+            return datetime.now()
+        raise ValueError(f"Invalid datetime format: {value}")
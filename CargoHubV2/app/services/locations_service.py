@@ -1,7 +1,12 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from CargoHubV2.app.models.locations_model import Location
 from CargoHubV2.app.services.sorting_service import apply_sorting
+from CargoHubV2.app.services.filtering_service import apply_filters
+from CargoHubV2.app.services.pagination_service import apply_keyset
+from CargoHubV2.app.services.projection_service import load_fields
 
 from CargoHubV2.app.schemas.locations_schema import LocationCreate, LocationUpdate
 from datetime import datetime
@@ -14,10 +19,15 @@ def get_all_locations(
     offset: int = 0,
     limit: int = 100,
     sort_by: Optional[str] = "id",
-    order: Optional[str] = "asc"
+    order: Optional[str] = "asc",
+    cursor: Optional[str] = None,
+    filters: Optional[list] = None
 ):
     try:
         query = db.query(Location).filter(Location.is_deleted == False)
+        query = apply_filters(query, Location, filters)
+        if cursor is not None:
+            return apply_keyset(query, Location, sort_by, order, cursor).limit(limit).all()
         if sort_by:
             query = apply_sorting(query, Location, sort_by, order)
         return query.offset(offset).limit(limit).all()
@@ -62,6 +72,68 @@ def get_locations_by_warehouse_id(
         )
 
 
+async def get_all_locations_async(
+    db: AsyncSession,
+    offset: int = 0,
+    limit: int = 100,
+    sort_by: Optional[str] = "id",
+    order: Optional[str] = "asc",
+    cursor: Optional[str] = None,
+    fields: Optional[tuple] = None,
+    filters: Optional[list] = None
+):
+    try:
+        # alleen de gevraagde kolommen, stock (JSON) alleen als die gevraagd is
+        query = select(Location).options(*load_fields(Location, fields, sort_by)).filter(Location.is_deleted == False)
+        query = apply_filters(query, Location, filters)
+        if cursor is not None:
+            query = apply_keyset(query, Location, sort_by, order, cursor)
+        else:
+            if sort_by:
+                query = apply_sorting(query, Location, sort_by, order)
+            query = query.offset(offset)
+        return (await db.execute(query.limit(limit))).scalars().all()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except SQLAlchemyError:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while retrieving locations."
+        )
+
+
+async def get_location_by_id_async(db: AsyncSession, id: int):
+    location = (await db.execute(select(Location).filter(Location.id == id, Location.is_deleted == False))).scalars().first()
+    if location is None:
+        raise HTTPException(status_code=404, detail="Location id not found")
+    return location
+
+
+async def get_locations_by_warehouse_id_async(
+    db: AsyncSession,
+    warehouse_id: int,
+    offset: int = 0,
+    limit: int = 100,
+    sort_by: Optional[str] = "id",
+    order: Optional[str] = "asc"
+):
+    try:
+        query = select(Location).filter(Location.warehouse_id == warehouse_id, Location.is_deleted == False)
+        if sort_by:
+            query = apply_sorting(query, Location, sort_by, order)
+        locations = (await db.execute(query.offset(offset).limit(limit))).scalars().all()
+        if len(locations) == 0:
+            raise HTTPException(status_code=404, detail="Location warehouse not found")
+        return locations
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except SQLAlchemyError:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while retrieving locations."
+        )
+
+
 def create_location(db: Session, location_data: LocationCreate):
     location = Location(
         warehouse_id=location_data.warehouse_id,
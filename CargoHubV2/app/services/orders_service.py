@@ -1,52 +1,152 @@
+from sqlalchemy import select, update, bindparam, func, and_
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from CargoHubV2.app.models.orders_model import Order
+from CargoHubV2.app.models.order_lines_model import OrderLine
 from CargoHubV2.app.models.inventories_model import Inventory
 from CargoHubV2.app.models.shipments_model import Shipment
 from CargoHubV2.app.schemas.orders_schema import OrderUpdate, OrderShipmentUpdate
 from fastapi import HTTPException, status
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 from CargoHubV2.app.services.sorting_service import apply_sorting
+from CargoHubV2.app.services.filtering_service import apply_filters
+from CargoHubV2.app.services.pagination_service import apply_keyset
+from CargoHubV2.app.services.projection_service import load_fields
+from CargoHubV2.app.services.rollup_service import add_to_rollup, apply_rollup
 
+# aantal orders per commit bij batch aanmaken
+BATCH_CHUNK_SIZE = 500
 
-def create_order(db: Session, order_data: dict):
-    order_data["shipment_id"] = order_data.get("shipment_id")[0]
-    for item_dict in order_data["items"]:
-        # getal uit item Uid
-        inventory_id = int(item_dict["item_id"].split("0")[-1])
-        inventory = db.query(Inventory).filter(Inventory.id == inventory_id, Inventory.is_deleted == False).first()
-        if not inventory:
+
+def inventory_id_for_item(item_uid: str) -> int:
+    # getal uit item Uid
+    return int(item_uid.split("0")[-1])
+
+
+def fetch_available(db: Session, inventory_ids: set) -> dict:
+    # alle inventories in een keer ophalen i.p.v. een query per orderregel
+    rows = db.query(
+        Inventory.id, Inventory.total_available
+    ).filter(Inventory.id.in_(inventory_ids), Inventory.is_deleted == False).all()
+    return {row.id: row.total_available for row in rows}
+
+
+def check_inventory(db: Session, items: list, available: Optional[dict] = None) -> dict:
+    if available is None:
+        available = fetch_available(db, {inventory_id_for_item(item_dict["item_id"]) for item_dict in items})
+
+    deltas = {}
+    for item_dict in items:
+        inventory_id = inventory_id_for_item(item_dict["item_id"])
+        if inventory_id not in available:
             raise HTTPException(status_code=404, detail=f"No inventory exists for item {item_dict['item_id']} in the given order")
-        if inventory.total_available < item_dict["amount"]:
+        remaining = available[inventory_id] - deltas.get(inventory_id, 0)
+        if remaining < item_dict["amount"]:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
-                detail=f"Item {item_dict['item_id']} in order only {inventory.total_available} available, ordered {item_dict['amount']}"
+                detail=f"Item {item_dict['item_id']} in order only {remaining} available, ordered {item_dict['amount']}"
             )
-        inventory.total_available -= item_dict["amount"]
-        if order_data["order_status"] == "Delivered":
-            inventory.total_on_hand -= item_dict["amount"]
-        else:
-            inventory.total_ordered += item_dict["amount"]
-        inventory.updated_at = datetime.now()
+        deltas[inventory_id] = deltas.get(inventory_id, 0) + item_dict["amount"]
+    return deltas
+
+
+def check_shipment(shipment_id: Optional[int], shipment: Optional[Shipment]):
+    if not shipment_id:
+        return
+    if not shipment:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Shipment with id: {shipment} does not exist")
+    if shipment.shipment_type == "I":
+        raise HTTPException(
+            status_code=409,
+            detail=f"cannot link order with an incoming shipment {shipment}")
+    if shipment.shipment_status == "Delivered":
+        raise HTTPException(
+            status_code=409,
+            detail=f"cannot link order with Delivered shipment {shipment}")
+
+
+def add_reservation(reservations: dict, deltas: dict, order_status: str):
+    # Delivered orders gaan direct van de voorraad af, de rest telt als ordered
+    delivered = order_status == "Delivered"
+    for inventory_id, amount in deltas.items():
+        row = reservations.setdefault(
+            inventory_id,
+            {"inventory_id": inventory_id, "amount": 0, "on_hand_delta": 0, "ordered_delta": 0})
+        row["amount"] += amount
+        row["on_hand_delta" if delivered else "ordered_delta"] += amount
+
+
+def reserve_inventory(db: Session, reservations: dict):
+    if not reservations:
+        return
+    # een bulk update voor alle regels, wordt gecommit samen met de order(s)
+    stmt = (
+        update(Inventory.__table__)
+        .where(Inventory.__table__.c.id == bindparam("inventory_id"))
+        .values(
+            total_available=Inventory.__table__.c.total_available - bindparam("amount"),
+            total_on_hand=Inventory.__table__.c.total_on_hand - bindparam("on_hand_delta"),
+            total_ordered=Inventory.__table__.c.total_ordered + bindparam("ordered_delta"),
+            updated_at=bindparam("now"),
+        )
+    )
+    now = datetime.now()
+    db.execute(stmt, [{**row, "now": now} for row in reservations.values()])
+
+
+def check_order_inventory(db: Session, order_id: int):
+    # een query voor alle regels: eerste item van de order zonder (actieve) inventory
+    missing = (
+        db.query(OrderLine.item_uid)
+        .outerjoin(Inventory, and_(Inventory.item_id == OrderLine.item_uid, Inventory.is_deleted == False))
+        .filter(OrderLine.order_id == order_id, Inventory.id.is_(None))
+        .first()
+    )
+    if missing:
+        raise HTTPException(status_code=404, detail=f"No inventory exists for item {missing.item_uid} in the given order")
+
+
+def adjust_order_inventory(db: Session, order_id: int, **signs):
+    # signs per kolom (+1/-1), de hoeveelheid per item wordt in SQL opgeteld uit order_lines
+    inventories = Inventory.__table__
+    lines = OrderLine.__table__
+    amount = (
+        select(func.sum(lines.c.amount))
+        .where(lines.c.order_id == order_id, lines.c.item_uid == inventories.c.item_id)
+        .scalar_subquery()
+    )
+    values = {
+        column: inventories.c[column] + amount if sign > 0 else inventories.c[column] - amount
+        for column, sign in signs.items()
+    }
+    db.execute(
+        update(inventories)
+        .where(inventories.c.item_id.in_(select(lines.c.item_uid).where(lines.c.order_id == order_id)),
+               inventories.c.is_deleted == False)
+        .values(**values, updated_at=datetime.now())
+    )
+
+
+def create_order(db: Session, order_data: dict):
+    order_data["shipment_id"] = order_data.get("shipment_id")[0]
+    deltas = check_inventory(db, order_data["items"] or [])
 
     shipment = order_data["shipment_id"]
     if shipment:
         shipment = db.query(Shipment).filter(Shipment.id == shipment, Shipment.is_deleted == False).first()
-        if not shipment:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Shipment with id: {shipment} does not exist")
-        if shipment.shipment_type == "I":
-            raise HTTPException(
-                status_code=409,
-                detail=f"cannot link order with an incoming shipment {shipment}")
-        if shipment.shipment_status == "Delivered":
-            raise HTTPException(
-                status_code=409,
-                detail=f"cannot link order with Delivered shipment {shipment}")
+    check_shipment(order_data["shipment_id"], shipment)
 
+    reservations = {}
+    add_reservation(reservations, deltas, order_data["order_status"])
+    reserve_inventory(db, reservations)
     order = Order(**order_data)
+    rollup = {}
+    add_to_rollup(rollup, order)
+    apply_rollup(db, rollup)
     db.add(order)
     try:
         db.commit()
@@ -66,6 +166,80 @@ def create_order(db: Session, order_data: dict):
     return order
 
 
+def order_result(index: int, reference: str, status_code: int, detail: str, id: Optional[int] = None):
+    return {"index": index, "reference": reference, "status_code": status_code, "detail": detail, "id": id}
+
+
+def create_orders_batch(db: Session, orders_data: list, chunk_size: int = BATCH_CHUNK_SIZE):
+    results = [None] * len(orders_data)
+    seen_references = set()
+
+    for chunk_start in range(0, len(orders_data), chunk_size):
+        chunk = list(enumerate(orders_data[chunk_start:chunk_start + chunk_size], start=chunk_start))
+        for _, order_data in chunk:
+            order_data["shipment_id"] = (order_data.get("shipment_id") or [None])[0]
+            order_data["items"] = order_data.get("items") or []
+
+        # per chunk een query voor inventories, shipments en bestaande references
+        available = fetch_available(db, {
+            inventory_id_for_item(item_dict["item_id"])
+            for _, order_data in chunk for item_dict in order_data["items"]})
+        shipment_ids = {order_data["shipment_id"] for _, order_data in chunk if order_data["shipment_id"]}
+        shipments = {
+            shipment.id: shipment for shipment in
+            db.query(Shipment).filter(Shipment.id.in_(shipment_ids), Shipment.is_deleted == False).all()
+        } if shipment_ids else {}
+        references = {order_data["reference"] for _, order_data in chunk}
+        seen_references.update(
+            row.reference for row in
+            db.query(Order.reference).filter(Order.reference.in_(references), Order.is_deleted == False).all())
+
+        reservations = {}
+        rollup = {}
+        created = []
+        for index, order_data in chunk:
+            reference = order_data["reference"]
+            if reference in seen_references:
+                results[index] = order_result(
+                    index, reference, status.HTTP_400_BAD_REQUEST, "An order with this reference already exists.")
+                continue
+            try:
+                deltas = check_inventory(db, order_data["items"], available)
+                check_shipment(order_data["shipment_id"], shipments.get(order_data["shipment_id"]))
+            except HTTPException as e:
+                results[index] = order_result(index, reference, e.status_code, e.detail)
+                continue
+            for inventory_id, amount in deltas.items():
+                available[inventory_id] -= amount
+            add_reservation(reservations, deltas, order_data["order_status"])
+            seen_references.add(reference)
+            order = Order(**order_data)
+            add_to_rollup(rollup, order)
+            created.append((index, order))
+
+        if not created:
+            continue
+        try:
+            reserve_inventory(db, reservations)
+            apply_rollup(db, rollup)
+            db.add_all([order for _, order in created])
+            db.flush()
+            ids = [(index, order.reference, order.id) for index, order in created]
+            db.commit()
+        except SQLAlchemyError:
+            db.rollback()
+            for index, order in created:
+                seen_references.discard(order.reference)
+                results[index] = order_result(
+                    index, order.reference, status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    "An error occurred while creating the order.")
+            continue
+        for index, reference, id in ids:
+            results[index] = order_result(index, reference, status.HTTP_201_CREATED, "Order created", id)
+
+    return results
+
+
 def get_order(db: Session, id: int):
     order = db.query(Order).filter(Order.id == id, Order.is_deleted == False).first()
     if not order:
@@ -73,16 +247,29 @@ def get_order(db: Session, id: int):
     return order
 
 
+def order_date_range(date: datetime) -> tuple:
+    # alle orders op die dag, als bereik op order_date zodat de index bruikbaar is
+    start = date.replace(hour=0, minute=0, second=0, microsecond=0)
+    return Order.order_date >= start, Order.order_date < start + timedelta(days=1)
+
+
 def get_all_orders(
     db: Session,
     date: Optional[datetime] = None,
     offset: int = 0,
     limit: int = 100,
     sort_by: Optional[str] = "order_date",
-    sort_order: Optional[str] = "asc"
+    sort_order: Optional[str] = "asc",
+    cursor: Optional[str] = None,
+    filters: Optional[list] = None
 ):
     try:
-        query = db.query(Order).filter(Order.is_deleted == 0)
+        query = db.query(Order).filter(Order.is_deleted == False)
+        if date is not None:
+            query = query.filter(*order_date_range(date))
+        query = apply_filters(query, Order, filters)
+        if cursor is not None:
+            return apply_keyset(query, Order, sort_by, sort_order, cursor).limit(limit).all()
         if sort_by:
             query = apply_sorting(query, Order, sort_by, sort_order)
         return query.offset(offset).limit(limit).all()
@@ -95,6 +282,46 @@ def get_all_orders(
         )
 
 
+async def get_order_async(db: AsyncSession, id: int):
+    order = (await db.execute(select(Order).filter(Order.id == id, Order.is_deleted == False))).scalars().first()
+    if not order:
+        raise HTTPException(status_code=404, detail="Order not found")
+    return order
+
+
+async def get_all_orders_async(
+    db: AsyncSession,
+    date: Optional[datetime] = None,
+    offset: int = 0,
+    limit: int = 100,
+    sort_by: Optional[str] = "order_date",
+    sort_order: Optional[str] = "asc",
+    cursor: Optional[str] = None,
+    fields: Optional[tuple] = None,
+    filters: Optional[list] = None
+):
+    try:
+        # alleen de gevraagde kolommen, JSON kolommen als tekst voor orm_response (deferred)
+        query = select(Order).options(*load_fields(Order, fields, sort_by)).filter(Order.is_deleted == False)
+        if date is not None:
+            query = query.filter(*order_date_range(date))
+        query = apply_filters(query, Order, filters)
+        if cursor is not None:
+            query = apply_keyset(query, Order, sort_by, sort_order, cursor)
+        else:
+            if sort_by:
+                query = apply_sorting(query, Order, sort_by, sort_order)
+            query = query.offset(offset)
+        return (await db.execute(query.limit(limit))).scalars().all()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except SQLAlchemyError:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while retrieving orders."
+        )
+
+
 def update_order(db: Session, id: int, order_data: OrderUpdate):
     order = db.query(Order).filter(Order.id == id).first()
     if not order:
@@ -107,16 +334,18 @@ def update_order(db: Session, id: int, order_data: OrderUpdate):
         raise HTTPException(status_code=403, detail="Unable to change order status back from Delivered")
 
     if update_data.get("order_status") == "Delivered" and old_status != "Delivered":
-        for item_dict in order.items:
-            inventory = db.query(Inventory).filter(Inventory.item_id == item_dict["item_id"], Inventory.is_deleted == 0).first()
-            if not inventory:
-                raise HTTPException(status_code=404, detail=f"No inventory exists for item {item_dict['item_id']} in the given order")
-            inventory.total_ordered -= item_dict["amount"]
-            inventory.total_on_hand -= item_dict["amount"]
-            inventory.updated_at = datetime.now()
+        check_order_inventory(db, order.id)
+        adjust_order_inventory(db, order.id, total_ordered=-1, total_on_hand=-1)
 
+    # oude waarden eraf en nieuwe erbij, verwijderde orders tellen niet mee
+    rollup = {}
+    if not order.is_deleted:
+        add_to_rollup(rollup, order, -1)
     for key, value in update_data.items():
         setattr(order, key, value)
+    if not order.is_deleted:
+        add_to_rollup(rollup, order)
+    apply_rollup(db, rollup)
     order.updated_at = datetime.utcnow()
     try:
         db.commit()
@@ -136,27 +365,19 @@ def update_order(db: Session, id: int, order_data: OrderUpdate):
 
 
 def delete_order(db: Session, id: int):
-    order = db.query(Order).filter(Order.id == id, Order.is_deleted == 0).first()
+    order = db.query(Order).filter(Order.id == id, Order.is_deleted == False).first()
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
 
     # bij delete de voorraaden terug veranderen
+    check_order_inventory(db, order.id)
     if order.order_status != "Delivered":
-        for item_dict in order.items:
-            inventory = db.query(Inventory).filter(Inventory.item_id == item_dict['item_id'], Inventory.is_deleted == 0).first()
-            if not inventory:
-                raise HTTPException(status_code=404, detail=f"No inventory exists for item {item_dict['item_id']} in the given order")
-            inventory.total_ordered -= item_dict["amount"]
-            inventory.total_available += item_dict["amount"]
-            inventory.updated_at = datetime.now()
+        adjust_order_inventory(db, order.id, total_ordered=-1, total_available=1)
     else:
-        for item_dict in order.items:
-            inventory = db.query(Inventory).filter(Inventory.item_id == item_dict['item_id'], Inventory.is_deleted == 0).first()
-            if not inventory:
-                raise HTTPException(status_code=404, detail=f"No inventory exists for item {item_dict['item_id']} in the given order")
-            inventory.total_available += item_dict["amount"]
-            inventory.total_on_hand += item_dict["amount"]
-            inventory.updated_at = datetime.now()
+        adjust_order_inventory(db, order.id, total_available=1, total_on_hand=1)
+    rollup = {}
+    add_to_rollup(rollup, order, -1)
+    apply_rollup(db, rollup)
 
     try:
         order.is_deleted = True  # Soft delete by updating the flag
@@ -171,7 +392,7 @@ def delete_order(db: Session, id: int):
 
 
 def get_items_in_order(db: Session, id: int):
-    order = db.query(Order).filter(Order.id == id, Order.is_deleted == 0).first()
+    order = db.query(Order).filter(Order.id == id, Order.is_deleted == False).first()
     if not order or not order.items:
         raise HTTPException(
             status_code=404, detail="No items found for this order"
@@ -212,7 +433,7 @@ def get_packinglist_for_order(db: Session, order_id: int):
 
 
 def get_shipments_by_order_id(db: Session, order_id: int):
-    order = db.query(Order).filter(Order.id == order_id, Order.is_deleted == 0).first()
+    order = db.query(Order).filter(Order.id == order_id, Order.is_deleted == False).first()
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
 
@@ -220,7 +441,7 @@ def get_shipments_by_order_id(db: Session, order_id: int):
     if not shipment_ids:
         raise HTTPException(status_code=404, detail="No shipment IDs found in the order")
 
-    shipments = db.query(Shipment).filter(Shipment.id.in_(shipment_ids), Shipment.is_deleted == 0).all()
+    shipments = db.query(Shipment).filter(Shipment.id.in_(shipment_ids), Shipment.is_deleted == False).all()
     if not shipments:
         raise HTTPException(status_code=404, detail="No shipments found for the given order")
 
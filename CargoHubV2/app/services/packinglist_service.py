@@ -1,72 +1,122 @@
-import io
-import os
 import json
 import pdfkit
-import base64
-import matplotlib.pyplot as plt
 
 from pathlib import Path
-from jinja2 import Template
-from itertools import chain
-from datetime import datetime
-from sqlalchemy import extract
+from typing import List, Optional
 from sqlalchemy.orm import Session
-from fastapi import HTTPException, status, FastAPI
+from fastapi import HTTPException
 from CargoHubV2.app.models.orders_model import Order
-from fastapi.responses import FileResponse, JSONResponse
+from CargoHubV2.app.services import job_service, template_service
+from CargoHubV2.app.services.template_service import timed
 
 
+# wordt aangemaakt bij de eerste PDF (job_service.render_to_file)
 PDF_DIR = Path("generated_pdfs")
-PDF_DIR.mkdir(exist_ok=True)
 
-TEMPLATE_FILE = Path(os.path.dirname(__file__)).parent / "packinglist_template.html"
+
+# maximaal aantal orders per wave, een wave wordt een PDF
+WAVE_MAX_ORDERS = 1000
+
+
+def format_date(value) -> str:
+    # request_date mag NULL zijn, dan een leeg veld op de packing list
+    return value.strftime("%Y-%m-%d") if value else ""
+
+
+def packing_list_content(order: Order) -> dict:
+    # Parse the items data from the order
+    try:
+        items = json.loads(order.items) if isinstance(order.items, str) else order.items
+        if not isinstance(items, list):
+            raise ValueError("Items should be a list of dictionaries with 'item_id' and 'amount'.")
+    except json.JSONDecodeError:
+        raise ValueError("Failed to decode order items. Ensure items are in valid JSON format.")
+
+    total_amount = sum(item["amount"] for item in items)
+
+    # Prepare data for the packing list
+    return {
+        "warehouse_id": order.warehouse_id,
+        "source_id": order.source_id,
+        "shipping_notes": order.shipping_notes,
+        "order_date": format_date(order.order_date),
+        "order_id": order.id,
+        "request_date": format_date(order.request_date),
+        "total_items": len(items),
+        "total_amount": total_amount,
+        "items": [{"item_id": item["item_id"], "amount": item["amount"]} for item in items],  # Simplified item list
+    }
 
 
 def generate_packing_list(order: Order):
     try:
-        # Parse the items data from the order
-        try:
-            items = json.loads(order.items) if isinstance(order.items, str) else order.items
-            if not isinstance(items, list):
-                raise ValueError("Items should be a list of dictionaries with 'item_id' and 'amount'.")
-        except json.JSONDecodeError:
-            raise ValueError("Failed to decode order items. Ensure items are in valid JSON format.")
-        
-
-        total_amount = sum(item["amount"] for item in items)
-        
-        # Prepare data for the packing list
-        content = {
-            "warehouse_id": order.warehouse_id,
-            "source_id": order.source_id,
-            "shipping_notes": order.shipping_notes,
-            "order_date": order.order_date.strftime("%Y-%m-%d"),
-            "order_id": order.id,
-            "request_date": order.request_date.strftime("%Y-%m-%d"),
-            "total_items": len(items),
-            "total_amount": total_amount,
-            "items": [{"item_id": item["item_id"], "amount": item["amount"]} for item in items],  # Simplified item list
-        }
-
-        # Load the packing list template
-        with open(TEMPLATE_FILE, "r") as file:
-            html_template = file.read()
-
-        # Render the template
-        template = Template(html_template)
-        html_content = template.render(**content)
-
-        # Define PDF file path
-        pdf_filename = f"packinglist_order_{order.id}.pdf"
-        pdf_path = PDF_DIR / pdf_filename
-
-        # Generate PDF
-        pdfkit.from_string(html_content, str(pdf_path))
-
-        # Return the file URL or file path
-        pdf_url = f"http://127.0.0.1:3000/api/v2/packinglist/get-pdf/{pdf_filename}"
-        return JSONResponse({"message": "Packing list PDF generated successfully.", "pdf_url": pdf_url})
+        content = {"orders": [packing_list_content(order)]}
+        return job_service.queue_pdf(
+            render_packing_list, content, PDF_DIR, f"packinglist_order_{order.id}",
+            "http://127.0.0.1:3000/api/v2/packinglist/get-pdf", "Packing list PDF generated successfully.")
+    except HTTPException:
+        raise
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=str(ve))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating packing list PDF, {e}")
+
+
+def get_wave_orders(
+        db: Session,
+        order_ids: Optional[List[int]] = None,
+        warehouse_id: Optional[int] = None,
+        order_status: Optional[str] = None):
+    # alle orders van de wave in een query, de regels komen er via selectin in een tweede bij
+    query = db.query(Order).filter(Order.is_deleted == False)
+    if order_ids:
+        query = query.filter(Order.id.in_(set(order_ids)))
+    elif warehouse_id is not None:
+        query = query.filter(Order.warehouse_id == warehouse_id)
+        if order_status:
+            query = query.filter(Order.order_status == order_status)
+    else:
+        raise HTTPException(status_code=400, detail="Give order_ids or a warehouse_id for the wave")
+    orders = query.order_by(Order.id).limit(WAVE_MAX_ORDERS + 1).all()
+
+    if len(orders) > WAVE_MAX_ORDERS:
+        raise HTTPException(status_code=400, detail=f"A wave can have at most {WAVE_MAX_ORDERS} orders")
+    if not order_ids:
+        if not orders:
+            raise HTTPException(status_code=404, detail="No orders found for this wave")
+        return orders
+    found = {order.id: order for order in orders}
+    missing = [id for id in dict.fromkeys(order_ids) if id not in found]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Orders not found: {missing}")
+    # in de volgorde van de aanvraag, dat is de volgorde waarin gepickt wordt
+    return [found[id] for id in dict.fromkeys(order_ids)]
+
+
+def generate_wave_packing_list(
+        db: Session,
+        order_ids: Optional[List[int]] = None,
+        warehouse_id: Optional[int] = None,
+        order_status: Optional[str] = None):
+    orders = get_wave_orders(db, order_ids, warehouse_id, order_status)
+    try:
+        content = {"orders": [packing_list_content(order) for order in orders]}
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+    # een PDF per wave, de versie van dezelfde wave wordt vervangen als een order verandert
+    wave = job_service.content_version({"order_ids": order_ids, "warehouse_id": warehouse_id,
+                                        "order_status": order_status})
+    return job_service.queue_pdf(
+        render_packing_list, content, PDF_DIR, f"packinglist_wave_{wave}",
+        "http://127.0.0.1:3000/api/v2/packinglist/get-pdf", "Wave packing list PDF generated successfully.")
+
+
+def render_packing_list(content: dict, pdf_path: str) -> dict:
+    # draait in een job_service worker, niet in het request
+    # een HTML document en een wkhtmltopdf aanroep, ook voor een hele wave
+    timing = {}
+    with timed(timing, "render"):
+        html_content = template_service.render("packinglist_template.html", **content)
+    with timed(timing, "pdf"):
+        pdfkit.from_string(html_content, pdf_path)
+    return timing
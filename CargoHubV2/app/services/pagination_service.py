@@ -0,0 +1,119 @@
+import json
+import base64
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import and_, or_, inspect, literal
+from sqlalchemy.orm import Query
+from fastapi import HTTPException, Response
+
+# header waarin list endpoints de cursor voor de volgende pagina teruggeven
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+CURSOR_DESCRIPTION = (
+    "Keyset pagination cursor. Pass an empty value to start, the next cursor is returned in the "
+    f"{NEXT_CURSOR_HEADER} header. Without a cursor offset pagination is used."
+)
+
+
+def keyset_columns(model, sort_by: Optional[str]):
+    # sorteer kolom + primary key als tiebreaker, net als apply_sorting gevalideerd
+    mapper = inspect(model)
+    primary_key = mapper.primary_key[0]
+    sort_by = sort_by or primary_key.key
+    if not hasattr(model, sort_by):
+        raise HTTPException(status_code=400, detail=f"Invalid sort attribute: {sort_by}")
+    if sort_by not in mapper.columns:
+        raise HTTPException(status_code=400, detail=f"Cannot paginate by cursor on: {sort_by}")
+    return getattr(model, sort_by), getattr(model, primary_key.key)
+
+
+def encode_value(value):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def decode_value(value):
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(sort_by: str, order: str, value, key) -> str:
+    payload = json.dumps({"s": sort_by, "o": order, "v": encode_value(value), "k": key}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return {"sort_by": payload["s"], "order": payload["o"], "value": decode_value(payload["v"]), "key": payload["k"]}
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def apply_keyset(query: Query, model, sort_by: Optional[str], order: Optional[str], cursor: str) -> Query:
+    # WHERE (kolom, pk) > (waarde, key) i.p.v. OFFSET, zodat diepe pagina's even snel zijn
+    column, primary_key = keyset_columns(model, sort_by)
+    descending = order == "desc"
+    on_primary_key = column.key == primary_key.key
+    nullable = not on_primary_key and column.property.columns[0].nullable
+    if on_primary_key:
+        query = query.order_by(column.desc() if descending else column.asc())
+    elif not nullable:
+        query = query.order_by(column.desc() if descending else column.asc(), primary_key.asc())
+    # NULL geldt als kleinste waarde, ongeacht de database
+    elif descending:
+        query = query.order_by(column.desc().nulls_last(), primary_key.asc())
+    else:
+        query = query.order_by(column.asc().nulls_first(), primary_key.asc())
+    if not cursor:
+        return query
+
+    position = decode_cursor(cursor)
+    if position["sort_by"] != column.key or position["order"] != ("desc" if descending else "asc"):
+        raise HTTPException(status_code=400, detail="Cursor does not match sort_by/order")
+    value, key = position["value"], position["key"]
+    if value is not None:
+        # als parameter binden, anders weigert SQLAlchemy < en > met True/False
+        value = literal(value, column.type)
+
+    if on_primary_key:
+        return query.filter(column < key if descending else column > key)
+    if not nullable:
+        # de extra >= / <= grens laat de database op de index zoeken i.p.v. alles te scannen
+        if descending:
+            return query.filter(column <= value, or_(column < value, primary_key > key))
+        return query.filter(column >= value, or_(column > value, primary_key > key))
+
+    if value is None:
+        same_value = column.is_(None)
+        after = column.is_(None) if descending else column.isnot(None)
+        if descending:
+            return query.filter(and_(same_value, primary_key > key))
+        return query.filter(or_(after, and_(same_value, primary_key > key)))
+
+    beyond = column < value if descending else column > value
+    condition = or_(beyond, and_(column == value, primary_key > key))
+    if descending:
+        condition = or_(condition, column.is_(None))
+    return query.filter(condition)
+
+
+def next_cursor(rows: list, sort_by: Optional[str], order: Optional[str], limit: int) -> Optional[str]:
+    # alleen een volgende pagina als deze vol is
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    column, primary_key = keyset_columns(type(last), sort_by)
+    return encode_cursor(column.key, "desc" if order == "desc" else "asc",
+                         getattr(last, column.key), getattr(last, primary_key.key))
+
+
+def set_next_cursor(response: Response, rows: list, sort_by: Optional[str], order: Optional[str], limit: int,
+                    cursor: Optional[str]):
+    if cursor is None:
+        return
+    cursor = next_cursor(rows, sort_by, order, limit)
+    if cursor:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
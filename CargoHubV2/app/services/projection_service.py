@@ -0,0 +1,45 @@
+from typing import Optional
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only, noload
+from fastapi import HTTPException
+from CargoHubV2.app.services.response_service import response_fields, json_text_columns, json_as_text
+
+FIELDS_DESCRIPTION = (
+    "Comma separated list of fields to return, for example id,order_status. "
+    "Only these columns are selected. Without fields all fields are returned."
+)
+
+
+def parse_fields(fields: Optional[str], schema) -> Optional[tuple]:
+    # "id,order_status" -> ("id", "order_status"), alleen velden die het response schema (of model) kent
+    if not fields:
+        return None
+    names = tuple(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    allowed = response_fields(schema)
+    for name in names:
+        if name not in allowed:
+            raise HTTPException(status_code=400, detail=f"Invalid field: {name}")
+    return names or None
+
+
+def load_fields(model, fields: Optional[tuple] = None, sort_by: Optional[str] = None) -> list:
+    # loader options voor een list query: zonder fields alle kolommen (JSON als tekst),
+    # met fields alleen die kolommen in de SELECT (load_only)
+    if not fields:
+        return json_as_text(model)
+
+    mapper = inspect(model)
+    for name in fields:
+        # net als apply_sorting: de naam moet op het model bestaan
+        if not hasattr(model, name):
+            raise HTTPException(status_code=400, detail=f"Invalid field: {name}")
+
+    text_keys = [key for key in json_text_columns(model) if key in fields]
+    # primary key en sorteer kolom altijd laden, nodig voor de identity map en next_cursor
+    keys = dict.fromkeys([mapper.primary_key[0].key, *fields, *([sort_by] if sort_by else [])])
+    columns = [getattr(model, key) for key in keys if key in mapper.columns and key not in text_keys]
+    options = [load_only(*columns), *json_as_text(model, text_keys)]
+    # velden die geen kolom zijn (zoals Order.items) komen uit een relatie, anders geen relaties laden
+    if all(name in mapper.columns for name in fields):
+        options += [noload(relationship) for relationship in mapper.relationships]
+    return options
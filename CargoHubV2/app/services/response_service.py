@@ -0,0 +1,70 @@
+import orjson
+from functools import lru_cache
+from typing import Optional
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import JSON, Text, cast, inspect
+from sqlalchemy.orm import defer, with_expression
+
+# achter de naam van een JSON kolom: het query_expression attribuut met de tekst (zie json_as_text)
+JSON_TEXT_SUFFIX = "_json"
+
+
+@lru_cache(maxsize=None)
+def response_fields(schema) -> tuple:
+    # veldnamen van een *Response schema, een keer per schema opgezocht;
+    # routes zonder response schema geven het model mee, dan zijn het alle kolommen
+    if hasattr(schema, "model_fields"):
+        return tuple(schema.model_fields)
+    return tuple(column.key for column in inspect(schema).columns)
+
+
+@lru_cache(maxsize=None)
+def json_text_columns(model) -> tuple:
+    # JSON kolommen met een <kolom>_json query_expression op het model
+    return tuple(
+        column.key for column in model.__table__.columns
+        if isinstance(column.type, JSON) and hasattr(model, column.key + JSON_TEXT_SUFFIX)
+    )
+
+
+def json_as_text(model, keys=None) -> list:
+    # loader options: de JSON kolommen (of alleen keys) als tekst ophalen i.p.v. json.loads per rij,
+    # orm_response zet die tekst ongewijzigd in de response
+    options = []
+    for key in json_text_columns(model) if keys is None else keys:
+        column = getattr(model, key)
+        options.append(defer(column))
+        options.append(with_expression(getattr(model, key + JSON_TEXT_SUFFIX), cast(column, Text)))
+    return options
+
+
+def to_content(obj, fields: tuple) -> dict:
+    content = {}
+    for field in fields:
+        key = field + JSON_TEXT_SUFFIX
+        if key in obj.__dict__:
+            # geladen via json_as_text, de kolom zelf is deferred en wordt niet aangeraakt
+            # (lazy load werkt niet op een AsyncSession), SQL NULL wordt null
+            text = obj.__dict__[key]
+            content[field] = orjson.Fragment(text) if text is not None else None
+        else:
+            content[field] = getattr(obj, field)
+    return content
+
+
+def orm_response(content, schema, response: Optional[Response] = None, status_code: int = 200,
+                 fields: Optional[tuple] = None) -> ORJSONResponse:
+    # ORM objecten direct naar orjson, zonder jsonable_encoder en zonder de response te valideren
+    # (het response_model van de route is alleen nog documentatie)
+    # fields: alleen deze velden van het schema (zie projection_service.parse_fields)
+    fields = fields or response_fields(schema)
+    if isinstance(content, list):
+        body = [to_content(obj, fields) for obj in content]
+    else:
+        body = to_content(content, fields)
+    result = ORJSONResponse(body, status_code=status_code)
+    if response is not None:
+        # headers die de route zelf op response zette, bijv. de next cursor
+        result.raw_headers.extend(response.raw_headers)
+    return result
@@ -0,0 +1,85 @@
+from datetime import date
+from typing import Optional
+from sqlalchemy import select, delete, func, insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from CargoHubV2.app.models.orders_model import Order
+from CargoHubV2.app.models.order_lines_model import OrderLine
+from CargoHubV2.app.models.daily_order_rollup_model import DailyOrderRollup
+
+ROLLUP_FIELDS = ("orders_done", "items_sold", "total_revenue", "total_discount", "total_tax", "total_surcharge")
+
+
+def order_figures(order: Order) -> dict:
+    return {
+        "orders_done": 1,
+        "items_sold": sum(line.amount for line in order.lines),
+        "total_revenue": order.total_amount or 0,
+        "total_discount": order.total_discount or 0,
+        "total_tax": order.total_tax or 0,
+        "total_surcharge": order.total_surcharge or 0,
+    }
+
+
+def add_to_rollup(rollup: dict, order: Order, sign: int = 1):
+    # sign -1 haalt de order er weer af (delete, of de oude waarden bij een update)
+    row = rollup.setdefault(
+        (order.warehouse_id, order.order_date.date()), dict.fromkeys(ROLLUP_FIELDS, 0))
+    for field, value in order_figures(order).items():
+        row[field] += sign * value
+
+
+def apply_rollup(db: Session, rollup: dict):
+    rows = [
+        {"warehouse_id": warehouse_id, "day": day, **figures}
+        for (warehouse_id, day), figures in rollup.items() if any(figures.values())
+    ]
+    if not rows:
+        return
+    # upsert per (warehouse, dag), wordt gecommit samen met de order(s)
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    table = DailyOrderRollup.__table__
+    stmt = dialect.insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.warehouse_id, table.c.day],
+        set_={field: table.c[field] + stmt.excluded[field] for field in ROLLUP_FIELDS},
+    )
+    db.execute(stmt, rows)
+
+
+def rebuild_rollup(db: Session, start: Optional[date] = None, end: Optional[date] = None) -> int:
+    # opnieuw opbouwen uit orders + order_lines, voor de dagen start <= dag < end (of alles)
+    table = DailyOrderRollup.__table__
+    day = func.date(Order.order_date)
+    items_per_order = (
+        select(func.sum(OrderLine.amount))
+        .where(OrderLine.order_id == Order.id)
+        .correlate(Order)
+        .scalar_subquery()
+    )
+    query = (
+        select(
+            Order.warehouse_id,
+            day,
+            func.count(Order.id),
+            func.coalesce(func.sum(items_per_order), 0),
+            func.coalesce(func.sum(Order.total_amount), 0),
+            func.coalesce(func.sum(Order.total_discount), 0),
+            func.coalesce(func.sum(Order.total_tax), 0),
+            func.coalesce(func.sum(Order.total_surcharge), 0),
+        )
+        .where(Order.is_deleted == False)
+        .group_by(Order.warehouse_id, day)
+    )
+    clear = delete(table)
+    if start is not None:
+        query = query.where(Order.order_date >= start)
+        clear = clear.where(table.c.day >= start)
+    if end is not None:
+        query = query.where(Order.order_date < end)
+        clear = clear.where(table.c.day < end)
+
+    db.execute(clear)
+    db.execute(insert(table).from_select(["warehouse_id", "day", *ROLLUP_FIELDS], query))
+    db.commit()
+    return db.query(func.count()).select_from(table).scalar()
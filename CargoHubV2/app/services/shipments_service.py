@@ -1,16 +1,30 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from CargoHubV2.app.models.shipments_model import Shipment
+from CargoHubV2.app.models.shipment_item_index_model import ShipmentItemIndex
 from CargoHubV2.app.models.orders_model import Order
 from CargoHubV2.app.schemas.shipments_schema import ShipmentCreate, ShipmentUpdate, ShipmentOrderUpdate
 from fastapi import HTTPException, status
 from datetime import datetime
 from typing import List, Optional
 from CargoHubV2.app.services.sorting_service import apply_sorting
+from CargoHubV2.app.services.filtering_service import apply_filters
+from CargoHubV2.app.services.pagination_service import apply_keyset
+from CargoHubV2.app.services.projection_service import load_fields
+
+
+def index_shipment_items(shipment: Shipment):
+    # reverse index item -> shipment bijwerken, wordt in dezelfde commit als de shipment weggeschreven
+    item_uids = dict.fromkeys(item["item_id"] for item in shipment.items or [])
+    current = {row.item_uid: row for row in shipment.item_index}
+    shipment.item_index = [current.get(item_uid) or ShipmentItemIndex(item_uid=item_uid) for item_uid in item_uids]
 
 
 def create_shipment(db: Session, shipment_data: dict):
     shipment = Shipment(**shipment_data)
+    index_shipment_items(shipment)
     db.add(shipment)
     try:
         db.commit()
@@ -33,7 +47,7 @@ def create_shipment(db: Session, shipment_data: dict):
 def get_shipment(db: Session, shipment_id: int):
     try:
         shipment = db.query(Shipment).filter(
-            Shipment.id == shipment_id, Shipment.is_deleted == 0
+            Shipment.id == shipment_id, Shipment.is_deleted == False
         ).first()
         if not shipment:
             raise HTTPException(status_code=404, detail="Shipment not found")
@@ -50,10 +64,15 @@ def get_all_shipments(
     offset: int = 0,
     limit: int = 100,
     sort_by: Optional[str] = "id",
-    order: Optional[str] = "asc"
+    order: Optional[str] = "asc",
+    cursor: Optional[str] = None,
+    filters: Optional[list] = None
 ):
     try:
         query = db.query(Shipment).filter(Shipment.is_deleted == False)
+        query = apply_filters(query, Shipment, filters)
+        if cursor is not None:
+            return apply_keyset(query, Shipment, sort_by, order, cursor).limit(limit).all()
         if sort_by:
             query = apply_sorting(query, Shipment, sort_by, order)
         return query.offset(offset).limit(limit).all()
@@ -67,6 +86,51 @@ def get_all_shipments(
 
 
 
+async def get_shipment_async(db: AsyncSession, shipment_id: int):
+    try:
+        shipment = (await db.execute(select(Shipment).filter(
+            Shipment.id == shipment_id, Shipment.is_deleted == False
+        ))).scalars().first()
+        if not shipment:
+            raise HTTPException(status_code=404, detail="Shipment not found")
+        return shipment
+    except SQLAlchemyError:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while retrieving the shipment."
+        )
+
+
+async def get_all_shipments_async(
+    db: AsyncSession,
+    offset: int = 0,
+    limit: int = 100,
+    sort_by: Optional[str] = "id",
+    order: Optional[str] = "asc",
+    cursor: Optional[str] = None,
+    fields: Optional[tuple] = None,
+    filters: Optional[list] = None
+):
+    try:
+        # alleen de gevraagde kolommen, JSON kolommen als tekst voor orm_response (deferred)
+        query = select(Shipment).options(*load_fields(Shipment, fields, sort_by)).filter(Shipment.is_deleted == False)
+        query = apply_filters(query, Shipment, filters)
+        if cursor is not None:
+            query = apply_keyset(query, Shipment, sort_by, order, cursor)
+        else:
+            if sort_by:
+                query = apply_sorting(query, Shipment, sort_by, order)
+            query = query.offset(offset)
+        return (await db.execute(query.limit(limit))).scalars().all()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except SQLAlchemyError:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while retrieving shipments."
+        )
+
+
 def delete_shipment(db: Session, shipment_id: int):
     try:
         shipment = db.query(Shipment).filter(
@@ -96,6 +160,8 @@ def update_shipment(db: Session, shipment_id: int, shipment_data: ShipmentUpdate
         update_data = shipment_data.model_dump(exclude_unset=True)
         for key, value in update_data.items():
             setattr(shipment, key, value)
+        if "items" in update_data:
+            index_shipment_items(shipment)
         shipment.updated_at = datetime.now()
         db.commit()
         db.refresh(shipment)
@@ -2,6 +2,9 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from CargoHubV2.app.models.suppliers_model import Supplier
 from CargoHubV2.app.services.sorting_service import apply_sorting
+from CargoHubV2.app.services.filtering_service import apply_filters
+from CargoHubV2.app.services.projection_service import load_fields
+from CargoHubV2.app.services.pagination_service import apply_keyset
 
 from CargoHubV2.app.models.items_model import Item
 from CargoHubV2.app.schemas.suppliers_schema import SuppliersCreate, SuppliersUpdate
@@ -56,10 +59,18 @@ def get_all_suppliers(
     offset: int = 0,
     limit: int = 100,
     sort_by: Optional[str] = "id",
-    order: Optional[str] = "asc"
+    order: Optional[str] = "asc",
+    cursor: Optional[str] = None,
+    fields: Optional[tuple] = None,
+    filters: Optional[list] = None
 ):
     try:
         query = db.query(Supplier).filter(Supplier.is_deleted == False)
+        query = apply_filters(query, Supplier, filters)
+        if fields:
+            query = query.options(*load_fields(Supplier, fields, sort_by))
+        if cursor is not None:
+            return apply_keyset(query, Supplier, sort_by, order, cursor).limit(limit).all()
         if sort_by:
             query = apply_sorting(query, Supplier, sort_by, order)
         return query.offset(offset).limit(limit).all()
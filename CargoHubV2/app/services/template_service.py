@@ -0,0 +1,32 @@
+import time
+from pathlib import Path
+from contextlib import contextmanager
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, select_autoescape
+from CargoHubV2.app import config
+
+# report_template.html en packinglist_template.html staan in app/
+TEMPLATE_DIR = Path(__file__).parent.parent
+
+# een environment per process: templates worden een keer gecompileerd en daarna uit de cache gehaald
+environment = Environment(
+    loader=FileSystemLoader(TEMPLATE_DIR),
+    # alleen in development kijken of de file op disk veranderd is
+    auto_reload=config.TEMPLATE_AUTO_RELOAD,
+    # nieuwe worker processen hoeven de templates niet opnieuw te compileren
+    bytecode_cache=FileSystemBytecodeCache(config.TEMPLATE_CACHE_DIR),
+    autoescape=select_autoescape(["html"]),
+)
+
+
+def render(name: str, **context) -> str:
+    return environment.get_template(name).render(**context)
+
+
+@contextmanager
+def timed(timing: dict, stage: str):
+    # ms per stap (charts, render, pdf), wordt door job_service gelogd
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing[stage] = (time.perf_counter() - start) * 1000
@@ -2,6 +2,9 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from fastapi import HTTPException, status
 from CargoHubV2.app.services.sorting_service import apply_sorting
+from CargoHubV2.app.services.filtering_service import apply_filters
+from CargoHubV2.app.services.projection_service import load_fields
+from CargoHubV2.app.services.pagination_service import apply_keyset
 
 from CargoHubV2.app.models.transfers_model import Transfer
 from CargoHubV2.app.schemas.transfers_schema import TransferCreate, TransferUpdate
@@ -49,10 +52,19 @@ def get_all_transfers(
     offset: int = 0,
     limit: int = 100,
     sort_by: Optional[str] = "id",
-    order: Optional[str] = "asc"
+    order: Optional[str] = "asc",
+    cursor: Optional[str] = None,
+    fields: Optional[tuple] = None,
+    filters: Optional[list] = None
 ):
     try:
         query = db.query(Transfer).filter(Transfer.is_deleted == False)
+        query = apply_filters(query, Transfer, filters)
+        if fields:
+            # alleen de gevraagde kolommen (items is JSON)
+            query = query.options(*load_fields(Transfer, fields, sort_by))
+        if cursor is not None:
+            return apply_keyset(query, Transfer, sort_by, order, cursor).limit(limit).all()
         if sort_by:
             query = apply_sorting(query, Transfer, sort_by, order)
         return query.offset(offset).limit(limit).all()
@@ -3,6 +3,9 @@ from CargoHubV2.app.models.warehouses_model import Warehouse
 from CargoHubV2.app.schemas.warehouses_schema import WarehouseCreate, WarehouseResponse
 from datetime import datetime
 from CargoHubV2.app.services.sorting_service import apply_sorting
+from CargoHubV2.app.services.filtering_service import apply_filters
+from CargoHubV2.app.services.pagination_service import apply_keyset
+from CargoHubV2.app.services.projection_service import load_fields
 from fastapi import HTTPException, status
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from typing import Optional
@@ -14,10 +17,19 @@ def get_all_warehouses(
     offset: int = 0,
     limit: int = 100,
     sort_by: Optional[str] = "id",
-    order: Optional[str] = "asc"
+    order: Optional[str] = "asc",
+    cursor: Optional[str] = None,
+    fields: Optional[tuple] = None,
+    filters: Optional[list] = None
 ):
     try:
         query = db.query(Warehouse).filter(Warehouse.is_deleted == False)
+        query = apply_filters(query, Warehouse, filters)
+        if fields:
+            # alleen de gevraagde kolommen (contact en forbidden_classifications zijn JSON)
+            query = query.options(*load_fields(Warehouse, fields, sort_by))
+        if cursor is not None:
+            return apply_keyset(query, Warehouse, sort_by, order, cursor).limit(limit).all()
         if sort_by:
             query = apply_sorting(query, Warehouse, sort_by, order)
         return query.offset(offset).limit(limit).all()
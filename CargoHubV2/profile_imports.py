@@ -0,0 +1,59 @@
+"""
+Laat zien welke modules het opstarten van de app traag maken.
+
+Importeert de module in een nieuw python process met -X importtime en print
+de totale import tijd, de traagste modules (eigen tijd en inclusief wat ze
+zelf importeren) en welke zware dependencies mee geladen werden. Die horen
+pas bij het eerste gebruik geladen te worden (zie de report en packing list
+controllers), test_Unit_Startup controleert dat.
+
+    python -m CargoHubV2.profile_imports [module] [top]
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_MODULE = "CargoHubV2.app.main"
+# mogen niet bij het opstarten geladen worden
+HEAVY_MODULES = ("matplotlib", "numpy", "PIL", "pdfkit", "jinja2", "tqdm",
+                 "CargoHubV2.app.services.reporting_service",
+                 "CargoHubV2.app.services.packinglist_service",
+                 "CargoHubV2.app.services.chart_service",
+                 "CargoHubV2.app.services.template_service")
+
+
+def import_times(module: str = APP_MODULE) -> dict:
+    # nieuw process, anders staan de modules al in sys.modules
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True, check=True, cwd=ROOT)
+    times = {}
+    # regels: "import time: <self us> | <cumulative us> | <module>"
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        if own.strip().isdigit():
+            times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def heavy_imports(times: dict) -> list:
+    return [name for name in HEAVY_MODULES if name in times]
+
+
+def main():
+    module = sys.argv[1] if len(sys.argv) > 1 else APP_MODULE
+    top = int(sys.argv[2]) if len(sys.argv) > 2 else 15
+    times = import_times(module)
+
+    print(f"import {module}: {times[module][1] / 1000:.0f} ms, {len(times)} modules")
+    for title, column in (("self", 0), ("cumulative", 1)):
+        print(f"\nslowest modules ({title})")
+        for name, timing in sorted(times.items(), key=lambda entry: entry[1][column], reverse=True)[:top]:
+            print(f"{timing[column] / 1000:>9.1f} ms  {name}")
+    print(f"\nheavy modules loaded: {', '.join(heavy_imports(times)) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
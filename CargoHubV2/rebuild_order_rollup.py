@@ -0,0 +1,31 @@
+"""
+Bouwt daily_order_rollup opnieuw op uit orders en order_lines.
+
+Nodig na imports die de orders tabel direct vullen, of om afwijkingen te
+herstellen. Zonder argumenten wordt alles opnieuw opgebouwd, anders alleen
+de dagen start <= dag < end.
+
+    python -m CargoHubV2.rebuild_order_rollup [start YYYY-MM-DD] [end YYYY-MM-DD]
+"""
+import sys
+import time
+from datetime import date
+
+from CargoHubV2.app.database import SessionLocal
+from CargoHubV2.app.services.rollup_service import rebuild_rollup
+
+
+def main():
+    start = date.fromisoformat(sys.argv[1]) if len(sys.argv) > 1 else None
+    end = date.fromisoformat(sys.argv[2]) if len(sys.argv) > 2 else None
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        rows = rebuild_rollup(db, start, end)
+        print(f"daily_order_rollup rebuilt, {rows} rows in {time.perf_counter() - started:.2f}s")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
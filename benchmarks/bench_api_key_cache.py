@@ -0,0 +1,68 @@
+"""
+Benchmark voor de api key cache in auth_service.
+
+Seedt duizenden api keys in de api_keys tabel en doet lookups met een mix van
+bekende en onbekende keys. Rapporteert de hit ratio (via de metrics hook) en
+de lookup latency met en zonder cache.
+
+    python benchmarks/bench_api_key_cache.py [keys] [lookups]
+"""
+import os
+import random
+import statistics
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert  # noqa: E402
+
+from benchmarks.bench_utils import temp_engine, session_factory  # noqa: E402
+from CargoHubV2.app.models import APIKey  # noqa: E402
+from CargoHubV2.app.services import auth_service  # noqa: E402
+
+ROLES = ["warehouse_manager", "floor_manager", "employee"]
+
+
+def main(keys: int = 5000, lookups: int = 100_000):
+    engine, path = temp_engine()
+    try:
+        with engine.begin() as conn:
+            conn.execute(insert(APIKey.__table__), [
+                {"key": f"client-{i}", "role": ROLES[i % 3], "permissions": {}, "is_active": True,
+                 "created_at": datetime.now()}
+                for i in range(keys)
+            ])
+        Session = session_factory(engine)
+        rng = random.Random(1)
+        # 10% onbekende keys, die moeten negatief gecached worden
+        sample = [f"client-{rng.randrange(keys)}" if rng.random() < 0.9 else f"bogus-{rng.randrange(500)}"
+                  for _ in range(lookups)]
+
+        latencies = {"api_key.lookup_seconds": [], "api_key.cache_hit_ratio": []}
+        auth_service.set_metrics_hook(lambda name, value: latencies[name].append(value))
+        for key in sample:
+            auth_service.resolve_role(key, Session)
+        stats = auth_service.cache_stats()
+
+        uncached = []
+        db = Session()
+        for key in sample[:2000]:
+            start = datetime.now()
+            auth_service.fetch_role(db, key)
+            uncached.append((datetime.now() - start).total_seconds())
+        db.close()
+
+        lookup = sorted(latencies["api_key.lookup_seconds"])
+        print(f"lookups: {stats['hits'] + stats['misses']}, hit ratio {stats['hit_ratio']:.3f}")
+        print(f"with cache:    p50 {lookup[len(lookup) // 2] * 1e6:>8.1f} us, "
+              f"p99 {lookup[int(len(lookup) * 0.99)] * 1e6:>8.1f} us")
+        print(f"database only: p50 {statistics.median(uncached) * 1e6:>8.1f} us")
+    finally:
+        auth_service.set_metrics_hook(None)
+        engine.dispose()
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
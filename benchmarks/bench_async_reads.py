@@ -0,0 +1,118 @@
+"""
+Concurrency benchmark voor de async lees endpoints.
+
+Vergelijkt de async endpoints (orders, inventories, shipments, locations)
+met sync kopieen van dezelfde handlers, zoals ze waren voor de async
+database laag. Beide draaien in dezelfde app (zelfde middleware) en worden
+met 50, 200 en 1000 gelijktijdige clients aangesproken via httpx.
+
+    python benchmarks/bench_async_reads.py [requests_per_level] [levels...]
+"""
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+from fastapi import APIRouter, Depends  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from benchmarks.bench_utils import temp_engine, seed, bench_client, item_uids, order_payload, json_payload  # noqa: E402
+from CargoHubV2.app.database import get_db  # noqa: E402
+from CargoHubV2.app.models import Location  # noqa: E402
+from CargoHubV2.app.services import orders_service, inventories_service, shipments_service, locations_service  # noqa: E402
+
+ASYNC_PATHS = ["/api/v2/orders/", "/api/v2/inventories/", "/api/v2/shipments/", "/api/v2/locations/"]
+SYNC_PATHS = ["/sync-bench/orders", "/sync-bench/inventories", "/sync-bench/shipments", "/sync-bench/locations"]
+
+
+def sync_router():
+    # de handlers zoals ze waren: sync def, blocking session, draait in de threadpool
+    router = APIRouter(prefix="/sync-bench")
+
+    @router.get("/orders")
+    def orders(limit: int = 20, db: Session = Depends(get_db)):
+        return orders_service.get_all_orders(db, limit=limit)
+
+    @router.get("/inventories")
+    def inventories(limit: int = 20, db: Session = Depends(get_db)):
+        return inventories_service.get_all_inventories(db, limit=limit)
+
+    @router.get("/shipments")
+    def shipments(limit: int = 20, db: Session = Depends(get_db)):
+        return shipments_service.get_all_shipments(db, limit=limit)
+
+    @router.get("/locations")
+    def locations(limit: int = 20, db: Session = Depends(get_db)):
+        return locations_service.get_all_locations(db, limit=limit)
+
+    return router
+
+
+def seed_reads(engine, client):
+    uids = item_uids(500)
+    for reference in range(100):
+        client.post("/api/v2/orders/", json=json_payload(order_payload(reference, 5, uids)))
+    now = datetime.now()
+    with engine.begin() as conn:
+        conn.execute(insert(Location.__table__), [
+            {"id": id, "warehouse_id": 1, "code": f"A.{id}.0", "name": f"Row {id}", "stock": [],
+             "created_at": now, "updated_at": now, "is_deleted": False}
+            for id in range(1, 101)
+        ])
+
+
+def percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def run_level(app, headers: dict, paths: list, clients: int, requests: int):
+    latencies, failures = [], 0
+    remaining = iter(range(requests))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=headers,
+                                 timeout=None) as client:
+        async def worker():
+            nonlocal failures
+            for n in remaining:
+                start = time.perf_counter()
+                response = await client.get(paths[n % len(paths)], params={"limit": 20})
+                latencies.append((time.perf_counter() - start) * 1000)
+                if response.status_code != 200:
+                    failures += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(clients)))
+        elapsed = time.perf_counter() - start
+    return requests / elapsed, percentile(latencies, 0.5), percentile(latencies, 0.99), failures
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    levels = [int(level) for level in sys.argv[2:]] or [50, 200, 1000]
+    engine, path = temp_engine()
+    try:
+        seed(engine, inventories=500)
+        client = bench_client(engine)
+        client.app.include_router(sync_router())
+        seed_reads(engine, client)
+        headers = dict(client.headers)
+
+        print(f"{requests} requests per level, 4 list endpoints, limit=20")
+        print(f"{'mode':>6} {'clients':>8} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'failed':>7}")
+        for clients in levels:
+            for mode, paths in (("sync", SYNC_PATHS), ("async", ASYNC_PATHS)):
+                rate, p50, p99, failures = asyncio.run(run_level(client.app, headers, paths, clients, requests))
+                print(f"{mode:>6} {clients:>8} {rate:>9.0f} {p50:>9.1f} {p99:>9.1f} {failures:>7}")
+    finally:
+        engine.dispose()
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Load test voor geweigerde requests in de api key middleware.
+
+Vergelijkt de oude middleware (handler eerst uitvoeren, daarna substring
+checks) met de huidige (route tabel, weigeren voor de handler). Beide draaien
+met dezelfde routers tegen een geseede SQLite database.
+
+    python benchmarks/bench_auth_rejections.py [requests]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI, Request, HTTPException, Response  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from starlette.responses import JSONResponse  # noqa: E402
+
+from benchmarks.bench_utils import temp_engine, seed, bench_client, item_uids, order_payload, json_payload  # noqa: E402
+
+
+def legacy_app(app: FastAPI, warehouse_manager: str, floor_manager: str, employee: str):
+    # dezelfde routes, met de middleware zoals die voor de route tabel was
+    legacy = FastAPI()
+    legacy.router.routes.extend(app.router.routes)
+    legacy.dependency_overrides = app.dependency_overrides
+
+    @legacy.middleware("http")
+    async def api_key_middleware(request: Request, call_next):
+        excluded = ["/favicon.ico", "/openapi.json", "/docs"]
+        w_man_only = ["v2/reports", "v2/warehouses", "v2/clients", "v2/suppliers"]
+        all_managers = ["v2/item_groups", "v2/item_lines", "v2/item_types", "v2/items",
+                        "v2/shipments", "v2/docks"]
+        all = ["v2/locations", "v2/transfers", "v2/orders", "v2/inventories",
+               "v2/packinglist"]
+        try:
+            x_api_key = request.headers.get("api-key")
+            if request.url.path in excluded:
+                return await call_next(request)
+            response: Response = await call_next(request)
+            if not x_api_key:
+                raise HTTPException(status_code=422, detail="Missing API key")
+            if any(path in request.url.path for path in w_man_only):
+                if x_api_key != warehouse_manager:
+                    raise HTTPException(status_code=403, detail="Invalid API key, need to be Warehouse manager")
+            if any(path in request.url.path for path in all_managers):
+                if x_api_key != warehouse_manager and x_api_key != floor_manager:
+                    raise HTTPException(status_code=403, detail="Invalid API key, only Floor/Warehouse managers")
+            if any(path in request.url.path for path in all):
+                if x_api_key != warehouse_manager and x_api_key != floor_manager and x_api_key != employee:
+                    raise HTTPException(status_code=403, detail="Invalid API key, need to be employee of CargoHub")
+            return response
+        except HTTPException as http_exc:
+            return JSONResponse(status_code=http_exc.status_code, content={"detail": http_exc.detail})
+
+    return legacy
+
+
+def rejected_rate(client: TestClient, requests: int):
+    headers = {"api-key": "not-a-valid-key"}
+    start = time.perf_counter()
+    for _ in range(requests):
+        response = client.get("/api/v2/orders/?limit=100", headers=headers)
+        assert response.status_code == 403, response.text
+    return requests / (time.perf_counter() - start)
+
+
+def main(requests: int = 2000):
+    engine, path = temp_engine()
+    try:
+        seed(engine, inventories=200)
+        client = bench_client(engine)
+        uids = item_uids(200)
+        client.post("/api/v2/orders/batch", json=[json_payload(order_payload(i, 5, uids)) for i in range(500)])
+
+        from CargoHubV2.app import main as app_main
+        from CargoHubV2.app.services import auth_service
+        legacy = TestClient(legacy_app(app_main.app, app_main.warehouse_manager,
+                                       app_main.floor_manager, app_main.employee))
+
+        before = rejected_rate(legacy, requests)
+        after = rejected_rate(client, requests)
+        print(f"before: {before:>8.0f} rejected requests/s")
+        print(f"after:  {after:>8.0f} rejected requests/s ({after / before:.1f}x)")
+
+        # de beslissing zelf, zonder de TestClient overhead
+        start = time.perf_counter()
+        for _ in range(100_000):
+            auth_service.authorize(app_main.route_table, "/api/v2/orders/1/items", "not-a-valid-key")
+        print(f"authorize: {(time.perf_counter() - start) * 10:.2f} us per call")
+    finally:
+        engine.dispose()
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,91 @@
+"""
+Benchmark voor de chart backends van chart_service.
+
+1. charts per report: pyplot zoals create_charts was, de matplotlib backend
+   (Figure + Agg, zonder pyplot) en de svg backend.
+2. cold start: een nieuw python process dat CargoHubV2.app.main importeert
+   (zoals een uvicorn worker of job_service worker opstart), en hoeveel
+   daarvan de matplotlib import zou kosten.
+
+    python benchmarks/bench_charts.py [reports] [cold_starts]
+"""
+import base64
+import io
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from CargoHubV2.app.services import chart_service  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT = {"amount_of_items_sold": "25", "total_revenue": "1505.0", "total_discount": "150.0",
+          "total_tax": "300.0", "total_surcharge": "75.0"}
+
+
+def pyplot_charts(data: dict) -> dict:
+    # zoals reporting_service.create_charts was
+    import matplotlib.pyplot as plt
+
+    bar_values, pie_sizes = chart_service.chart_values(data)
+    charts = {}
+    plt.figure(figsize=(6, 4))
+    plt.bar(chart_service.BAR_CATEGORIES, bar_values, color="#51d3f5")
+    plt.title("Financial Summary")
+    plt.xlabel("Categories")
+    plt.ylabel("Amount")
+    buffer = io.BytesIO()
+    plt.savefig(buffer, format="png")
+    charts["bar_chart"] = base64.b64encode(buffer.getvalue()).decode("utf-8")
+    plt.close()
+
+    plt.figure(figsize=(6, 4))
+    plt.pie(pie_sizes, labels=chart_service.PIE_LABELS, autopct="%1.1f%%", startangle=140,
+            colors=["#51d3f5", "gray"])
+    plt.title("Item Sales Distribution")
+    buffer = io.BytesIO()
+    plt.savefig(buffer, format="png")
+    charts["pie_chart"] = base64.b64encode(buffer.getvalue()).decode("utf-8")
+    plt.close()
+    return charts
+
+
+def time_charts(create, reports: int) -> tuple:
+    create(REPORT)  # imports en font cache buiten de meting
+    start = time.perf_counter()
+    for _ in range(reports):
+        charts = create(REPORT)
+    elapsed = (time.perf_counter() - start) * 1000 / reports
+    return elapsed, sum(len(chart) for chart in charts.values())
+
+
+def cold_start(code: str, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, cwd=ROOT)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    reports = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 7
+
+    print(f"{'charts per report':<24} {'ms':>8} {'bytes':>8}")
+    for name, create in (("pyplot (old)", pyplot_charts),
+                         ("matplotlib backend", lambda data: chart_service.create_charts(data, "matplotlib")),
+                         ("svg backend", lambda data: chart_service.create_charts(data, "svg"))):
+        elapsed, size = time_charts(create, reports)
+        print(f"{name:<24} {elapsed:>8.2f} {size:>8}")
+
+    app = cold_start("import CargoHubV2.app.main", runs)
+    with_pyplot = cold_start("import matplotlib.pyplot, CargoHubV2.app.main", runs)
+    print(f"cold start, import app: {app:.0f} ms; with matplotlib.pyplot imported too: {with_pyplot:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
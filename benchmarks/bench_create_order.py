@@ -0,0 +1,49 @@
+"""
+Benchmark voor orders_service.create_order.
+
+Maakt orders van 1, 50 en 500 regels aan op een geseede SQLite database
+en rapporteert de latency per order en per orderregel.
+
+    python benchmarks/bench_create_order.py
+"""
+import os
+import statistics
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_utils import temp_engine, session_factory, seed, item_uids, order_payload, timed  # noqa: E402
+from CargoHubV2.app.services.orders_service import create_order  # noqa: E402
+
+LINE_COUNTS = [1, 50, 500]
+REPEATS = 20
+
+
+def main():
+    engine, path = temp_engine()
+    try:
+        seed(engine, inventories=500)
+        uids = item_uids(500)
+        Session = session_factory(engine)
+        reference = 0
+
+        print(f"{'lines':>6} {'ms/order':>10} {'ms/line':>10}")
+        for lines in LINE_COUNTS:
+            timings = []
+            for _ in range(REPEATS):
+                reference += 1
+                db = Session()
+                try:
+                    _, ms = timed(create_order, db, order_payload(reference, lines, uids))
+                finally:
+                    db.close()
+                timings.append(ms)
+            median = statistics.median(timings)
+            print(f"{lines:>6} {median:>10.2f} {median / lines:>10.4f}")
+    finally:
+        engine.dispose()
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
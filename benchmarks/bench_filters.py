@@ -0,0 +1,93 @@
+"""
+Benchmark voor veld__op filters op list endpoints.
+
+Zoekt de Packed orders van een warehouse in een week op via de app
+(TestClient): een keer zoals een client het zonder filters moet doen (alle
+pagina's van 1000 met de cursor ophalen en zelf filteren) en een keer met
+warehouse_id__eq, order_status__eq en order_date__gte/__lte.
+
+    python benchmarks/bench_filters.py [rows] [requests]
+"""
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert  # noqa: E402
+
+from benchmarks.bench_utils import temp_engine, bench_client  # noqa: E402
+from benchmarks.bench_list_responses import time_requests  # noqa: E402
+from CargoHubV2.app.models import Order, Warehouse  # noqa: E402
+
+WAREHOUSES = 25
+STATUSES = ("Pending", "Packed", "Shipped", "Delivered")
+START = datetime(2024, 1, 1, 12, 0, 0)
+FILTERS = "warehouse_id__eq=7&order_status__eq=Packed&order_date__gte=2024-03-01&order_date__lte=2024-03-08"
+
+
+def seed_orders(engine, rows: int):
+    with engine.begin() as conn:
+        conn.execute(insert(Warehouse.__table__), [
+            {"id": id, "code": f"WH{id:06d}", "name": f"Warehouse {id}", "created_at": START,
+             "updated_at": START, "is_deleted": False}
+            for id in range(1, WAREHOUSES + 1)
+        ])
+        conn.execute(insert(Order.__table__), [
+            {"id": id, "source_id": 1, "order_date": START + timedelta(hours=id % 8760),
+             "reference": f"ORD{id:07d}", "order_status": STATUSES[id % len(STATUSES)], "notes": "bench order",
+             "warehouse_id": 1 + id % WAREHOUSES, "shipment_id": [id], "total_amount": 100.0,
+             "created_at": START, "updated_at": START, "is_deleted": False}
+            for id in range(1, rows + 1)
+        ])
+
+
+def download_and_filter(client):
+    # zonder filters: alle pagina's ophalen en in de client filteren
+    matches, size, cursor = [], 0, ""
+    while cursor is not None:
+        response = client.get(f"/api/v2/orders/?limit=1000&sort_by=id&cursor={cursor}")
+        if response.status_code == 404:
+            # een lege laatste pagina geeft 404
+            break
+        response.raise_for_status()
+        size += len(response.content)
+        matches += [order for order in response.json()
+                    if order["warehouse_id"] == 7 and order["order_status"] == "Packed"
+                    and "2024-03-01" <= order["order_date"] <= "2024-03-08"]
+        cursor = response.headers.get("X-Next-Cursor")
+    return matches, size
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    engine, path = temp_engine("tuned")
+    try:
+        seed_orders(engine, rows)
+        client = bench_client(engine)
+        url = f"/api/v2/orders/?limit=1000&sort_by=id&{FILTERS}"
+        expected, _ = download_and_filter(client)
+        assert len(client.get(url).json()) == len(expected)
+
+        timings = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            _, size = download_and_filter(client)
+            timings.append((time.perf_counter() - start) * 1000)
+        print(f"{'orders':<8} {'query':<30} {'matches':>8} {'median ms':>10} {'bytes':>10}")
+        print(f"{'orders':<8} {'all pages, client filter':<30} {len(expected):>8} "
+              f"{statistics.median(timings):>10.1f} {size:>10}")
+        elapsed, size = time_requests(client, url, requests)
+        print(f"{'orders':<8} {'field__op filters':<30} {len(expected):>8} {elapsed:>10.1f} {size:>10}")
+    finally:
+        engine.dispose()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+if __name__ == "__main__":
+    main()
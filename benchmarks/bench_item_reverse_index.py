@@ -0,0 +1,132 @@
+"""
+Benchmark voor GET /api/v2/items/{code}/orders en /shipments.
+
+Vult een database met orders (4 regels per order) en shipments (3 items per
+shipment) en meet de lookup per item via de service, en via de API. Ter
+vergelijking ook een keer de oude manier: alle shipments met hun items JSON
+ophalen en in Python filteren.
+
+    python benchmarks/bench_item_reverse_index.py [orders] [shipments] [lookups]
+"""
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert  # noqa: E402
+
+from benchmarks.bench_utils import temp_engine, session_factory, bench_client, item_uids  # noqa: E402
+from CargoHubV2.app.models import Item, Order, OrderLine, Shipment, ShipmentItemIndex  # noqa: E402
+from CargoHubV2.app.services.items_service import get_orders_for_item, get_shipments_for_item  # noqa: E402
+
+BATCH = 50_000
+STATUSES = ["Pending", "Packed", "Shipped", "Delivered"]
+
+
+def seed_items(engine, uids: list):
+    now = datetime.now()
+    with engine.begin() as conn:
+        conn.execute(insert(Item.__table__), [
+            {"uid": uid, "code": f"C{uid}", "created_at": now, "updated_at": now, "is_deleted": False}
+            for _, uid in uids
+        ])
+
+
+def seed_orders(engine, orders: int, uids: list):
+    now = datetime.now()
+    for first in range(1, orders + 1, BATCH):
+        ids = range(first, min(first + BATCH, orders + 1))
+        with engine.begin() as conn:
+            conn.execute(insert(Order.__table__), [
+                {"id": id, "source_id": 1, "order_date": now, "reference": f"ORD{id % 100000:05d}",
+                 "order_status": STATUSES[id % 4], "warehouse_id": 1, "total_amount": 1.0,
+                 "created_at": now, "updated_at": now, "is_deleted": False}
+                for id in ids
+            ])
+            conn.execute(insert(OrderLine.__table__), [
+                {"order_id": id, "item_uid": uids[(id * 7 + n * 13) % len(uids)][1], "amount": 1}
+                for id in ids for n in range(4)
+            ])
+
+
+def seed_shipments(engine, shipments: int, uids: list):
+    now = datetime.now()
+    for first in range(1, shipments + 1, BATCH):
+        ids = range(first, min(first + BATCH, shipments + 1))
+        items = {id: [uids[(id * 11 + n * 17) % len(uids)][1] for n in range(3)] for id in ids}
+        with engine.begin() as conn:
+            conn.execute(insert(Shipment.__table__), [
+                {"id": id, "shipment_status": STATUSES[id % 4], "shipment_type": "O",
+                 "items": [{"item_id": uid, "amount": 1} for uid in items[id]],
+                 "created_at": now, "updated_at": now, "is_deleted": False}
+                for id in ids
+            ])
+            conn.execute(insert(ShipmentItemIndex.__table__), [
+                {"shipment_id": id, "item_uid": uid} for id in ids for uid in dict.fromkeys(items[id])
+            ])
+
+
+def percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def time_lookups(lookup, codes: list):
+    timings, found = [], 0
+    for code in codes:
+        start = time.perf_counter()
+        found += len(lookup(code))
+        timings.append((time.perf_counter() - start) * 1000)
+    return percentile(timings, 0.5), percentile(timings, 0.99), found / len(codes)
+
+
+def main():
+    orders = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    shipments = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    lookups = int(sys.argv[3]) if len(sys.argv) > 3 else 500
+    uids = item_uids(11_720)
+    engine, path = temp_engine("tuned")
+    try:
+        start = time.perf_counter()
+        seed_items(engine, uids)
+        seed_orders(engine, orders, uids)
+        seed_shipments(engine, shipments, uids)
+        print(f"seeded {orders} orders, {shipments} shipments, {len(uids)} items "
+              f"in {time.perf_counter() - start:.0f}s")
+
+        codes = [f"C{random.choice(uids)[1]}" for _ in range(lookups)]
+        db = session_factory(engine)()
+        client = bench_client(engine)
+        print(f"{'lookup':<32} {'p50 ms':>8} {'p99 ms':>8} {'ids/item':>9}")
+        rows = [
+            ("service orders (open)", lambda code: get_orders_for_item(db, code)["order_ids"]),
+            ("service orders (all)", lambda code: get_orders_for_item(db, code, False)["order_ids"]),
+            ("service shipments (open)", lambda code: get_shipments_for_item(db, code)["shipment_ids"]),
+            ("GET /items/{code}/orders", lambda code: client.get(f"/api/v2/items/{code}/orders").json()["order_ids"]),
+            ("GET /items/{code}/shipments",
+             lambda code: client.get(f"/api/v2/items/{code}/shipments").json()["shipment_ids"]),
+        ]
+        for name, lookup in rows:
+            p50, p99, found = time_lookups(lookup, codes)
+            print(f"{name:<32} {p50:>8.2f} {p99:>8.2f} {found:>9.0f}")
+
+        # de oude manier: alle shipments met items ophalen en in Python zoeken
+        uid = codes[0][1:]
+        start = time.perf_counter()
+        matches = [id for id, items in db.query(Shipment.id, Shipment.items).filter(Shipment.is_deleted == False)
+                   if any(item["item_id"] == uid for item in items or [])]
+        print(f"{'python scan of shipments.items':<32} {(time.perf_counter() - start) * 1000:>8.0f} "
+              f"{'':>8} {len(matches):>9}")
+        db.close()
+    finally:
+        engine.dispose()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark voor keyset (cursor) pagination tegenover offset pagination.
+
+Loopt de hele orders tabel door in pagina's van 1000 via get_all_orders,
+een keer met offset/limit en een keer met de cursor uit next_cursor, zoals
+de sync jobs dat doen.
+
+    python benchmarks/bench_keyset_pagination.py [rows] [page_size]
+"""
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert  # noqa: E402
+
+from benchmarks.bench_utils import temp_engine, session_factory  # noqa: E402
+from CargoHubV2.app.models import Order  # noqa: E402
+from CargoHubV2.app.services.orders_service import get_all_orders  # noqa: E402
+from CargoHubV2.app.services.pagination_service import next_cursor  # noqa: E402
+
+
+def seed_orders(engine, rows: int):
+    start = datetime(2024, 1, 1)
+    with engine.begin() as conn:
+        for first in range(1, rows + 1, 50_000):
+            conn.execute(insert(Order.__table__), [
+                {
+                    "id": id, "source_id": 1, "reference": f"ORD{id:07d}",
+                    "order_date": start + timedelta(minutes=id % 100_000),
+                    "order_status": "Delivered", "warehouse_id": 1, "total_amount": 10.0,
+                    "created_at": start, "updated_at": start, "is_deleted": False,
+                }
+                for id in range(first, min(first + 50_000, rows + 1))
+            ])
+
+
+def walk_offset(Session, sort_by: str, page_size: int):
+    db = Session()
+    seen, offset, pages = 0, 0, []
+    try:
+        while True:
+            start = time.perf_counter()
+            rows = get_all_orders(db, offset=offset, limit=page_size, sort_by=sort_by)
+            pages.append(time.perf_counter() - start)
+            seen += len(rows)
+            if len(rows) < page_size:
+                return seen, pages
+            offset += page_size
+            db.expunge_all()
+    finally:
+        db.close()
+
+
+def walk_cursor(Session, sort_by: str, page_size: int):
+    db = Session()
+    seen, cursor, pages = 0, "", []
+    try:
+        while cursor is not None:
+            start = time.perf_counter()
+            rows = get_all_orders(db, limit=page_size, sort_by=sort_by, cursor=cursor)
+            cursor = next_cursor(rows, sort_by, "asc", page_size)
+            pages.append(time.perf_counter() - start)
+            seen += len(rows)
+            db.expunge_all()
+        return seen, pages
+    finally:
+        db.close()
+
+
+def report(name: str, seen: int, pages: list):
+    tail = pages[-10:]
+    print(f"{name:>8}: {seen} rows in {sum(pages):7.2f}s, "
+          f"first page {pages[0] * 1000:6.1f} ms, last pages {sum(tail) / len(tail) * 1000:6.1f} ms")
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    page_size = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    engine, path = temp_engine()
+    try:
+        seed_orders(engine, rows)
+        Session = session_factory(engine)
+        print(f"{rows} orders, pages of {page_size}")
+        for sort_by in ("id", "order_date"):
+            print(f"sort_by={sort_by}")
+            report("offset", *walk_offset(Session, sort_by, page_size))
+            report("cursor", *walk_cursor(Session, sort_by, page_size))
+    finally:
+        engine.dispose()
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
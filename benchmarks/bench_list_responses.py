@@ -0,0 +1,86 @@
+"""
+Benchmark voor grote list responses (orders en shipments, limit=1000).
+
+Vraagt via de app (TestClient) een pagina van 1000 orders (met order lines)
+en 1000 shipments (met items) op, met en zonder cursor. Meet de hele request,
+dus query, serialisatie en de response.
+
+    python benchmarks/bench_list_responses.py [rows] [requests]
+"""
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert  # noqa: E402
+
+from benchmarks.bench_utils import temp_engine, bench_client, item_uids  # noqa: E402
+from CargoHubV2.app.models import Order, OrderLine, Shipment, Warehouse  # noqa: E402
+
+
+def seed_lists(engine, rows: int):
+    now = datetime(2024, 9, 1, 12, 0, 0)
+    uids = [uid for _, uid in item_uids(100)]
+    with engine.begin() as conn:
+        conn.execute(insert(Warehouse.__table__), [{
+            "id": 1, "code": "BENCH001", "name": "Benchmark warehouse",
+            "created_at": now, "updated_at": now, "is_deleted": False,
+        }])
+        conn.execute(insert(Order.__table__), [
+            {"id": id, "source_id": 1, "order_date": now, "request_date": now, "reference": f"ORD{id:05d}",
+             "order_status": "Pending", "notes": "bench order", "warehouse_id": 1, "shipment_id": [id],
+             "total_amount": 100.0, "total_discount": 1.0, "total_tax": 2.0, "total_surcharge": 3.0,
+             "created_at": now, "updated_at": now, "is_deleted": False}
+            for id in range(1, rows + 1)
+        ])
+        conn.execute(insert(OrderLine.__table__), [
+            {"order_id": id, "item_uid": uids[(id + n) % len(uids)], "amount": 1 + n}
+            for id in range(1, rows + 1) for n in range(5)
+        ])
+        conn.execute(insert(Shipment.__table__), [
+            {"id": id, "order_id": [id], "source_id": 1, "order_date": now, "request_date": now,
+             "shipment_date": now, "shipment_type": "O", "shipment_status": "Pending", "notes": "bench shipment",
+             "carrier_code": "DHL", "carrier_description": "DHL Express", "service_code": "NextDay",
+             "payment_type": "Manual", "transfer_mode": "Ground", "total_package_count": 3,
+             "total_package_weight": 12.5, "items": [{"item_id": uids[(id + n) % len(uids)], "amount": n + 1}
+                                                     for n in range(10)],
+             "created_at": now, "updated_at": now, "is_deleted": False}
+            for id in range(1, rows + 1)
+        ])
+
+
+def time_requests(client, url: str, requests: int):
+    client.get(url).raise_for_status()
+    timings = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = client.get(url)
+        timings.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+    return statistics.median(timings), len(response.content)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    engine, path = temp_engine("tuned")
+    try:
+        seed_lists(engine, rows)
+        client = bench_client(engine)
+        print(f"{'endpoint':<44} {'median ms':>10} {'bytes':>9}")
+        for url in ("/api/v2/orders/?limit=1000", "/api/v2/orders/?limit=1000&sort_by=id&cursor=",
+                    "/api/v2/shipments/?limit=1000", "/api/v2/shipments/?limit=1000&cursor="):
+            elapsed, size = time_requests(client, url, requests)
+            print(f"{url:<44} {elapsed:>10.1f} {size:>9}")
+    finally:
+        engine.dispose()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark voor loader_service.load met een gegenereerde orders.json.
+
+Rapporteert de laadtijd, rows/s en de piek RSS van het proces, zodat te zien
+is dat het geheugen niet meegroeit met de grootte van de file.
+
+    python benchmarks/bench_loader.py [rows] [chunk_size]
+"""
+import io
+import json
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout, redirect_stderr
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_utils import temp_engine, session_factory  # noqa: E402
+from CargoHubV2.app import config  # noqa: E402
+from CargoHubV2.app.services.loader_service import load, CHUNK_SIZE  # noqa: E402
+
+
+def write_orders(path: str, rows: int):
+    # record voor record schrijven, de generator zelf mag ook niet het geheugen opblazen
+    with open(path, "w") as out:
+        out.write("[\n")
+        for i in range(1, rows + 1):
+            record = {
+                "id": i, "source_id": i % 50, "order_date": "2019-04-03T11:33:15Z",
+                "request_date": "2019-04-07T11:33:15Z", "reference": f"ORD{i % 100000:05d}",
+                "reference_extra": "Bedreven arm straffen bureau.", "order_status": "Delivered",
+                "notes": "Voedsel vijf vork heel.", "shipping_notes": "Buurman betalen plaats bewolkt.",
+                "picking_notes": "Ademen fijn volgorde scherp aardappel op hoe.", "warehouse_id": 1 + i % 50,
+                "ship_to": None, "bill_to": None, "shipment_id": i, "total_amount": 9905.13,
+                "total_discount": 150.77, "total_tax": 372.72, "total_surcharge": 77.6,
+                "created_at": "2019-04-03T11:33:15Z", "updated_at": "2019-04-05 07:33:15",
+                "items": [{"item_id": f"P{(i * 7 + n) % 11720:06d}", "amount": 1 + n} for n in range(4)],
+            }
+            out.write(("," if i > 1 else "") + json.dumps(record) + "\n")
+        out.write("]\n")
+
+
+def main(rows: int = 100_000, chunk_size: int = CHUNK_SIZE):
+    data_dir = tempfile.mkdtemp(prefix="cargohub_load_")
+    # load leest alleen binnen de data map
+    config.LOAD_DATA_DIR = data_dir
+    engine, path = temp_engine()
+    try:
+        write_orders(os.path.join(data_dir, "orders.json"), rows)
+        size_mb = os.path.getsize(os.path.join(data_dir, "orders.json")) / 1e6
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        db = session_factory(engine)()
+        start = time.perf_counter()
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            result = load(data_dir, db, chunk_size=chunk_size, resume=False)
+        elapsed = time.perf_counter() - start
+        db.close()
+
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        print(f"{rows} rows ({size_mb:.1f} MB): {elapsed:.1f}s, {rows / elapsed:.0f} rows/s, {result}")
+        print(f"peak RSS: {rss_before / 1024:.1f} MB before load, {rss_after / 1024:.1f} MB after")
+    finally:
+        engine.dispose()
+        os.remove(path)
+        shutil.rmtree(data_dir)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,92 @@
+"""
+Benchmark: loader_service.load sequentieel tegenover parallel=True.
+
+Genereert de onafhankelijke tabellen (item_groups, item_lines, item_types,
+suppliers, warehouses, clients) plus orders.json en laadt ze in twee lege
+databases. Per tabel worden rows/s geprint (bij parallel alleen de insert tijd,
+het parsen loopt dan in de workers), daarna de totale wall clock.
+
+    python benchmarks/bench_loader_parallel.py [rows_per_file] [workers]
+"""
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout, redirect_stderr
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_utils import temp_engine, session_factory  # noqa: E402
+from benchmarks.bench_loader import write_orders  # noqa: E402
+from CargoHubV2.app import config  # noqa: E402
+from CargoHubV2.app.services import loader_service  # noqa: E402
+
+STAMPS = {"created_at": "2019-04-03 11:33:15", "updated_at": "2022-05-18 13:49:28"}
+
+
+def generators():
+    named = lambda i: {"id": i, "name": f"Name {i}", "description": "Lorem ipsum", **STAMPS}  # noqa: E731
+    address = {"address": "Straat 1", "city": "Rotterdam", "province": "Zuid-Holland", "country": "NL"}
+    return {
+        "item_groups.json": named,
+        "item_lines.json": named,
+        "item_types.json": named,
+        "suppliers.json": lambda i: {"id": i, "code": f"SUP{i:06d}", "name": f"Supplier {i}", "zip_code": "3011AA",
+                                     "contact_name": "Jan", "phonenumber": "010-1234567", "reference": f"S-{i}",
+                                     **address, **STAMPS},
+        "warehouses.json": lambda i: {"id": i, "code": f"WH{i:06d}", "name": f"Warehouse {i}", "zip": "3011AA",
+                                      "contact": {"name": "Jan", "phone": "010-1234567"}, **address, **STAMPS},
+        "clients.json": lambda i: {"id": i, "name": f"Client {i}", "zip_code": "3011AA", "contact_name": "Jan",
+                                   "contact_phone": "010-1234567", "contact_email": "jan@example.com",
+                                   **address, **STAMPS},
+    }
+
+
+def write_data(data_dir: str, rows: int):
+    for file, generator in generators().items():
+        with open(os.path.join(data_dir, file), "w") as out:
+            out.write("[\n" + ",\n".join(json.dumps(generator(i)) for i in range(1, rows + 1)) + "\n]\n")
+    write_orders(os.path.join(data_dir, "orders.json"), rows)
+
+
+def run(data_dir: str, parallel: bool, workers: int):
+    engine, path = temp_engine()
+    db = session_factory(engine)()
+    output = io.StringIO()
+    try:
+        start = time.perf_counter()
+        with redirect_stdout(output), redirect_stderr(io.StringIO()):
+            result = loader_service.load(data_dir, db, resume=False, parallel=parallel, workers=workers)
+        elapsed = time.perf_counter() - start
+    finally:
+        db.close()
+        engine.dispose()
+        os.remove(path)
+    # alleen de statistieken uit de output van load
+    stats = [line for line in output.getvalue().splitlines() if "rows" in line]
+    return result, elapsed, stats
+
+
+def main(rows: int = 50_000, workers: int = os.cpu_count()):
+    data_dir = tempfile.mkdtemp(prefix="cargohub_load_")
+    # load leest alleen binnen de data map
+    config.LOAD_DATA_DIR = data_dir
+    try:
+        write_data(data_dir, rows)
+        timings = {}
+        for parallel in (False, True):
+            label = f"parallel ({workers} workers)" if parallel else "sequential"
+            result, elapsed, stats = run(data_dir, parallel, workers)
+            timings[parallel] = elapsed
+            print(f"--- {label}: {result}")
+            print("\n".join(stats))
+        print(f"speedup: {timings[False] / timings[True]:.2f}x")
+    finally:
+        shutil.rmtree(data_dir)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,102 @@
+"""
+Benchmark voor de order_lines tabel.
+
+1. voorraad terugzetten bij delete_order: de oude manier (een inventory query
+   per orderregel, daarna aanpassen in Python) tegen de huidige (een UPDATE
+   met de som uit order_lines), voor orders met 5 en 50 regels.
+2. "welke orders bevatten item X" via de (item_uid, order_id) index.
+
+    python benchmarks/bench_order_lines.py [orders] [lookups]
+"""
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert, select  # noqa: E402
+
+from benchmarks.bench_utils import temp_engine, seed, session_factory, item_uids  # noqa: E402
+from CargoHubV2.app.models import Inventory, Order, OrderLine  # noqa: E402
+from CargoHubV2.app.services.orders_service import delete_order  # noqa: E402
+
+
+def seed_orders(engine, orders: int, lines: int, uids: list, first_id: int = 1):
+    now = datetime.now()
+    with engine.begin() as conn:
+        conn.execute(insert(Order.__table__), [
+            {"id": id, "source_id": 1, "order_date": now, "reference": f"ORD{id % 100000:05d}",
+             "order_status": "Pending", "warehouse_id": 1, "total_amount": 1.0,
+             "created_at": now, "updated_at": now, "is_deleted": False}
+            for id in range(first_id, first_id + orders)
+        ])
+        conn.execute(insert(OrderLine.__table__), [
+            {"order_id": id, "item_uid": uids[(id * 7 + n) % len(uids)][1], "amount": 1}
+            for id in range(first_id, first_id + orders) for n in range(lines)
+        ])
+
+
+def delete_order_per_item(db, id: int):
+    # zoals delete_order was met de items JSON kolom
+    order = db.query(Order).filter(Order.id == id, Order.is_deleted == False).first()
+    for item_dict in order.items:
+        inventory = db.query(Inventory).filter(Inventory.item_id == item_dict["item_id"],
+                                               Inventory.is_deleted == False).first()
+        inventory.total_ordered -= item_dict["amount"]
+        inventory.total_available += item_dict["amount"]
+        inventory.updated_at = datetime.now()
+    order.is_deleted = True
+    db.commit()
+
+
+def time_deletes(Session, delete, ids: list) -> float:
+    db = Session()
+    try:
+        start = time.perf_counter()
+        for id in ids:
+            delete(db, id)
+        return (time.perf_counter() - start) * 1000 / len(ids)
+    finally:
+        db.close()
+
+
+def main():
+    orders = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    uids = item_uids(500)
+    engine, path = temp_engine("tuned")
+    try:
+        seed(engine, inventories=500)
+        Session = session_factory(engine)
+
+        print("delete_order, ms per order")
+        next_id = 1
+        for lines in (5, 50):
+            seed_orders(engine, 400, lines, uids, next_id)
+            legacy = time_deletes(Session, delete_order_per_item, list(range(next_id, next_id + 200)))
+            current = time_deletes(Session, delete_order, list(range(next_id + 200, next_id + 400)))
+            print(f"  {lines:>3} lines: per item {legacy:7.2f} ms, order_lines update {current:7.2f} ms")
+            next_id += 400
+
+        seed_orders(engine, orders, 4, uids, next_id)
+        with engine.connect() as conn:
+            start = time.perf_counter()
+            found = 0
+            for _ in range(lookups):
+                uid = random.choice(uids)[1]
+                found += len(conn.execute(
+                    select(OrderLine.order_id).where(OrderLine.item_uid == uid).distinct()).all())
+            elapsed = (time.perf_counter() - start) * 1000 / lookups
+        print(f"orders containing item X over {orders} orders: {elapsed:.2f} ms per lookup "
+              f"({found / lookups:.0f} orders per item)")
+    finally:
+        engine.dispose()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+if __name__ == "__main__":
+    main()
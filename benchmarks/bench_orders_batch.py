@@ -0,0 +1,48 @@
+"""
+Benchmark: POST /api/v2/orders/ per order tegenover POST /api/v2/orders/batch.
+
+Beide routes draaien in dezelfde app tegen een geseede SQLite database,
+het resultaat is het aantal orders per seconde per route.
+
+    python benchmarks/bench_orders_batch.py [orders] [lines]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_utils import temp_engine, seed, item_uids, order_payload, bench_client, json_payload  # noqa: E402
+
+
+def main(orders: int = 1000, lines: int = 5):
+    engine, path = temp_engine()
+    try:
+        seed(engine, inventories=1000)
+        uids = item_uids(1000)
+        client = bench_client(engine)
+
+        single = [json_payload(order_payload(i, lines, uids)) for i in range(orders)]
+        start = time.perf_counter()
+        for payload in single:
+            response = client.post("/api/v2/orders/", json=payload)
+            assert response.status_code == 200, response.text
+        single_rate = orders / (time.perf_counter() - start)
+
+        batch = [json_payload(order_payload(orders + i, lines, uids)) for i in range(orders)]
+        start = time.perf_counter()
+        response = client.post("/api/v2/orders/batch", json=batch)
+        batch_rate = orders / (time.perf_counter() - start)
+        assert response.status_code == 200, response.text
+        created = sum(1 for result in response.json() if result["status_code"] == 201)
+
+        print(f"single route: {single_rate:>10.1f} orders/s")
+        print(f"batch route:  {batch_rate:>10.1f} orders/s ({created}/{orders} created)")
+        print(f"speedup:      {batch_rate / single_rate:>10.1f}x")
+    finally:
+        engine.dispose()
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
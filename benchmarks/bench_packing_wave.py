@@ -0,0 +1,113 @@
+"""
+Benchmark voor packing lists van een pick wave.
+
+Maakt packing lists voor een wave van orders (standaard 500, 5 regels per
+order) op drie manieren:
+1. zoals create_packing_list was: per order een query, de template opnieuw
+   van disk lezen en compileren, en een wkhtmltopdf aanroep;
+2. generate_packing_list per order (gecompileerde template, wel nog een
+   renderer aanroep per order);
+3. generate_wave_packing_list: een query, een HTML document, een aanroep.
+
+De PDFs worden in het request gemaakt (PDF_WORKERS=0). Zonder wkhtmltopdf op
+het PATH wordt de html weggeschreven i.p.v. pdfkit te draaien; de opstarttijd
+van wkhtmltopdf per aanroep zit dan niet in de tijden, alleen in het aantal
+aanroepen.
+
+    python benchmarks/bench_packing_wave.py [orders] [lines]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jinja2 import Template  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from benchmarks.bench_utils import temp_engine, session_factory, seed, item_uids  # noqa: E402
+from CargoHubV2.app import config  # noqa: E402
+from CargoHubV2.app.models import Order, OrderLine  # noqa: E402
+from CargoHubV2.app.services import job_service, packinglist_service  # noqa: E402
+
+calls = []
+
+
+def seed_orders(engine, orders: int, lines: int, uids: list):
+    now = datetime.now()
+    with engine.begin() as conn:
+        conn.execute(insert(Order.__table__), [
+            {"id": id, "source_id": 1, "order_date": now, "request_date": now, "reference": f"ORD{id:05d}",
+             "order_status": "Pending", "warehouse_id": 1, "total_amount": 1.0,
+             "created_at": now, "updated_at": now, "is_deleted": False}
+            for id in range(1, orders + 1)
+        ])
+        conn.execute(insert(OrderLine.__table__), [
+            {"order_id": id, "item_uid": uids[(id * 7 + n) % len(uids)][1], "amount": 1 + n}
+            for id in range(1, orders + 1) for n in range(lines)
+        ])
+
+
+def per_order_legacy(db, ids: list):
+    # zoals de oude generate_packing_list: template per order van disk
+    for id in ids:
+        order = db.query(Order).filter(Order.id == id).first()
+        content = packinglist_service.packing_list_content(order)
+        with open(packinglist_service.TEMPLATE_FILE, "r") as file:
+            html_template = file.read()
+        html = Template(html_template).render(orders=[content])
+        packinglist_service.pdfkit.from_string(html, str(packinglist_service.PDF_DIR / f"legacy_{id}.pdf"))
+
+
+def per_order(db, ids: list):
+    for id in ids:
+        packinglist_service.generate_packing_list(db.query(Order).filter(Order.id == id).first())
+
+
+def wave(db, ids: list):
+    packinglist_service.generate_wave_packing_list(db, order_ids=ids)
+
+
+def main():
+    orders = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    lines = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    engine, path = temp_engine("tuned")
+    pdf_dir = Path(tempfile.mkdtemp())
+    packinglist_service.PDF_DIR = pdf_dir
+    config.PDF_WORKERS = 0
+    render = packinglist_service.pdfkit.from_string
+    if shutil.which("wkhtmltopdf") is None:
+        print("wkhtmltopdf not found, renderer calls write the html instead of a PDF")
+        render = lambda html, output: Path(output).write_text(html)  # noqa: E731
+    packinglist_service.pdfkit.from_string = lambda html, output: calls.append(output) or render(html, output)
+    try:
+        seed(engine, inventories=10)
+        seed_orders(engine, orders, lines, item_uids(500))
+        Session = session_factory(engine)
+        ids = list(range(1, orders + 1))
+
+        print(f"{'packing lists':<28} {'total ms':>9} {'orders/s':>9} {'renderer calls':>15}")
+        for name, run in (("per order, template per call", per_order_legacy),
+                          ("per order, compiled", per_order), ("wave", wave)):
+            calls.clear()
+            job_service.jobs.clear()
+            db = Session()
+            start = time.perf_counter()
+            run(db, ids)
+            elapsed = (time.perf_counter() - start) * 1000
+            db.close()
+            print(f"{name:<28} {elapsed:>9.0f} {orders / elapsed * 1000:>9.0f} {len(calls):>15}")
+    finally:
+        engine.dispose()
+        shutil.rmtree(pdf_dir)
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Micro-benchmark voor loader_service.parse_iso_datetime.
+
+Parst een miljoen timestamps in de drie formats uit de exports (met veel
+herhaling, zoals in de echte data) met de oude strptime cascade en met de
+nieuwe versie.
+
+    python benchmarks/bench_parse_datetime.py [count] [distinct]
+"""
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from CargoHubV2.app.services.loader_service import parse_iso_datetime, parse_datetime_cached  # noqa: E402
+
+FORMATS = ["%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d"]
+
+
+def strptime_cascade(value, default_now=False):
+    # de oude implementatie, als referentie
+    try:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
+    except ValueError:
+        try:
+            return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            try:
+                return datetime.strptime(value, "%Y-%m-%d")
+            except ValueError:
+                if default_now:
+                    return datetime.now()
+                raise ValueError(f"Invalid datetime format: {value}")
+
+
+def timestamps(count: int, distinct: int):
+    rng = random.Random(42)
+    start = datetime(1990, 1, 1)
+    pool = [
+        (start + timedelta(seconds=rng.randrange(35 * 365 * 86400))).strftime(rng.choice(FORMATS))
+        for _ in range(distinct)
+    ]
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def measure(func, values):
+    start = time.perf_counter()
+    for value in values:
+        func(value)
+    return time.perf_counter() - start
+
+
+def main(count: int = 1_000_000, distinct: int = 50_000):
+    values = timestamps(count, distinct)
+    old = measure(strptime_cascade, values)
+    parse_datetime_cached.cache_clear()
+    new = measure(parse_iso_datetime, values)
+    info = parse_datetime_cached.cache_info()
+    print(f"strptime cascade:   {old:>6.2f}s ({count / old:>10.0f}/s)")
+    print(f"parse_iso_datetime: {new:>6.2f}s ({count / new:>10.0f}/s), {old / new:.1f}x faster")
+    print(f"cache: {info.hits} hits, {info.misses} misses")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
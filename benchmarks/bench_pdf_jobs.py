@@ -0,0 +1,103 @@
+"""
+Benchmark voor de PDF job queue (job_service).
+
+Stuurt een burst van report aanvragen voor verschillende maanden tegelijk
+(threads, zoals de threadpool van uvicorn) en meet de latency per aanvraag,
+de tijd tot alle PDFs klaar (of mislukt) zijn en het aantal jobs dat echt
+gestart is. Eerst met renderen in het request (PDF_WORKERS=0), daarna met de
+process pool. Een burst van steeds dezelfde aanvraag laat zien dat de pool
+die maar een keer rendert.
+
+Zonder wkhtmltopdf op het PATH mislukt elke job bij pdfkit, na de charts en
+de template; de tijden zijn dan zonder wkhtmltopdf.
+
+    python benchmarks/bench_pdf_jobs.py [requests] [workers]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert  # noqa: E402
+
+from benchmarks.bench_utils import temp_engine, session_factory, seed, bench_client  # noqa: E402
+from CargoHubV2.app import config  # noqa: E402
+from CargoHubV2.app.models import Order  # noqa: E402
+from CargoHubV2.app.services import job_service, reporting_service  # noqa: E402
+from CargoHubV2.app.services.rollup_service import rebuild_rollup  # noqa: E402
+
+
+def seed_orders(engine, months: int):
+    with engine.begin() as conn:
+        conn.execute(insert(Order.__table__), [
+            {"id": id, "source_id": 1, "order_date": datetime(2000 + id // 12, 1 + id % 12, 1),
+             "reference": f"ORD{id:05d}", "order_status": "Delivered", "warehouse_id": 1,
+             "total_amount": 10.0 + id, "total_discount": 1.0, "total_tax": 2.0, "total_surcharge": 0.5,
+             "created_at": datetime.now(), "updated_at": datetime.now(), "is_deleted": False}
+            for id in range(months)
+        ])
+
+
+def burst(client, months: list) -> tuple:
+    def request(month):
+        start = time.perf_counter()
+        response = client.get("/api/v2/reports/1", params={
+            "year_to_report": 2000 + month // 12, "month_to_report": 1 + month % 12})
+        latency = (time.perf_counter() - start) * 1000
+        return latency, job_service.jobs.get(response.json().get("job_id"))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(months)) as threads:
+        results = list(threads.map(request, months))
+    # wachten tot alle jobs klaar of mislukt zijn
+    futures = {future for _, future in results if future is not None}
+    for future in futures:
+        future.exception()
+    wall = (time.perf_counter() - start) * 1000
+    return sorted(latency for latency, _ in results), wall, futures
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    engine, path = temp_engine("tuned")
+    pdf_dir = Path(tempfile.mkdtemp())
+    reporting_service.PDF_DIR = pdf_dir
+    if shutil.which("wkhtmltopdf") is None:
+        print("wkhtmltopdf not found, jobs fail at pdfkit after rendering charts and template")
+    try:
+        seed(engine, inventories=10)
+        seed_orders(engine, requests * 3)
+        rebuild_rollup(session_factory(engine)())
+        client = bench_client(engine)
+
+        print(f"{'mode':<24} {'p50 ms':>8} {'max ms':>8} {'all done ms':>12} {'jobs':>5}")
+        modes = [("in request", 0, range(requests)), (f"pool, {workers} workers", workers,
+                 range(requests, 2 * requests)), ("pool, same report", workers, [2 * requests] * requests)]
+        for name, pool_workers, months in modes:
+            config.PDF_WORKERS = pool_workers
+            job_service.jobs.clear()
+            if pool_workers:
+                # workers opstarten (spawn + app import) buiten de meting
+                list(job_service.get_pool().map(reporting_service.month_range, [2024] * pool_workers,
+                                                [1] * pool_workers))
+            latencies, wall, futures = burst(client, list(months))
+            print(f"{name:<24} {latencies[len(latencies) // 2]:>8.1f} {latencies[-1]:>8.1f} "
+                  f"{wall:>12.0f} {len(futures):>5}")
+    finally:
+        job_service.shutdown(wait=True)
+        engine.dispose()
+        shutil.rmtree(pdf_dir)
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+if __name__ == "__main__":
+    main()
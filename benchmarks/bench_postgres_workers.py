@@ -0,0 +1,145 @@
+"""
+Throughput benchmark sqlite vs postgres met meerdere uvicorn workers.
+
+Start per backend en per aantal workers een echte uvicorn server
+(DATABASE_URL kiest de database) en laat een aantal clients tegelijk
+orders en inventories lijsten ophalen en nieuwe orders aanmaken. Het
+schema wordt per run opnieuw aangemaakt en gevuld.
+
+    python benchmarks/bench_postgres_workers.py <postgres_url> [seconds] [clients] [workers...]
+
+bijv. postgresql+psycopg2://postgres@localhost:5432/cargohub_bench
+"""
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+
+from benchmarks.bench_utils import BENCH_API_KEY, temp_engine, seed, item_uids, order_payload, json_payload  # noqa: E402
+from CargoHubV2.app.models import Base  # noqa: E402
+
+READS = ["/api/v2/orders/?limit=20&sort_by=id", "/api/v2/inventories/?limit=20"]
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def fresh_postgres(url: str):
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def start_server(url: str, workers: int, port: int):
+    env = {**os.environ, "DATABASE_URL": url, "WAREHOUSE_MANAGER": BENCH_API_KEY}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "CargoHubV2.app.main:app", "--port", str(port),
+         "--workers", str(workers), "--log-level", "error"],
+        cwd=ROOT, env=env
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/api/v2/orders/?limit=1", headers={"api-key": BENCH_API_KEY})
+            return server
+        except httpx.TransportError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("uvicorn did not start")
+
+
+async def run_load(port: int, seconds: float, clients: int, uids: list):
+    latencies, failures, requests = [], [], 0
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", headers={"api-key": BENCH_API_KEY},
+                                 timeout=None, limits=httpx.Limits(max_connections=clients)) as client:
+        stop = time.perf_counter() + seconds
+
+        async def worker(number: int):
+            nonlocal requests
+            n = 0
+            while time.perf_counter() < stop:
+                n += 1
+                start = time.perf_counter()
+                # een op de vier requests is een nieuwe order
+                if n % 4 == 0:
+                    reference = number * 3000 + n
+                    response = await client.post("/api/v2/orders/",
+                                                 json=json_payload(order_payload(reference, 3, uids)))
+                else:
+                    response = await client.get(READS[n % len(READS)])
+                latencies.append((time.perf_counter() - start) * 1000)
+                requests += 1
+                if response.status_code >= 300:
+                    failures.append(response.status_code)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(number) for number in range(clients)))
+        elapsed = time.perf_counter() - start
+    return requests / elapsed, percentile(latencies, 0.5), percentile(latencies, 0.99), failures
+
+
+def run(backend: str, url: str, engine, workers: int, seconds: float, clients: int):
+    seed(engine, inventories=500)
+    engine.dispose()
+    port = free_port()
+    server = start_server(url, workers, port)
+    uids = item_uids(500)
+    try:
+        # een lege orders lijst geeft 404, dus eerst wat orders om te lezen
+        for reference in range(50):
+            httpx.post(f"http://127.0.0.1:{port}/api/v2/orders/", headers={"api-key": BENCH_API_KEY},
+                       json=json_payload(order_payload(99000 + reference, 3, uids)))
+        rate, p50, p99, failures = asyncio.run(run_load(port, seconds, clients, uids))
+    finally:
+        server.terminate()
+        server.wait()
+    print(f"{backend:>9} {workers:>8} {rate:>9.0f} {p50:>9.1f} {p99:>9.1f} {len(failures):>7}")
+    if failures:
+        print(f"{backend:>9} status codes {sorted(set(failures))}")
+
+
+def main():
+    if len(sys.argv) < 2:
+        sys.exit(__doc__)
+    postgres_url = sys.argv[1]
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 15
+    clients = int(sys.argv[3]) if len(sys.argv) > 3 else 32
+    levels = [int(level) for level in sys.argv[4:]] or [1, 2, 4]
+
+    print(f"{seconds:.0f}s per run, {clients} clients, 3 reads : 1 order create, {os.cpu_count()} cpus")
+    print(f"{'backend':>9} {'workers':>8} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'failed':>7}")
+    for workers in levels:
+        engine, path = temp_engine("tuned")
+        try:
+            run("sqlite", f"sqlite:///{path}", engine, workers, seconds, clients)
+        finally:
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+        engine = fresh_postgres(postgres_url)
+        try:
+            run("postgres", postgres_url, engine, workers, seconds, clients)
+        finally:
+            Base.metadata.drop_all(engine)
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
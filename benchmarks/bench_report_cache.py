@@ -0,0 +1,91 @@
+"""
+Benchmark voor de report cache in reporting_service.generate_pdf.
+
+Meet GET /api/v2/reports/{warehouse_id} zonder cache (charts, template en
+pdfkit bij elke aanvraag) en met een gecachte PDF voor dezelfde maand en
+cijfers. De PDF wordt in het request gemaakt (PDF_WORKERS=0), zie
+bench_pdf_jobs.py voor de process pool. Zonder wkhtmltopdf op het PATH
+wordt pdfkit overgeslagen en telt een miss alleen de charts en de
+template mee.
+
+    python benchmarks/bench_report_cache.py [orders] [requests]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert  # noqa: E402
+
+from benchmarks.bench_utils import temp_engine, session_factory, seed, bench_client  # noqa: E402
+from CargoHubV2.app import config  # noqa: E402
+from CargoHubV2.app.models import Order  # noqa: E402
+from CargoHubV2.app.services import reporting_service  # noqa: E402
+from CargoHubV2.app.services.rollup_service import rebuild_rollup  # noqa: E402
+
+
+def seed_orders(engine, orders: int):
+    start = datetime(2024, 9, 1)
+    with engine.begin() as conn:
+        conn.execute(insert(Order.__table__), [
+            {"id": id, "source_id": 1, "order_date": start + timedelta(minutes=id % 40_000),
+             "reference": f"ORD{id % 100000:05d}", "order_status": "Delivered", "warehouse_id": 1 + id % 5,
+             "total_amount": 10.0, "total_discount": 1.0, "total_tax": 2.0, "total_surcharge": 0.5,
+             "created_at": start, "updated_at": start, "is_deleted": False}
+            for id in range(1, orders + 1)
+        ])
+
+
+def time_requests(client, requests: int) -> list:
+    timings = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = client.get("/api/v2/reports/1", params={"year_to_report": 2024, "month_to_report": 9})
+        timings.append((time.perf_counter() - start) * 1000)
+        # 202 bij een miss (gerenderd in het request), 200 uit de cache
+        assert response.status_code in (200, 202), response.text
+    return sorted(timings)
+
+
+def main():
+    orders = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    engine, path = temp_engine("tuned")
+    pdf_dir = Path(tempfile.mkdtemp())
+    reporting_service.PDF_DIR = pdf_dir
+    config.PDF_WORKERS = 0
+    if shutil.which("wkhtmltopdf") is None:
+        print("wkhtmltopdf not found, a miss writes the rendered html instead of running pdfkit")
+        reporting_service.pdfkit.from_string = lambda html, output: Path(output).write_text(html)
+    try:
+        seed(engine, inventories=10)
+        seed_orders(engine, orders)
+        rebuild_rollup(session_factory(engine)())
+        client = bench_client(engine)
+
+        # miss: elke aanvraag opnieuw renderen (zoals voor de cache)
+        misses = []
+        for _ in range(requests):
+            for pdf in pdf_dir.iterdir():
+                pdf.unlink()
+            misses += time_requests(client, 1)
+        hits = time_requests(client, requests)
+
+        print(f"{'GET /reports/1':<16} {'p50 ms':>8} {'max ms':>8}")
+        for name, timings in (("miss", sorted(misses)), ("cached", hits)):
+            print(f"{name:<16} {timings[len(timings) // 2]:>8.1f} {timings[-1]:>8.1f}")
+    finally:
+        engine.dispose()
+        shutil.rmtree(pdf_dir)
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+if __name__ == "__main__":
+    main()
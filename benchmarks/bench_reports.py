@@ -0,0 +1,130 @@
+"""
+Benchmark voor de maandrapporten in reporting_service.
+
+Vergelijkt de oude manier (alle orders van de maand als ORM objecten laden en
+in Python optellen), een aggregate query over de orders van de maand, en
+report_totals over daily_order_rollup. Meet tijd en de piek van het Python
+geheugen (tracemalloc) voor maanden van verschillende grootte, en een report
+over het hele jaar.
+
+    python benchmarks/bench_reports.py [orders_per_month...]
+"""
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert, select, func  # noqa: E402
+
+from benchmarks.bench_utils import temp_engine, session_factory, seed, item_uids  # noqa: E402
+from CargoHubV2.app.models import Order, OrderLine  # noqa: E402
+from CargoHubV2.app.services.reporting_service import (  # noqa: E402
+    general_report, report_for_warehouse, month_range, report_totals)
+from CargoHubV2.app.services.rollup_service import rebuild_rollup  # noqa: E402
+
+BATCH = 50_000
+
+
+def seed_month(engine, first_id: int, orders: int, month: int, uids: list):
+    start = datetime(2024, month, 1)
+    for first in range(first_id, first_id + orders, BATCH):
+        ids = range(first, min(first + BATCH, first_id + orders))
+        with engine.begin() as conn:
+            conn.execute(insert(Order.__table__), [
+                {"id": id, "source_id": 1, "order_date": start + timedelta(minutes=id % 40_000),
+                 "reference": f"ORD{id % 100000:05d}", "order_status": "Delivered", "warehouse_id": 1,
+                 "total_amount": 10.0, "total_discount": 1.0, "total_tax": 2.0, "total_surcharge": 0.5,
+                 "created_at": start, "updated_at": start, "is_deleted": False}
+                for id in ids
+            ])
+            conn.execute(insert(OrderLine.__table__), [
+                {"order_id": id, "item_uid": uids[(id + n) % len(uids)][1], "amount": 1}
+                for id in ids for n in range(4)
+            ])
+
+
+def old_report(db, year: int, month: int):
+    # zoals general_report was, zonder offset/limit zodat de totalen kloppen
+    start, end = month_range(year, month)
+    orders = db.query(Order).filter(Order.order_date >= start, Order.order_date < end,
+                                    Order.is_deleted == False).all()
+    return {
+        "orders_done": f"{len(orders)}",
+        "amount_of_items_sold": f"{sum(item['amount'] for order in orders for item in order.items)}",
+        "total_revenue": f"{sum(order.total_amount for order in orders)}",
+    }
+
+
+def orders_report(db, year: int, month: int):
+    # aggregate over de orders tabel, zoals report_totals was voor de rollup
+    start, end = month_range(year, month)
+    items_per_order = (
+        select(func.sum(OrderLine.amount)).where(OrderLine.order_id == Order.id).correlate(Order).scalar_subquery()
+    )
+    totals = db.query(func.count(Order.id), func.coalesce(func.sum(items_per_order), 0)).filter(
+        Order.order_date >= start, Order.order_date < end, Order.is_deleted == False).one()
+    return {"orders_done": f"{totals[0]}", "amount_of_items_sold": f"{totals[1]}"}
+
+
+def year_report(db, year: int):
+    start, _ = month_range(year, 1)
+    _, end = month_range(year, 12)
+    return report_totals(db, start, end)
+
+
+def measure(Session, report, *args):
+    db = Session()
+    try:
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = report(db, *args)
+        elapsed = (time.perf_counter() - start) * 1000
+        peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        tracemalloc.stop()
+        return result, elapsed, peak
+    finally:
+        db.close()
+
+
+def main():
+    sizes = [int(size) for size in sys.argv[1:]] or [1_000, 10_000, 100_000]
+    uids = item_uids(500)
+    engine, path = temp_engine("tuned")
+    try:
+        seed(engine, inventories=10)
+        Session = session_factory(engine)
+        first_id = 1
+        for month, size in enumerate(sizes, start=1):
+            seed_month(engine, first_id, size, month, uids)
+            first_id += size
+        start = time.perf_counter()
+        rows = rebuild_rollup(Session())
+        print(f"rebuild_rollup: {rows} rows in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        print(f"{'orders':>8} {'report':<22} {'ms':>9} {'peak MB':>9}")
+        for month, size in enumerate(sizes, start=1):
+            old, old_ms, old_peak = measure(Session, old_report, 2024, month)
+            sql, sql_ms, sql_peak = measure(Session, orders_report, 2024, month)
+            new, new_ms, new_peak = measure(Session, general_report, 2024, month)
+            _, wh_ms, wh_peak = measure(Session, report_for_warehouse, 1, 2024, month)
+            assert old["orders_done"] == sql["orders_done"] == new["orders_done"]
+            assert old["amount_of_items_sold"] == sql["amount_of_items_sold"] == new["amount_of_items_sold"]
+            print(f"{size:>8} {'ORM + Python sum':<22} {old_ms:>9.1f} {old_peak:>9.1f}")
+            print(f"{size:>8} {'SQL over orders':<22} {sql_ms:>9.1f} {sql_peak:>9.2f}")
+            print(f"{size:>8} {'general_report':<22} {new_ms:>9.1f} {new_peak:>9.2f}")
+            print(f"{size:>8} {'report_for_warehouse':<22} {wh_ms:>9.1f} {wh_peak:>9.2f}")
+        totals, year_ms, year_peak = measure(Session, year_report, 2024)
+        assert totals.orders_done == sum(sizes)
+        print(f"{sum(sizes):>8} {'rollup, whole year':<22} {year_ms:>9.1f} {year_peak:>9.2f}")
+    finally:
+        engine.dispose()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark voor sparse fieldsets (fields=) op list endpoints.
+
+Vraagt pagina's van 1000 orders, shipments, warehouses en locations op via de
+app (TestClient), een keer met alle velden en een keer met alleen de velden
+die een dashboard pollt. Meet de hele request en de grootte van de response.
+
+    python benchmarks/bench_sparse_fields.py [rows] [requests]
+"""
+import os
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert  # noqa: E402
+
+from benchmarks.bench_utils import temp_engine, bench_client  # noqa: E402
+from benchmarks.bench_list_responses import seed_lists, time_requests  # noqa: E402
+from CargoHubV2.app.models import Location, Warehouse  # noqa: E402
+
+ENDPOINTS = (
+    ("/api/v2/orders/?limit=1000&sort_by=id", "id,order_status,warehouse_id"),
+    ("/api/v2/shipments/?limit=1000", "id,shipment_status"),
+    ("/api/v2/warehouses/?limit=1000", "id,code,city"),
+    ("/api/v2/locations/?limit=1000", "id,code"),
+)
+
+
+def seed_locations(engine, rows: int):
+    now = datetime(2024, 9, 1, 12, 0, 0)
+    with engine.begin() as conn:
+        conn.execute(insert(Warehouse.__table__), [
+            {"id": id, "code": f"WH{id:06d}", "name": f"Warehouse {id}", "address": "Street 1", "zip": "1234AB",
+             "city": "Rotterdam", "province": "Zuid-Holland", "country": "NL",
+             "contact": {"name": "Contact person", "phone": "010-1234567", "email": f"wh{id}@example.com"},
+             "forbidden_classifications": ["1.1", "2.3"], "created_at": now, "updated_at": now, "is_deleted": False}
+            for id in range(2, rows + 1)
+        ])
+        conn.execute(insert(Location.__table__), [
+            {"id": id, "warehouse_id": 1, "code": f"A.{id}.0", "name": f"Row: A, Rack: {id}, Shelf: 0",
+             "stock": [{"item_id": f"P{n:06d}", "amount": n} for n in range(1, 51)], "max_weight": 500.0,
+             "created_at": now, "updated_at": now, "is_deleted": False}
+            for id in range(1, rows + 1)
+        ])
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    engine, path = temp_engine("tuned")
+    try:
+        seed_lists(engine, rows)
+        seed_locations(engine, rows)
+        client = bench_client(engine)
+        print(f"{'endpoint':<40} {'fields':<30} {'median ms':>10} {'bytes':>9}")
+        for url, fields in ENDPOINTS:
+            for selected in ("", fields):
+                elapsed, size = time_requests(client, url + (f"&fields={selected}" if selected else ""), requests)
+                print(f"{url:<40} {selected or 'all':<30} {elapsed:>10.1f} {size:>9}")
+    finally:
+        engine.dispose()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+if __name__ == "__main__":
+    main()
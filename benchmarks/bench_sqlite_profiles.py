@@ -0,0 +1,131 @@
+"""
+Benchmark voor de sqlite pragma profielen uit database.SQLITE_PROFILES.
+
+Per profiel eerst de kosten van een losse commit (journal + fsync), daarna
+draaien een aantal lezers (orders en inventories lijst) en schrijvers (nieuwe
+orders, die ook inventories bijwerken) tegelijk tegen de API, en wordt de
+p50/p99 latency per soort request gerapporteerd.
+
+    python benchmarks/bench_sqlite_profiles.py [seconds] [readers] [writers]
+"""
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import update  # noqa: E402
+
+from benchmarks.bench_utils import temp_engine, seed, item_uids, order_payload, bench_client, json_payload  # noqa: E402
+from CargoHubV2.app.database import SQLITE_PROFILES  # noqa: E402
+from CargoHubV2.app.models import Inventory  # noqa: E402
+
+READS = ["/api/v2/orders/?limit=20&sort_by=id", "/api/v2/inventories/?limit=20"]
+
+
+def percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def remove_database(engine, path: str):
+    engine.dispose()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
+def commit_latency(profile: str, commits: int = 500):
+    engine, path = temp_engine(profile)
+    try:
+        seed(engine, inventories=10)
+        timings = []
+        for _ in range(commits):
+            start = time.perf_counter()
+            with engine.begin() as conn:
+                conn.execute(update(Inventory.__table__).where(Inventory.id == 1)
+                             .values(total_ordered=Inventory.total_ordered + 1))
+            timings.append((time.perf_counter() - start) * 1000)
+        print(f"{profile:>8} {'commit':<24} {commits:>7} {percentile(timings, 0.5):>9.3f} "
+              f"{percentile(timings, 0.99):>9.3f}")
+    finally:
+        remove_database(engine, path)
+
+
+def reader(client, stop, latencies, errors):
+    n = 0
+    while not stop.is_set():
+        path = READS[n % len(READS)]
+        start = time.perf_counter()
+        response = client.get(path)
+        latencies[path.split("?")[0]].append((time.perf_counter() - start) * 1000)
+        if response.status_code != 200:
+            errors.append(response.status_code)
+        n += 1
+
+
+def writer(client, stop, latencies, errors, first_reference, uids):
+    reference = first_reference
+    while not stop.is_set():
+        reference += 1
+        start = time.perf_counter()
+        response = client.post("/api/v2/orders/", json=json_payload(order_payload(reference, 5, uids)))
+        latencies["POST /api/v2/orders/"].append((time.perf_counter() - start) * 1000)
+        if response.status_code >= 300:
+            errors.append(response.status_code)
+
+
+def run_profile(profile: str, seconds: float, readers: int, writers: int):
+    engine, path = temp_engine(profile)
+    try:
+        seed(engine, inventories=500)
+        uids = item_uids(500)
+        client = bench_client(engine)
+        # wat orders om te lezen
+        for reference in range(200):
+            client.post("/api/v2/orders/", json=json_payload(order_payload(reference, 5, uids)))
+
+        latencies = {"/api/v2/orders/": [], "/api/v2/inventories/": [], "POST /api/v2/orders/": []}
+        errors = []
+        stop = threading.Event()
+        threads = [
+            threading.Thread(target=reader, args=(TestClient(client.app, headers=client.headers), stop, latencies,
+                                                  errors))
+            for _ in range(readers)
+        ] + [
+            threading.Thread(target=writer, args=(TestClient(client.app, headers=client.headers), stop, latencies,
+                                                  errors, 1000 * (n + 1), uids))
+            for n in range(writers)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        for name, values in latencies.items():
+            print(f"{profile:>8} {name:<24} {len(values):>7} {percentile(values, 0.5):>9.2f} "
+                  f"{percentile(values, 0.99):>9.2f}")
+        if errors:
+            print(f"{profile:>8} {len(errors)} failed requests, status codes {sorted(set(errors))}")
+    finally:
+        remove_database(engine, path)
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    readers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    writers = int(sys.argv[3]) if len(sys.argv) > 3 else 2
+    print(f"{seconds:.0f}s per profile, {readers} readers, {writers} writers")
+    print(f"{'profile':>8} {'request':<24} {'count':>7} {'p50 ms':>9} {'p99 ms':>9}")
+    for profile in SQLITE_PROFILES:
+        commit_latency(profile)
+    for profile in SQLITE_PROFILES:
+        run_profile(profile, seconds, readers, writers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark voor template_service.
+
+1. report en packing list template: per aanroep de file lezen en een nieuwe
+   jinja2.Template bouwen (zoals voorheen) tegen de gedeelde environment.
+2. eerste get_template in een nieuw process (nieuwe Environment), met en
+   zonder bytecode cache.
+3. waar de tijd van een report PDF zit: charts, render en pdf (de tijden die
+   job_service logt). Zonder wkhtmltopdf op het PATH wordt de html
+   weggeschreven i.p.v. pdfkit te draaien.
+
+    python benchmarks/bench_templates.py [renders]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, Template  # noqa: E402
+
+from CargoHubV2.app.services import reporting_service, template_service  # noqa: E402
+
+REPORT = {"warehouse": "1", "target_month": "2024-9", "orders_done": "1500", "amount_of_items_sold": "60",
+          "total_revenue": "15000.0", "total_discount": "1500.0", "total_tax": "3000.0", "total_surcharge": "750.0"}
+PACKING_LIST = {"orders": [{"order_id": 1, "warehouse_id": 1, "source_id": 1, "order_date": "2024-09-01",
+                            "request_date": "2024-09-03", "shipping_notes": "", "total_items": 20,
+                            "total_amount": 40, "items": [{"item_id": f"P{n:06d}", "amount": 2} for n in range(20)]}]}
+CHARTS = {"bar_chart": "data:image/png;base64,AAAA", "pie_chart": "data:image/png;base64,AAAA"}
+
+
+def per_call(name: str, context: dict):
+    with open(template_service.TEMPLATE_DIR / name, "r") as file:
+        return Template(file.read()).render(**context)
+
+
+def time_renders(render, name: str, context: dict, renders: int) -> float:
+    start = time.perf_counter()
+    for _ in range(renders):
+        render(name, context)
+    return (time.perf_counter() - start) * 1000 / renders
+
+
+def first_load(bytecode_cache) -> float:
+    environment = Environment(loader=FileSystemLoader(template_service.TEMPLATE_DIR), bytecode_cache=bytecode_cache)
+    start = time.perf_counter()
+    environment.get_template("report_template.html")
+    environment.get_template("packinglist_template.html")
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    renders = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(f"{'template':<28} {'per call ms':>12} {'environment ms':>15}")
+    for name, context in (("report_template.html", {**REPORT, **CHARTS}),
+                          ("packinglist_template.html", PACKING_LIST)):
+        old = time_renders(per_call, name, context, renders)
+        new = time_renders(lambda name, context: template_service.render(name, **context), name, context, renders)
+        print(f"{name:<28} {old:>12.3f} {new:>15.3f}")
+
+    cache_dir = tempfile.mkdtemp()
+    try:
+        first_load(FileSystemBytecodeCache(cache_dir))
+        print(f"first get_template, no bytecode cache: {first_load(None):.1f} ms, "
+              f"with bytecode cache: {first_load(FileSystemBytecodeCache(cache_dir)):.1f} ms")
+    finally:
+        shutil.rmtree(cache_dir)
+
+    pdf_dir = Path(tempfile.mkdtemp())
+    if shutil.which("wkhtmltopdf") is None:
+        print("wkhtmltopdf not found, the pdf step writes the html instead")
+        reporting_service.pdfkit.from_string = lambda html, output: Path(output).write_text(html)
+    try:
+        timings = [reporting_service.render_pdf(REPORT, str(pdf_dir / f"report_{n}.pdf")) for n in range(10)]
+        print("report PDF, mean of 10: " + ", ".join(
+            f"{stage} {sum(timing[stage] for timing in timings) / len(timings):.1f} ms" for stage in timings[0]))
+    finally:
+        shutil.rmtree(pdf_dir)
+
+
+if __name__ == "__main__":
+    main()
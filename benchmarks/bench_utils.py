@@ -0,0 +1,132 @@
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from CargoHubV2.app.models import Base, Warehouse, Inventory, Shipment, Item
+from CargoHubV2.app.database import apply_sqlite_pragmas, sqlite_pragmas
+
+
+# handige functies voor de benchmarks, los van de echte Cargo_Database.db
+def temp_engine(profile: str = None):
+    # zonder profiel de sqlite standaard pragmas, anders die van database.SQLITE_PROFILES
+    fd, path = tempfile.mkstemp(suffix=".db", prefix="cargohub_bench_")
+    os.close(fd)
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    if profile:
+        apply_sqlite_pragmas(engine, sqlite_pragmas(profile, overrides={}))
+    Base.metadata.create_all(engine)
+    return engine, path
+
+
+def session_factory(engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def item_uids(count: int):
+    # orders_service haalt het inventory id uit de uid door op "0" te splitten,
+    # dus alleen nummers zonder een 0 erin gebruiken
+    n = 1
+    uids = []
+    while len(uids) < count:
+        if "0" not in str(n):
+            uids.append((n, f"P{n:06d}"))
+        n += 1
+    return uids
+
+
+def seed(engine, inventories: int = 1000, stock: int = 1_000_000):
+    now = datetime.now()
+    with engine.begin() as conn:
+        conn.execute(insert(Warehouse.__table__), [{
+            "id": 1, "code": "BENCH001", "name": "Benchmark warehouse",
+            "created_at": now, "updated_at": now, "is_deleted": False,
+        }])
+        conn.execute(insert(Shipment.__table__), [{
+            "id": 1, "shipment_type": "O", "shipment_status": "Pending",
+            "created_at": now, "updated_at": now, "is_deleted": False,
+        }])
+        # postgres controleert de foreign key van inventories naar items wel
+        conn.execute(insert(Item.__table__), [
+            {"uid": uid, "code": uid, "created_at": now, "updated_at": now, "is_deleted": False}
+            for _, uid in item_uids(inventories)
+        ])
+        conn.execute(insert(Inventory.__table__), [
+            {
+                "id": inventory_id, "item_id": uid, "item_reference": f"ref{inventory_id}",
+                "locations": [], "total_on_hand": stock, "total_expected": 0,
+                "total_ordered": 0, "total_allocated": 0, "total_available": stock,
+                "created_at": now, "updated_at": now, "is_deleted": False,
+            }
+            for inventory_id, uid in item_uids(inventories)
+        ])
+
+
+def order_payload(reference: int, lines: int, uids: list):
+    return {
+        "source_id": 1,
+        "order_date": datetime(2024, 9, 1 + reference % 28, 12, 0, 0),
+        "request_date": datetime(2024, 9, 28),
+        "reference": f"ORD{reference % 100000:05d}",
+        "order_status": "Pending",
+        "warehouse_id": 1,
+        "shipment_id": [1],
+        "total_amount": 100.0,
+        "total_discount": 1.0,
+        "total_tax": 2.0,
+        "total_surcharge": 3.0,
+        "items": [{"item_id": uids[i % len(uids)][1], "amount": 1} for i in range(lines)],
+    }
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000
+
+
+BENCH_API_KEY = "bench-warehouse-manager"
+
+
+def bench_client(engine):
+    # app tegen de benchmark database, met een warehouse manager key
+    os.environ.setdefault("WAREHOUSE_MANAGER", BENCH_API_KEY)
+    from fastapi.testclient import TestClient
+    from CargoHubV2.app.main import app
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+    from CargoHubV2.app.database import get_db, get_async_db
+    from CargoHubV2.app.services import auth_service
+
+    Session = session_factory(engine)
+    AsyncSession = async_sessionmaker(
+        create_async_engine(engine.url.set(drivername="sqlite+aiosqlite")), autoflush=False, expire_on_commit=False
+    )
+    # api keys uit de api_keys tabel ook uit de benchmark database halen
+    auth_service.SessionLocal = Session
+
+    def override_get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def override_get_async_db():
+        async with AsyncSession() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    # geen warning per geweigerd request tijdens het meten
+    logging.getLogger("uvicorn.error").setLevel(logging.ERROR)
+    client = TestClient(app)
+    client.headers.update({"api-key": os.environ["WAREHOUSE_MANAGER"]})
+    return client
+
+
+def json_payload(payload: dict):
+    return {key: value.isoformat() if isinstance(value, datetime) else value for key, value in payload.items()}
@@ -0,0 +1,135 @@
+import pytest
+from unittest.mock import MagicMock
+from fastapi import HTTPException
+from CargoHubV2.app.services import auth_service
+from CargoHubV2.app.services.auth_service import (
+    TTLCache,
+    build_route_table,
+    lookup_route,
+    authorize,
+    resolve_role,
+    deactivate_api_key
+)
+
+ROLES = {"wm-key": "warehouse_manager", "fm-key": "floor_manager", "emp-key": "employee"}
+
+
+@pytest.fixture
+def route_table():
+    return build_route_table()
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    auth_service.key_cache.clear()
+    auth_service.static_roles.clear()
+    for name in auth_service.metrics:
+        auth_service.metrics[name] = 0
+    yield
+    auth_service.key_cache.clear()
+    auth_service.set_metrics_hook(None)
+
+
+def session_for(role):
+    db = MagicMock()
+    db.query().filter().first.return_value = MagicMock(role=role) if role else None
+    return db
+
+
+@pytest.mark.parametrize("path, key, expected", [
+    ("/api/v2/reports/1", "wm-key", None),
+    ("/api/v2/reports/1", "fm-key", 403),
+    ("/api/v2/items/P000001", "fm-key", None),
+    ("/api/v2/items/P000001", "emp-key", 403),
+    ("/api/v2/item_groups/", "emp-key", 403),
+    ("/api/v2/orders/", "emp-key", None),
+    ("/api/v2/orders/1/items", "emp-key", None),
+    ("/api/v2/orders/", "unknown", 403),
+    ("/api/v2/orders/", None, 422),
+    ("/api/v2/load/", "wm-key", None),
+    ("/api/v2/load/", "emp-key", 403),
+    ("/docs", None, None),
+    ("/status", "unknown", None),
+])
+def test_authorize(route_table, path, key, expected):
+    result = authorize(route_table, path, key, ROLES.get)
+    assert (result[0] if result else None) == expected
+
+
+def test_authorize_detail(route_table):
+    assert authorize(route_table, "/api/v2/clients", "emp-key", ROLES.get) == \
+        (403, "Invalid API key, need to be Warehouse manager")
+    assert authorize(route_table, "/api/v2/orders", "", ROLES.get) == (422, "Missing API key")
+
+
+def test_lookup_route_unknown_prefix(route_table):
+    assert lookup_route(route_table, "/api/v2/status/") is None
+    assert lookup_route(route_table, "/api/v2/itemsx") is None
+
+
+def test_resolve_role_static_keys_skip_database():
+    auth_service.set_static_roles({"warehouse_manager": "wm-key", "floor_manager": None})
+    session_factory = MagicMock()
+    assert resolve_role("wm-key", session_factory) == "warehouse_manager"
+    session_factory.assert_not_called()
+
+
+def test_resolve_role_caches_database_keys():
+    db = session_for("floor_manager")
+    session_factory = MagicMock(return_value=db)
+    assert resolve_role("client-key", session_factory) == "floor_manager"
+    assert resolve_role("client-key", session_factory) == "floor_manager"
+    session_factory.assert_called_once()
+    db.close.assert_called_once()
+    assert auth_service.cache_stats()["hit_ratio"] == 0.5
+
+
+def test_resolve_role_negative_cache():
+    session_factory = MagicMock(return_value=session_for(None))
+    assert resolve_role("unknown", session_factory) is None
+    assert resolve_role("unknown", session_factory) is None
+    session_factory.assert_called_once()
+
+
+def test_metrics_hook():
+    hook = MagicMock()
+    auth_service.set_metrics_hook(hook)
+    resolve_role("client-key", MagicMock(return_value=session_for("employee")))
+    names = [call.args[0] for call in hook.call_args_list]
+    assert names == ["api_key.lookup_seconds", "api_key.cache_hit_ratio"]
+
+
+def test_deactivate_api_key_invalidates_cache():
+    resolve_role("client-key", MagicMock(return_value=session_for("employee")))
+    record = MagicMock(is_active=True)
+    db = MagicMock()
+    db.query().filter().first.return_value = record
+
+    result = deactivate_api_key(db, "client-key")
+
+    assert result == {"detail": "API key deactivated"}
+    assert record.is_active is False
+    db.commit.assert_called_once()
+    assert auth_service.key_cache.get("client-key") == (False, None)
+
+
+def test_deactivate_api_key_not_found():
+    db = MagicMock()
+    db.query().filter().first.return_value = None
+    with pytest.raises(HTTPException) as excinfo:
+        deactivate_api_key(db, "unknown")
+    assert excinfo.value.status_code == 404
+
+
+def test_ttl_cache_expiry_and_lru():
+    now = [0.0]
+    cache = TTLCache(maxsize=2, ttl=10, clock=lambda: now[0])
+    cache.set("a", 1)
+    cache.set("b", None)
+    assert cache.get("b") == (True, None)
+    cache.get("a")
+    cache.set("c", 3)
+    # b was het langst niet gebruikt
+    assert cache.get("b") == (False, None)
+    now[0] = 11
+    assert cache.get("a") == (False, None)
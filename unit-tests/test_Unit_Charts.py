@@ -0,0 +1,65 @@
+import sys
+import base64
+import pytest
+import xml.etree.ElementTree as ET
+from CargoHubV2.app.services import chart_service
+
+SVG = "{http://www.w3.org/2000/svg}"
+REPORT = {"amount_of_items_sold": "25", "total_revenue": "1505.0", "total_discount": "150.0",
+          "total_tax": "300.0", "total_surcharge": "75.0"}
+
+
+def decode(uri: str, mime: str) -> bytes:
+    prefix = f"data:{mime};base64,"
+    assert uri.startswith(prefix)
+    return base64.b64decode(uri[len(prefix):])
+
+
+def test_svg_bar_chart_scaled_to_values():
+    charts = chart_service.create_charts(REPORT, "svg")
+    svg = ET.fromstring(decode(charts["bar_chart"], "image/svg+xml"))
+
+    heights = [float(rect.get("height")) for rect in svg.iter(f"{SVG}rect")]
+    assert len(heights) == 4
+    # revenue is 10x de discount en 5x de tax
+    assert heights[0] == pytest.approx(heights[1] * 10, rel=0.01)
+    assert heights[0] == pytest.approx(heights[2] * 5, rel=0.01)
+    assert "Financial Summary" in [text.text for text in svg.iter(f"{SVG}text")]
+
+
+def test_svg_pie_chart_percentages():
+    charts = chart_service.create_charts(REPORT, "svg")
+    svg = ET.fromstring(decode(charts["pie_chart"], "image/svg+xml"))
+
+    assert len(list(svg.iter(f"{SVG}path"))) == 2
+    texts = [text.text for text in svg.iter(f"{SVG}text")]
+    assert "25.0%" in texts and "75.0%" in texts
+
+
+@pytest.mark.parametrize("items_sold, circles", [("0", 1), ("150", 1)])
+def test_svg_pie_chart_single_slice(items_sold, circles):
+    charts = chart_service.create_charts({**REPORT, "amount_of_items_sold": items_sold}, "svg")
+    svg = ET.fromstring(decode(charts["pie_chart"], "image/svg+xml"))
+    assert len(list(svg.iter(f"{SVG}circle"))) == circles
+    assert list(svg.iter(f"{SVG}path")) == []
+
+
+def test_svg_bar_chart_empty_month():
+    charts = chart_service.create_charts({**REPORT, "total_revenue": "0", "total_discount": "0",
+                                          "total_tax": "0", "total_surcharge": "0"}, "svg")
+    svg = ET.fromstring(decode(charts["bar_chart"], "image/svg+xml"))
+    assert [float(rect.get("height")) for rect in svg.iter(f"{SVG}rect")] == [0.0] * 4
+
+
+def test_matplotlib_backend_png():
+    pytest.importorskip("matplotlib")
+    charts = chart_service.create_charts(REPORT, "matplotlib")
+    assert decode(charts["bar_chart"], "image/png").startswith(b"\x89PNG")
+    assert decode(charts["pie_chart"], "image/png").startswith(b"\x89PNG")
+    assert "matplotlib.pyplot" not in sys.modules
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        chart_service.create_charts(REPORT, "gnuplot")
+
@@ -0,0 +1,49 @@
+import pytest
+from unittest.mock import patch
+from sqlalchemy import create_engine
+from CargoHubV2.app.database import apply_sqlite_pragmas, sqlite_pragmas, SQLITE_PROFILES, engine_options, async_url
+
+
+def test_sqlite_pragmas_profile():
+    assert sqlite_pragmas("tuned", overrides={}) == SQLITE_PROFILES["tuned"]
+    assert sqlite_pragmas("legacy", overrides={}) == {}
+
+
+def test_sqlite_pragmas_env_overrides():
+    with patch("CargoHubV2.app.config.SQLITE_PRAGMAS", {"synchronous": "FULL"}):
+        pragmas = sqlite_pragmas("tuned")
+
+    assert pragmas["synchronous"] == "FULL"
+    assert pragmas["journal_mode"] == "WAL"
+
+
+def test_sqlite_pragmas_unknown_profile():
+    with pytest.raises(ValueError):
+        sqlite_pragmas("fast")
+
+
+def test_apply_sqlite_pragmas_on_connect(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    apply_sqlite_pragmas(engine, sqlite_pragmas("tuned", overrides={"busy_timeout": 1234}))
+
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+        assert conn.exec_driver_sql("PRAGMA temp_store").scalar() == 2
+        assert conn.exec_driver_sql("PRAGMA busy_timeout").scalar() == 1234
+    engine.dispose()
+
+
+def test_engine_options_per_backend():
+    assert engine_options("sqlite:///test.db") == {"connect_args": {"check_same_thread": False}}
+    with patch("CargoHubV2.app.config.DB_POOL_SIZE", 5):
+        options = engine_options("postgresql+psycopg2://postgres@localhost/cargohub")
+    assert options["pool_size"] == 5
+    assert options["pool_pre_ping"] is True
+
+
+def test_async_url_picks_async_driver():
+    assert async_url("sqlite:///test.db").drivername == "sqlite+aiosqlite"
+    assert async_url("postgresql+psycopg2://postgres@localhost/cargohub").drivername == "postgresql+asyncpg"
+    with pytest.raises(ValueError):
+        async_url("mysql://localhost/cargohub")
@@ -0,0 +1,93 @@
+import pytest
+from datetime import datetime
+from fastapi import HTTPException, Request
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import sessionmaker
+from CargoHubV2.app.models import Base, Order, Warehouse
+from CargoHubV2.app.services.filtering_service import apply_filters, filter_params, MAX_IN_VALUES
+from CargoHubV2.app.services.orders_service import get_all_orders
+from CargoHubV2.app.services.warehouses_service import get_all_warehouses
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    for id in range(1, 7):
+        db.add(Order(id=id, source_id=1, order_date=datetime(2024, 9, id, 8 + id), reference=f"ORD{id:05d}",
+                     order_status="Pending" if id % 2 else "Packed", warehouse_id=1 + id % 3,
+                     notes="50% korting" if id == 1 else None, total_amount=10.0 * id, is_deleted=id == 6))
+    db.add(Warehouse(id=1, code="WH1", name="Warehouse 1", city="Rotterdam", contact={"name": "A"},
+                     is_deleted=False))
+    db.add(Warehouse(id=2, code="WH2", name="Warehouse 2", city="Utrecht", contact={"name": "B"},
+                     is_deleted=False))
+    db.commit()
+    yield db
+    db.close()
+
+
+def order_ids(db, filters):
+    query = apply_filters(select(Order.id).filter(Order.is_deleted == False), Order, filters)
+    return db.execute(query.order_by(Order.id)).scalars().all()
+
+
+def test_filter_params():
+    request = Request({"type": "http", "query_string": b"limit=10&warehouse_id__eq=2&order_status__in=Pending,Packed"})
+    # alleen veld__op parameters, limit hoort bij de route
+    assert filter_params(request) == [("warehouse_id__eq", "2"), ("order_status__in", "Pending,Packed")]
+
+
+@pytest.mark.parametrize("filters, expected", [
+    ([], [1, 2, 3, 4, 5]),
+    ([("warehouse_id__eq", "2")], [1, 4]),
+    ([("order_status__in", "Packed,Shipped")], [2, 4]),
+    ([("order_date__gte", "2024-09-02"), ("order_date__lte", "2024-09-04")], [2, 3]),
+    ([("total_amount__gte", "30"), ("order_status__eq", "Pending")], [3, 5]),
+    ([("id__in", "1,3,5"), ("warehouse_id__eq", "3")], [5]),
+    ([("notes__contains", "50%")], [1]),
+    ([("reference__contains", "%")], []),
+])
+def test_apply_filters(db, filters, expected):
+    assert order_ids(db, filters) == expected
+
+
+@pytest.mark.parametrize("key, value", [
+    ("warehouse_id__like", "1"),
+    ("bogus__eq", "1"),
+    ("lines__eq", "1"),
+    ("shipment_id__eq", "[1]"),
+    ("warehouse_id__eq", "abc"),
+    ("order_date__gte", "yesterday"),
+    ("total_amount__contains", "1"),
+    ("id__in", ","),
+    ("id__in", ",".join(str(id) for id in range(MAX_IN_VALUES + 1))),
+])
+def test_apply_filters_invalid(db, key, value):
+    # relaties, JSON kolommen en verkeerde waarden geven een 400 en geen database fout
+    with pytest.raises(HTTPException) as excinfo:
+        order_ids(db, [(key, value)])
+    assert excinfo.value.status_code == 400
+
+
+def test_filter_boolean(db):
+    query = apply_filters(select(Order.id), Order, [("is_deleted__eq", "true")])
+    assert db.execute(query).scalars().all() == [6]
+
+
+def test_filter_uses_index(db):
+    query = apply_filters(select(Order.id).filter(Order.is_deleted == False), Order, [("warehouse_id__eq", "2")])
+    compiled = query.compile(db.get_bind(), compile_kwargs={"literal_binds": True})
+    plan = " ".join(row[-1] for row in db.execute(text(f"EXPLAIN QUERY PLAN {compiled}")))
+    assert "ix_orders_active_warehouse_id_order_date" in plan
+
+
+def test_get_all_orders_by_date(db):
+    # date filterde eerder niets, nu alle orders van die dag
+    orders = get_all_orders(db, date=datetime(2024, 9, 3), sort_by="id")
+    assert [order.id for order in orders] == [3]
+
+
+def test_get_all_warehouses_filters(db):
+    warehouses = get_all_warehouses(db, filters=[("city__eq", "Utrecht")])
+    assert [warehouse.code for warehouse in warehouses] == ["WH2"]
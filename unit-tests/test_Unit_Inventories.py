@@ -1,11 +1,14 @@
+import asyncio
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, AsyncMock, patch
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException
 from CargoHubV2.app.services.inventories_service import (
     create_inventory,
     get_inventory,
     get_all_inventories,
+    get_inventory_async,
+    get_all_inventories_async,
     update_inventory,
     delete_inventory)
 from CargoHubV2.app.models.inventories_model import Inventory
@@ -150,3 +153,26 @@ def test_delete_inventory_not_found():
         delete_inventory(db, "nonsens")
     assert excinfo.value.status_code == 404
     assert "Inventory not found" in str(excinfo.value.detail)
+
+
+def async_db(first=None, rows=None):
+    db = MagicMock()
+    result = MagicMock()
+    result.scalars().first.return_value = first
+    result.scalars().all.return_value = rows or []
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+def test_get_inventory_async_not_found():
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(get_inventory_async(async_db(), "P000001"))
+    assert excinfo.value.status_code == 404
+
+
+def test_get_all_inventories_async_cursor():
+    inventories = [Inventory(id=1), Inventory(id=2)]
+    db = async_db(rows=inventories)
+
+    assert asyncio.run(get_all_inventories_async(db, limit=2, cursor="")) == inventories
+    assert "OFFSET" not in str(db.execute.await_args.args[0])
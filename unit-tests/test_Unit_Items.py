@@ -3,7 +3,13 @@ from unittest.mock import MagicMock, patch
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException
 from datetime import datetime
-from CargoHubV2.app.services.items_service import create_item, get_item, get_all_items, update_item, delete_item
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from CargoHubV2.app.services.items_service import (
+    create_item, get_item, get_all_items, update_item, delete_item, get_orders_for_item, get_shipments_for_item
+)
+from CargoHubV2.app.services.shipments_service import create_shipment
+from CargoHubV2.app.models import Base, Order
 from CargoHubV2.app.models.items_model import Item
 from CargoHubV2.app.schemas.items_schema import ItemCreate, ItemUpdate
 
@@ -179,3 +185,39 @@ def test_delete_item_not_found():
     result = delete_item(db, "nonexistent-code123")
 
     assert result == None
+
+
+@pytest.fixture
+def reverse_index_db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    db.add(Item(uid="P000001", code="ITEM-TEST"))
+    for id, status, deleted in [(1, "Pending", False), (2, "Delivered", False), (3, "Pending", True)]:
+        db.add(Order(id=id, source_id=1, order_date=datetime(2024, 1, 1), reference=f"ORD0000{id}",
+                     order_status=status, warehouse_id=1, total_amount=1.0, is_deleted=deleted,
+                     items=[{"item_id": "P000001", "amount": 1}, {"item_id": "P000001", "amount": 2}]))
+    db.add(Order(id=4, source_id=1, order_date=datetime(2024, 1, 1), reference="ORD00004",
+                 order_status="Pending", warehouse_id=1, total_amount=1.0, is_deleted=False,
+                 items=[{"item_id": "P000002", "amount": 1}]))
+    for id, status in [(1, "Pending"), (2, "Delivered")]:
+        create_shipment(db, {"id": id, "shipment_status": status, "items": [{"item_id": "P000001", "amount": 1}]})
+    db.commit()
+    yield db
+    db.close()
+
+
+def test_get_orders_for_item(reverse_index_db):
+    assert get_orders_for_item(reverse_index_db, "ITEM-TEST") == {"item_id": "P000001", "order_ids": [1]}
+    assert get_orders_for_item(reverse_index_db, "P000001", open_only=False)["order_ids"] == [1, 2]
+
+
+def test_get_shipments_for_item(reverse_index_db):
+    assert get_shipments_for_item(reverse_index_db, "ITEM-TEST") == {"item_id": "P000001", "shipment_ids": [1]}
+    assert get_shipments_for_item(reverse_index_db, "ITEM-TEST", open_only=False)["shipment_ids"] == [1, 2]
+
+
+def test_get_orders_for_unknown_item(reverse_index_db):
+    with pytest.raises(HTTPException) as excinfo:
+        get_orders_for_item(reverse_index_db, "NOPE")
+    assert excinfo.value.status_code == 404
@@ -0,0 +1,119 @@
+import json
+import time
+import shutil
+import pytest
+from fastapi import HTTPException
+from CargoHubV2.app import config
+from CargoHubV2.app.services import job_service
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(config, "PDF_WORKERS", 1)
+    monkeypatch.setattr(job_service, "jobs", {})
+    yield
+    job_service.shutdown(wait=True)
+
+
+def test_submit_deduplicates_in_flight_jobs(pool):
+    first = job_service.submit("slow.pdf", time.sleep, 0.5)
+    second = job_service.submit("slow.pdf", time.sleep, 0.5)
+
+    assert second is first
+    assert job_service.job_status("slow.pdf") == ("pending", None)
+    first.result(timeout=30)
+    assert job_service.job_status("slow.pdf") == ("done", None)
+
+
+def test_submit_queue_limit(pool, monkeypatch):
+    monkeypatch.setattr(config, "PDF_QUEUE_SIZE", 1)
+    job_service.submit("a.pdf", time.sleep, 0.5)
+    with pytest.raises(HTTPException) as excinfo:
+        job_service.submit("b.pdf", time.sleep, 0.5)
+    assert excinfo.value.status_code == 503
+
+
+def test_render_to_file_in_worker(pool, tmp_path):
+    source = tmp_path / "source.html"
+    source.write_text("<p>packing list</p>")
+    (tmp_path / "packinglist_order_1_old.pdf").write_text("old")
+    (tmp_path / "packinglist_order_12_other.pdf").write_text("other order")
+    pdf_path = tmp_path / "packinglist_order_1_new.pdf"
+
+    # shutil.copyfile als render functie: (content, pdf_path), en te pickelen voor de worker
+    job_service.submit(pdf_path.name, job_service.render_to_file, shutil.copyfile, str(source),
+                       str(pdf_path)).result(timeout=30)
+
+    assert pdf_path.read_text() == "<p>packing list</p>"
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "packinglist_order_12_other.pdf", "packinglist_order_1_new.pdf", "source.html"]
+
+
+def test_failed_job_status(pool, tmp_path):
+    future = job_service.submit("missing.pdf", job_service.render_to_file, shutil.copyfile,
+                                str(tmp_path / "missing.html"), str(tmp_path / "missing.pdf"))
+    with pytest.raises(FileNotFoundError):
+        future.result(timeout=30)
+
+    response = job_service.pdf_status_response("missing.pdf")
+    assert response.status_code == 500
+    assert json.loads(response.body)["status"] == "failed"
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_pdf_status_unknown_job(monkeypatch):
+    monkeypatch.setattr(job_service, "jobs", {})
+    with pytest.raises(HTTPException) as excinfo:
+        job_service.pdf_status_response("unknown.pdf")
+    assert excinfo.value.status_code == 404
+
+
+def test_queue_pdf_inline(monkeypatch, tmp_path):
+    monkeypatch.setattr(config, "PDF_WORKERS", 0)
+    monkeypatch.setattr(job_service, "jobs", {})
+    source = tmp_path / "content.html"
+    source.write_text("report")
+
+    # de map bestaat nog niet, die maakt de eerste PDF aan
+    pdf_dir = tmp_path / "generated_pdfs"
+
+    rendered = job_service.queue_pdf(lambda content, path: shutil.copyfile(source, path), {"month": "2024-9"},
+                                     pdf_dir, "report_for_all_month_2024-9", "http://host/get-pdf", "done")
+    body = json.loads(rendered.body)
+    # zonder workers is de PDF er al, dus direct 200 met de url
+    assert rendered.status_code == 200
+    assert body == {"message": "done", "pdf_url": body["pdf_url"]}
+    pdf_filename = body["pdf_url"].rsplit("/", 1)[1]
+    assert (pdf_dir / pdf_filename).read_text() == "report"
+    assert job_service.job_status(pdf_filename) == ("done", None)
+    assert job_service.queue_pdf(None, {"month": "2024-9"}, pdf_dir, "report_for_all_month_2024-9",
+                                 "http://host/get-pdf", "done").status_code == 200
+
+
+def test_queue_pdf_inline_failed(monkeypatch, tmp_path):
+    monkeypatch.setattr(config, "PDF_WORKERS", 0)
+    monkeypatch.setattr(job_service, "jobs", {})
+
+    def render(content, path):
+        raise OSError("No wkhtmltopdf executable found")
+
+    failed = job_service.queue_pdf(render, {"month": "2024-9"}, tmp_path, "report_for_all_month_2024-9",
+                                   "http://host/get-pdf", "done")
+    body = json.loads(failed.body)
+    assert failed.status_code == 500
+    assert body["status"] == "failed"
+    assert body["detail"] == "No wkhtmltopdf executable found"
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_job_timing_logged(monkeypatch, tmp_path, caplog):
+    monkeypatch.setattr(config, "PDF_WORKERS", 0)
+    monkeypatch.setattr(job_service, "jobs", {})
+
+    def render(content, path):
+        open(path, "w").write("pdf")
+        return {"render": 1.5, "pdf": 20.25}
+
+    with caplog.at_level("INFO", logger="uvicorn.error"):
+        job_service.submit("timed.pdf", job_service.render_to_file, render, {}, str(tmp_path / "timed.pdf"))
+    assert "PDF job timed.pdf done: render 1.5 ms, pdf 20.2 ms" in caplog.text
@@ -0,0 +1,241 @@
+import io
+from datetime import datetime
+import json
+import pytest
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import MagicMock, patch
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.exc import IntegrityError, OperationalError
+from CargoHubV2.app.services.loader_service import (
+    iter_json_array,
+    insert_chunk,
+    load_file,
+    load_parallel,
+    insert_rows,
+    file_dependencies,
+    read_checkpoint,
+    write_checkpoint,
+    resolve_data_dir,
+    load,
+    sequence_column,
+    model_mapping,
+    parse_iso_datetime
+)
+from CargoHubV2.app.models import Base, DailyOrderRollup, Order, OrderLine
+from CargoHubV2.app.models.item_groups_model import ItemGroup
+
+ITEM_GROUPS = [
+    {"id": 1, "name": "Electronics", "description": "", "created_at": "1998-05-15 19:52:53",
+     "updated_at": "2000-11-20 08:37:56"},
+    {"id": 2, "name": "Furniture", "description": "", "created_at": "2019-09-22 15:51:07",
+     "updated_at": "2022-05-18 13:49:28"},
+    {"id": 3, "name": "Home Appliances", "description": "", "created_at": "1979-01-16 07:07:50",
+     "updated_at": "2024-01-05 23:53:25"},
+]
+
+
+def test_iter_json_array_small_reads():
+    data = json.dumps(ITEM_GROUPS + [12345, [1, 2], "x"], indent=2)
+    # kleine read size, zodat records over meerdere reads verdeeld zijn
+    result = list(iter_json_array(io.StringIO(data), read_size=7))
+    assert result == ITEM_GROUPS + [12345, [1, 2], "x"]
+
+
+def test_iter_json_array_empty():
+    assert list(iter_json_array(io.StringIO(" [ ] "))) == []
+
+
+def test_iter_json_array_not_an_array():
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.StringIO('{"id": 1}')))
+
+
+def test_iter_json_array_truncated():
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.StringIO('[{"id": 1}, {"id": 2')))
+
+
+def test_insert_chunk_skips_bad_rows():
+    db = MagicMock()
+    # eerste poging (hele chunk) faalt, daarna alleen het tweede record
+    db.execute.side_effect = [IntegrityError("mock", "params", "orig"), None,
+                              IntegrityError("mock", "params", "orig"), None]
+    rows = [{"id": 1}, {"id": 1}, {"id": 2}]
+    with patch("builtins.print"):
+        errors = insert_chunk(db, ItemGroup.__table__, rows)
+    assert errors == 1
+    assert db.commit.call_count == 2
+    assert db.rollback.call_count == 2
+
+
+def test_load_file_resumes_from_checkpoint(tmp_path):
+    json_path = tmp_path / "item_groups.json"
+    json_path.write_text(json.dumps(ITEM_GROUPS))
+    db = MagicMock()
+    chunks = []
+    with patch("CargoHubV2.app.services.loader_service.insert_chunk", return_value=0) as mock_insert:
+        stats = load_file(db, str(json_path), "item_groups.json", 1, 1, chunks.append)
+    assert stats["rows"] == 2
+    assert stats["errors"] == 0
+    assert [call.args[2][0]["id"] for call in mock_insert.call_args_list] == [2, 3]
+    assert chunks == [2, 3, None]
+
+
+def test_load_orders_writes_order_lines(tmp_path):
+    orders = [
+        {"id": 1, "source_id": 1, "order_date": "2019-04-03T11:33:15Z", "reference": "ORD00001",
+         "order_status": "Pending", "warehouse_id": 1, "total_amount": 1.0,
+         "items": [{"item_id": "P000001", "amount": 2}, {"item_id": "P000002", "amount": 1}]},
+        {"id": 2, "source_id": 1, "order_date": "2019-04-03T11:33:15Z", "reference": "ORD00002",
+         "order_status": "Pending", "warehouse_id": 1, "total_amount": 1.0, "items": []},
+    ]
+    json_path = tmp_path / "orders.json"
+    json_path.write_text(json.dumps(orders))
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+
+    stats = load_file(db, str(json_path), "orders.json", 0, 10, lambda num: None)
+
+    assert stats["rows"] == 2
+    assert [(line.order_id, line.item_uid, line.amount) for line in db.query(OrderLine).all()] == [
+        (1, "P000001", 2), (1, "P000002", 1)]
+    assert db.get(Order, 2).items == []
+    db.close()
+
+
+def test_load_parallel_spawns_workers(tmp_path):
+    json_path = tmp_path / "item_groups.json"
+    json_path.write_text(json.dumps(ITEM_GROUPS))
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    chunks = []
+
+    # workers via spawn, convert_file moet dus vanuit de module te importeren zijn
+    with patch("CargoHubV2.app.services.loader_service.ProcessPoolExecutor",
+               wraps=ProcessPoolExecutor) as mock_pool:
+        stats = load_parallel(db, {"item_groups.json": (str(json_path), 1)}, 1,
+                              lambda file, num: chunks.append(num), workers=1)
+
+    assert mock_pool.call_args.kwargs["mp_context"].get_start_method() == "spawn"
+    assert stats["item_groups.json"]["rows"] == 2
+    assert [group.id for group in db.query(ItemGroup).order_by(ItemGroup.id)] == [2, 3]
+    assert chunks == [2, 3, None]
+    db.close()
+
+
+def test_resume_rebuilds_rollup_after_failed_rebuild(tmp_path, monkeypatch):
+    orders = [{"id": id, "source_id": 1, "order_date": f"2024-09-0{id}T10:00:00Z", "reference": f"ORD0000{id}",
+               "order_status": "Pending", "warehouse_id": 1, "total_amount": 10.0, "items": []} for id in (1, 2)]
+    (tmp_path / "orders.json").write_text(json.dumps(orders))
+    monkeypatch.setattr("CargoHubV2.app.config.LOAD_DATA_DIR", str(tmp_path))
+    engine = create_engine(f"sqlite:///{tmp_path / 'load.db'}")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+
+    # orders geladen en gecheckpoint, daarna faalt de rollup
+    with patch("CargoHubV2.app.services.loader_service.rebuild_rollup",
+               side_effect=OperationalError("rebuild", {}, Exception("database is locked"))):
+        assert load(None, db).status_code == 500
+    assert read_checkpoint(str(tmp_path)) == {"orders.json": -1}
+    assert db.query(DailyOrderRollup).count() == 0
+
+    # de resume laadt orders.json niet opnieuw, maar bouwt de rollup wel op
+    assert load(None, db) == "Data successfully loaded."
+    assert db.query(Order).count() == 2
+    assert db.query(DailyOrderRollup).count() == 2
+    assert not (tmp_path / ".load_checkpoint.json").exists()
+    db.close()
+
+
+def test_insert_rows_skips_lines_of_failed_orders():
+    db = MagicMock()
+    db.scalars.return_value = [1]
+    rows = [{"id": 1, "items": [{"item_id": "P000001", "amount": 2}]},
+            {"id": 2, "items": [{"item_id": "P000002", "amount": 1}]}]
+    with patch("CargoHubV2.app.services.loader_service.insert_chunk", side_effect=[1, 0]) as mock_insert:
+        errors = insert_rows(db, "orders.json", rows)
+    assert errors == 1
+    assert mock_insert.call_args_list[0].args[2] == [{"id": 1}, {"id": 2}]
+    assert mock_insert.call_args_list[1].args[2] == [{"order_id": 1, "item_uid": "P000001", "amount": 2}]
+
+
+def test_checkpoint_roundtrip(tmp_path):
+    assert read_checkpoint(str(tmp_path)) == {}
+    write_checkpoint(str(tmp_path), {"items.json": -1, "orders.json": 5000})
+    assert read_checkpoint(str(tmp_path)) == {"items.json": -1, "orders.json": 5000}
+
+
+def test_resolve_data_dir(tmp_path, monkeypatch):
+    (tmp_path / "export").mkdir()
+    monkeypatch.setattr("CargoHubV2.app.config.LOAD_DATA_DIR", str(tmp_path))
+    assert resolve_data_dir(None) == str(tmp_path)
+    assert resolve_data_dir("export") == str(tmp_path / "export")
+    assert resolve_data_dir(str(tmp_path / "export")) == str(tmp_path / "export")
+    # bestaat niet: zoals voorheen de data map zelf
+    assert resolve_data_dir("missing") == str(tmp_path)
+
+
+@pytest.mark.parametrize("path", ["..", "export/../../etc", "/etc", "/"])
+def test_resolve_data_dir_outside_data_dir(tmp_path, monkeypatch, path):
+    (tmp_path / "export").mkdir()
+    monkeypatch.setattr("CargoHubV2.app.config.LOAD_DATA_DIR", str(tmp_path / "export"))
+    with pytest.raises(HTTPException) as excinfo:
+        resolve_data_dir(path)
+    assert excinfo.value.status_code == 400
+
+
+def test_sequence_column():
+    # alleen enkele integer primary keys, items heeft uid
+    assert sequence_column(model_mapping["items.json"].__table__) is None
+    assert sequence_column(model_mapping["warehouses.json"].__table__) == "id"
+    assert {file for file, model in model_mapping.items() if sequence_column(model.__table__) is None} == {
+        "items.json"}
+
+
+def test_parse_iso_datetime_default_now():
+    assert parse_iso_datetime("2019-04-03T11:33:15Z").hour == 11
+    assert parse_iso_datetime("not a date", default_now=True) is not None
+    with pytest.raises(ValueError):
+        parse_iso_datetime("not a date")
+
+
+def test_file_dependencies():
+    dependencies = file_dependencies()
+    assert dependencies["orders.json"] == {"warehouses.json"}
+    assert dependencies["inventories.json"] == {"items.json"}
+    assert dependencies["items.json"] == {"item_groups.json", "item_lines.json", "item_types.json", "suppliers.json"}
+    for file in ["item_groups.json", "item_lines.json", "item_types.json", "suppliers.json",
+                 "warehouses.json", "clients.json"]:
+        assert dependencies[file] == set()
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2019-04-03T11:33:15Z", datetime(2019, 4, 3, 11, 33, 15)),
+    ("2019-04-03 11:33:15", datetime(2019, 4, 3, 11, 33, 15)),
+    ("2019-04-03", datetime(2019, 4, 3)),
+    # strptime accepteert ook waardes zonder voorloopnullen
+    ("2019-4-3", datetime(2019, 4, 3)),
+    ("2019-04-03T1:3:5Z", datetime(2019, 4, 3, 1, 3, 5)),
+])
+def test_parse_iso_datetime_formats(value, expected):
+    assert parse_iso_datetime(value) == expected
+
+
+@pytest.mark.parametrize("value", [
+    "2019-04-03T11:33:15", "2019-04-03T11:33:15+00:00", "2019-04-03 11:33:15.123",
+    "2013-04-24 16:19:43.000000", "2019-04-03 11:33", "2019-02-30", "20190403", "",
+])
+def test_parse_iso_datetime_rejects_other_formats(value):
+    with pytest.raises(ValueError):
+        parse_iso_datetime(value)
+
+
+def test_parse_iso_datetime_default_now_not_cached():
+    first = parse_iso_datetime("not a date", default_now=True)
+    second = parse_iso_datetime("not a date", default_now=True)
+    assert second >= first
+    assert parse_iso_datetime("2019-04-03") is parse_iso_datetime("2019-04-03")
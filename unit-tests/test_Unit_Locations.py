@@ -1,8 +1,10 @@
+import asyncio
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, AsyncMock, patch
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException
 from CargoHubV2.app.services.locations_service import create_location, get_all_locations, get_location_by_id, get_locations_by_warehouse_id, update_location, delete_location
+from CargoHubV2.app.services.locations_service import get_all_locations_async, get_location_by_id_async, get_locations_by_warehouse_id_async
 from CargoHubV2.app.models.locations_model import Location
 from CargoHubV2.app.schemas.locations_schema import LocationCreate, LocationUpdate
 
@@ -163,3 +165,30 @@ def test_delete_location_not_found():
         delete_location(db, "nonexistent-id")
     assert excinfo.value.status_code == 404
     assert "Location not found" in str(excinfo.value.detail)
+
+
+def async_db(first=None, rows=None):
+    db = MagicMock()
+    result = MagicMock()
+    result.scalars().first.return_value = first
+    result.scalars().all.return_value = rows or []
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+def test_get_location_by_id_async():
+    location = Location(**SAMPLE_LOCATION_DATA)
+
+    assert asyncio.run(get_location_by_id_async(async_db(first=location), 1)) == location
+
+
+def test_get_all_locations_async():
+    locations = [Location(**SAMPLE_LOCATION_DATA)]
+
+    assert asyncio.run(get_all_locations_async(async_db(rows=locations))) == locations
+
+
+def test_get_locations_by_warehouse_id_async_not_found():
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(get_locations_by_warehouse_id_async(async_db(), 99))
+    assert excinfo.value.status_code == 404
@@ -1,17 +1,25 @@
+import asyncio
 import pytest
-from unittest.mock import MagicMock, patch, ANY
+from unittest.mock import MagicMock, AsyncMock, patch, ANY
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException
 from CargoHubV2.app.services.orders_service import (
     create_order,
+    create_orders_batch,
     get_order,
     get_all_orders,
+    get_order_async,
+    get_all_orders_async,
     update_order,
     delete_order,
     get_items_in_order,
     get_packinglist_for_order
 )
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from CargoHubV2.app.models import Base
 from CargoHubV2.app.models.orders_model import Order
+from CargoHubV2.app.models.order_lines_model import OrderLine
 from CargoHubV2.app.models.inventories_model import Inventory
 from CargoHubV2.app.schemas.orders_schema import OrderCreate, OrderUpdate
 from datetime import datetime as dt
@@ -77,6 +85,90 @@ def test_create_order_integrity_error():
 '''
 
 
+def test_create_order_batched_inventory():
+    db = MagicMock()
+    db.query().filter().all.return_value = [MagicMock(id=9557, total_available=96)]
+    db.query().filter().first.return_value = MagicMock(shipment_type="O", shipment_status="Pending")
+    order_data = {**SAMPLE_ORDER_DATA, "shipment_id": [1],
+                  "items": [{"item_id": "P009557", "amount": 1}, {"item_id": "P009557", "amount": 2}]}
+    create_order(db, order_data)
+    # een bulk update met een regel per inventory, niet per orderregel, en een upsert voor de rollup
+    assert db.execute.call_count == 2
+    params = db.execute.call_args_list[0][0][1]
+    assert len(params) == 1
+    assert params[0]["inventory_id"] == 9557
+    assert params[0]["amount"] == 3
+    assert params[0]["ordered_delta"] == 3
+    assert params[0]["on_hand_delta"] == 0
+    rollup = db.execute.call_args_list[1][0][1]
+    assert len(rollup) == 1
+    assert rollup[0]["orders_done"] == 1
+    assert rollup[0]["items_sold"] == 3
+    db.add.assert_called_once()
+    db.commit.assert_called_once()
+
+
+def test_create_order_inventory_not_found():
+    db = MagicMock()
+    db.query().filter().all.return_value = []
+    order_data = {**SAMPLE_ORDER_DATA, "shipment_id": [1]}
+    with pytest.raises(HTTPException) as excinfo:
+        create_order(db, order_data)
+    assert excinfo.value.status_code == 404
+    db.execute.assert_not_called()
+    db.commit.assert_not_called()
+
+
+def test_create_order_inventory_shortage():
+    db = MagicMock()
+    db.query().filter().all.return_value = [MagicMock(id=9557, total_available=2)]
+    order_data = {**SAMPLE_ORDER_DATA, "shipment_id": [1],
+                  "items": [{"item_id": "P009557", "amount": 2}, {"item_id": "P009557", "amount": 1}]}
+    with pytest.raises(HTTPException) as excinfo:
+        create_order(db, order_data)
+    assert excinfo.value.status_code == 409
+    assert "only 0 available, ordered 1" in str(excinfo.value.detail)
+    db.execute.assert_not_called()
+
+
+def test_create_orders_batch_statuses():
+    db = MagicMock()
+    # eerst de inventories, dan de references die al bestaan
+    db.query().filter().all.side_effect = [
+        [MagicMock(id=9557, total_available=3)],
+        [MagicMock(reference="ORD00004")],
+    ]
+    orders = [
+        {**SAMPLE_ORDER_DATA, "reference": "ORD00001", "items": [{"item_id": "P009557", "amount": 2}]},
+        {**SAMPLE_ORDER_DATA, "reference": "ORD00001", "items": [{"item_id": "P009557", "amount": 1}]},
+        {**SAMPLE_ORDER_DATA, "reference": "ORD00002", "items": [{"item_id": "P009557", "amount": 2}]},
+        {**SAMPLE_ORDER_DATA, "reference": "ORD00003", "items": [{"item_id": "P001234", "amount": 1}]},
+        {**SAMPLE_ORDER_DATA, "reference": "ORD00004", "items": [{"item_id": "P009557", "amount": 1}]},
+    ]
+    results = create_orders_batch(db, orders)
+
+    assert [result["status_code"] for result in results] == [201, 400, 409, 404, 400]
+    assert [result["index"] for result in results] == [0, 1, 2, 3, 4]
+    db.add_all.assert_called_once()
+    assert len(db.add_all.call_args[0][0]) == 1
+    # inventory update en rollup upsert
+    assert db.execute.call_count == 2
+    db.commit.assert_called_once()
+
+
+def test_create_orders_batch_commits_per_chunk():
+    db = MagicMock()
+    db.query().filter().all.side_effect = [
+        [MagicMock(id=9557, total_available=10)], [],
+        [MagicMock(id=9557, total_available=9)], [],
+    ]
+    orders = [{**SAMPLE_ORDER_DATA, "reference": f"ORD0000{i}"} for i in range(2)]
+    results = create_orders_batch(db, orders, chunk_size=1)
+
+    assert [result["status_code"] for result in results] == [201, 201]
+    assert db.commit.call_count == 2
+
+
 def test_get_order_found():
     db = MagicMock()
     db.query().filter().first.return_value = Order(**SAMPLE_ORDER_DATA)
@@ -132,7 +224,9 @@ def test_get_all_orders_by_date():
 
         mock_sorting.assert_called_once_with(mock_query, Order, "id", "asc")
         db.query.assert_called_once_with(Order)
-        mock_query.filter.assert_called_once_with(ANY)
+        # is_deleted en daarna het bereik van de datum
+        assert mock_query.filter.call_count == 2
+        mock_query.filter.assert_called_with(ANY, ANY)
         mock_query.offset.assert_called_once_with(0)
         mock_query.limit.assert_called_once_with(100)
         mock_query.all.assert_called_once()
@@ -153,7 +247,9 @@ def test_get_all_orders_no_results():
 
         mock_sorting.assert_called_once_with(mock_query, Order, "id", "asc")
         db.query.assert_called_once_with(Order)
-        mock_query.filter.assert_called_once_with(ANY)
+        # is_deleted en daarna het bereik van de datum
+        assert mock_query.filter.call_count == 2
+        mock_query.filter.assert_called_with(ANY, ANY)
         mock_query.offset.assert_called_once_with(0)
         mock_query.limit.assert_called_once_with(100)
         mock_query.all.assert_called_once()
@@ -196,17 +292,70 @@ def test_update_order_integrity_error():
 def test_delete_order_found():
     db = MagicMock()
     mock_order = Order(**SAMPLE_ORDER_DATA)
-    mock_inven = Inventory(**SAMPLE_INVEN_DATA)
-    db.query().filter().first.side_effect = [mock_order, mock_inven]
+    db.query().filter().first.return_value = mock_order
+    db.query().outerjoin().filter().first.return_value = None
 
     result = delete_order(db, 1)
 
     assert result == {"detail": "Order soft deleted"}
     assert mock_order.is_deleted is True
+    # een update statement voor alle orderregels en een voor de rollup
+    assert db.execute.call_count == 2
+    assert db.execute.call_args_list[1][0][1][0]["orders_done"] == -1
     db.commit.assert_called_once()
     db.delete.assert_not_called()
 
 
+def test_delete_order_inventory_missing():
+    db = MagicMock()
+    db.query().filter().first.return_value = Order(**SAMPLE_ORDER_DATA)
+    db.query().outerjoin().filter().first.return_value = MagicMock(item_uid="P009557")
+
+    with pytest.raises(HTTPException) as excinfo:
+        delete_order(db, 1)
+    assert excinfo.value.status_code == 404
+    assert "P009557" in excinfo.value.detail
+    db.execute.assert_not_called()
+    db.commit.assert_not_called()
+
+
+@pytest.fixture
+def lines_db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    db.add(Inventory(**{**SAMPLE_INVEN_DATA, "created_at": None, "updated_at": None}))
+    db.add(Order(**{**SAMPLE_ORDER_DATA, "created_at": None, "updated_at": None, "is_deleted": False,
+                    "items": [{"item_id": "P009557", "amount": 2}, {"item_id": "P009557", "amount": 3}]}))
+    db.commit()
+    yield db
+    db.close()
+
+
+def test_order_items_stored_as_lines(lines_db):
+    lines = lines_db.query(OrderLine).filter(OrderLine.item_uid == "P009557").all()
+    assert [(line.order_id, line.amount) for line in lines] == [(1, 2), (1, 3)]
+    assert lines_db.get(Order, 1).items == [{"item_id": "P009557", "amount": 2}, {"item_id": "P009557", "amount": 3}]
+
+
+def test_update_order_delivered_adjusts_inventory(lines_db):
+    update_order(lines_db, 1, OrderUpdate(order_status="Delivered"))
+    inventory = lines_db.get(Inventory, 9557)
+    lines_db.refresh(inventory)
+    assert inventory.total_ordered == 49 - 5
+    assert inventory.total_on_hand == 205 - 5
+    assert inventory.total_available == 96
+
+
+def test_delete_order_returns_inventory(lines_db):
+    delete_order(lines_db, 1)
+    inventory = lines_db.get(Inventory, 9557)
+    lines_db.refresh(inventory)
+    assert inventory.total_ordered == 49 - 5
+    assert inventory.total_available == 96 + 5
+    assert inventory.total_on_hand == 205
+
+
 def test_delete_order_not_found():
     db = MagicMock()
     db.query().filter().first.return_value = None
@@ -283,3 +432,44 @@ def test_get_packinglist_for_order_no_items():
     assert excinfo.value.status_code == 404
     assert "No items found in the packing list" in str(excinfo.value.detail)
     db.query().filter().first.assert_called_once()
+
+
+def async_db(first=None, rows=None):
+    db = MagicMock()
+    result = MagicMock()
+    result.scalars().first.return_value = first
+    result.scalars().all.return_value = rows or []
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+def test_get_order_async():
+    order = Order(**SAMPLE_ORDER_DATA)
+    db = async_db(first=order)
+
+    assert asyncio.run(get_order_async(db, 1)) == order
+    db.execute.assert_awaited_once()
+
+
+def test_get_order_async_not_found():
+    db = async_db()
+
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(get_order_async(db, 1))
+    assert excinfo.value.status_code == 404
+
+
+def test_get_all_orders_async():
+    orders = [Order(**SAMPLE_ORDER_DATA)]
+    db = async_db(rows=orders)
+
+    assert asyncio.run(get_all_orders_async(db, offset=0, limit=10)) == orders
+    statement = str(db.execute.await_args.args[0])
+    assert "ORDER BY orders.order_date ASC" in statement
+    assert "LIMIT" in statement
+
+
+def test_get_all_orders_async_invalid_sort():
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(get_all_orders_async(async_db(), sort_by="bogus"))
+    assert excinfo.value.status_code == 400
@@ -0,0 +1,128 @@
+import json
+import pytest
+from datetime import datetime
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from CargoHubV2.app import config
+from CargoHubV2.app.models import Base, Order
+from CargoHubV2.app.schemas.orders_schema import PackingWave
+from CargoHubV2.app.services import job_service, packinglist_service, template_service
+
+
+@pytest.fixture
+def wave_db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    for id in range(1, 11):
+        db.add(Order(id=id, source_id=1, order_date=datetime(2024, 9, 1), request_date=datetime(2024, 9, 3),
+                     reference=f"ORD{id:05d}", order_status="Pending" if id % 2 else "Packed",
+                     warehouse_id=1 if id <= 8 else 2, total_amount=10.0, is_deleted=id == 7,
+                     items=[{"item_id": f"P{id:06d}", "amount": id}, {"item_id": "P000099", "amount": 1}]))
+    db.commit()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def renders(tmp_path, monkeypatch):
+    # geen wkhtmltopdf nodig, de html komt in het "pdf" bestand
+    renders = []
+    monkeypatch.setattr(config, "PDF_WORKERS", 0)
+    monkeypatch.setattr(job_service, "jobs", {})
+    monkeypatch.setattr(packinglist_service, "PDF_DIR", tmp_path)
+    monkeypatch.setattr(packinglist_service.pdfkit, "from_string",
+                        lambda html, path: renders.append(html) or open(path, "w").write(html))
+    return renders
+
+
+def test_wave_by_order_ids_one_render(wave_db, renders):
+    response = packinglist_service.generate_wave_packing_list(wave_db, order_ids=[5, 2, 9, 2])
+
+    assert response.status_code == 200
+    assert json.loads(response.body)["pdf_url"].rsplit("/", 1)[1].startswith("packinglist_wave_")
+    assert len(renders) == 1
+    html = renders[0]
+    assert html.count('<div class="packing-list">') == 3
+    # volgorde van de aanvraag
+    assert html.index("P000005") < html.index("P000002") < html.index("P000009")
+
+
+def test_wave_by_warehouse_and_status(wave_db, renders):
+    packinglist_service.generate_wave_packing_list(wave_db, warehouse_id=1, order_status="Pending")
+
+    # 1, 3, 5 (7 is verwijderd, 9 zit in warehouse 2)
+    assert renders[0].count('<div class="packing-list">') == 3
+    assert "P000007" not in renders[0]
+
+
+def test_wave_missing_orders(wave_db, renders):
+    with pytest.raises(HTTPException) as excinfo:
+        packinglist_service.generate_wave_packing_list(wave_db, order_ids=[1, 7, 42])
+    assert excinfo.value.status_code == 404
+    assert "[7, 42]" in excinfo.value.detail
+    assert renders == []
+
+
+def test_render_packing_list_timing(tmp_path, monkeypatch):
+    monkeypatch.setattr(packinglist_service.pdfkit, "from_string", lambda html, path: open(path, "w").write(html))
+    content = {"orders": [{"order_id": 1, "shipping_notes": "<fragile>", "items": []}]}
+    timing = packinglist_service.render_packing_list(content, str(tmp_path / "list.pdf"))
+
+    assert list(timing) == ["render", "pdf"]
+    # autoescape voor .html templates
+    assert "&lt;fragile&gt;" in (tmp_path / "list.pdf").read_text()
+
+
+def test_wave_needs_orders_or_warehouse(wave_db):
+    with pytest.raises(HTTPException) as excinfo:
+        packinglist_service.generate_wave_packing_list(wave_db)
+    assert excinfo.value.status_code == 400
+
+
+def test_wave_without_request_date(wave_db, renders):
+    wave_db.get(Order, 2).request_date = None
+    wave_db.commit()
+
+    response = packinglist_service.generate_wave_packing_list(wave_db, order_ids=[1, 2])
+
+    assert response.status_code == 200
+    assert renders[0].count('<div class="packing-list">') == 2
+    assert packinglist_service.packing_list_content(wave_db.get(Order, 2))["request_date"] == ""
+
+
+@pytest.mark.parametrize("wave", [{}, {"order_ids": []}, {"order_ids": [1], "warehouse_id": 1},
+                                  {"order_status": "Pending"}])
+def test_packing_wave_needs_one_selector(wave):
+    with pytest.raises(ValidationError):
+        PackingWave(**wave)
+
+
+def test_packing_wave_valid():
+    assert PackingWave(order_ids=[1, 2]).warehouse_id is None
+    assert PackingWave(warehouse_id=1, order_status="Pending").order_ids is None
+
+
+def test_wave_max_orders(wave_db, monkeypatch):
+    monkeypatch.setattr(packinglist_service, "WAVE_MAX_ORDERS", 5)
+    with pytest.raises(HTTPException) as excinfo:
+        packinglist_service.generate_wave_packing_list(wave_db, warehouse_id=1)
+    assert excinfo.value.status_code == 400
+
+
+def test_single_packing_list_uses_compiled_template(wave_db, renders, monkeypatch):
+    # template wordt een keer van disk gelezen, daarna uit de cache van de environment
+    loads = []
+    get_source = template_service.environment.loader.get_source
+    monkeypatch.setattr(template_service.environment.loader, "get_source",
+                        lambda environment, name: loads.append(name) or get_source(environment, name))
+    template_service.environment.cache.clear()
+    for id in (1, 2):
+        packinglist_service.generate_packing_list(wave_db.get(Order, id))
+
+    assert len(renders) == 2
+    assert renders[0].count('<div class="packing-list">') == 1
+    assert "<td>P000001</td>" in renders[0]
+    assert loads == ["packinglist_template.html"]
@@ -0,0 +1,119 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from fastapi import HTTPException, Response
+from datetime import datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from CargoHubV2.app.models import Base
+from CargoHubV2.app.models.clients_model import Client
+from CargoHubV2.app.models.items_model import Item
+from CargoHubV2.app.services.clients_service import get_all_clients
+from CargoHubV2.app.services.pagination_service import (
+    apply_keyset, encode_cursor, decode_cursor, next_cursor, set_next_cursor, NEXT_CURSOR_HEADER
+)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    # dubbele en lege namen, zodat de pk tiebreaker en NULL afhandeling nodig zijn
+    names = ["b", None, "a", "b", "c", None, "a", "b", "d", "c"]
+    for id, name in enumerate(names, start=1):
+        session.add(Client(id=id, name=name, created_at=datetime(2024, 1, id)))
+    session.commit()
+    yield session
+    session.close()
+
+
+def walk(db, sort_by, order, limit):
+    # alle pagina's ophalen zoals een client met de X-Next-Cursor header zou doen
+    ids, cursor = [], ""
+    while cursor is not None:
+        rows = get_all_clients(db, limit=limit, sort_by=sort_by, order=order, cursor=cursor)
+        ids.extend(client.id for client in rows)
+        cursor = next_cursor(rows, sort_by, order, limit)
+    return ids
+
+
+@pytest.mark.parametrize("sort_by", ["id", "name", "created_at", "is_deleted"])
+@pytest.mark.parametrize("order", ["asc", "desc"])
+@pytest.mark.parametrize("limit", [1, 3, 10])
+def test_keyset_walk_matches_offset(db, sort_by, order, limit):
+    expected = [client.id for client in apply_keyset(db.query(Client), Client, sort_by, order, "").all()]
+
+    assert walk(db, sort_by, order, limit) == expected
+    assert sorted(expected) == list(range(1, 11))
+
+
+def test_keyset_nulls_first_ascending(db):
+    rows = get_all_clients(db, limit=3, sort_by="name", order="asc", cursor="")
+
+    assert [client.id for client in rows] == [2, 6, 3]
+
+
+def test_cursor_round_trip_datetime():
+    cursor = encode_cursor("created_at", "asc", datetime(2024, 1, 5, 12, 30), 5)
+
+    assert decode_cursor(cursor) == {
+        "sort_by": "created_at", "order": "asc", "value": datetime(2024, 1, 5, 12, 30), "key": 5
+    }
+
+
+def test_invalid_cursor():
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor("not-a-cursor")
+
+    assert exc.value.status_code == 400
+
+
+def test_cursor_sort_mismatch(db):
+    cursor = encode_cursor("name", "asc", "b", 1)
+
+    with pytest.raises(HTTPException) as exc:
+        get_all_clients(db, sort_by="id", order="asc", cursor=cursor)
+
+    assert exc.value.status_code == 400
+    assert exc.value.detail == "Cursor does not match sort_by/order"
+
+
+def test_keyset_invalid_sort_attribute():
+    with pytest.raises(HTTPException) as exc:
+        apply_keyset(MagicMock(), Client, "unknown", "asc", "")
+
+    assert exc.value.status_code == 400
+
+
+def test_keyset_uses_item_uid():
+    item = Item(uid="P000001", code="A")
+
+    cursor = next_cursor([item], "code", "asc", 1)
+
+    assert decode_cursor(cursor)["key"] == "P000001"
+
+
+def test_get_all_clients_cursor_skips_offset():
+    db = MagicMock()
+    query = db.query.return_value.filter.return_value
+
+    with patch("CargoHubV2.app.services.clients_service.apply_keyset") as mock_keyset:
+        get_all_clients(db, offset=50, limit=10, sort_by="id", order="asc", cursor="")
+
+    mock_keyset.assert_called_once_with(query, Client, "id", "asc", "")
+    mock_keyset.return_value.limit.assert_called_once_with(10)
+    query.offset.assert_not_called()
+
+
+def test_set_next_cursor_header():
+    response = Response()
+    rows = [Client(id=1, name="a"), Client(id=2, name="b")]
+
+    set_next_cursor(response, rows, "name", "asc", 2, "")
+    assert decode_cursor(response.headers[NEXT_CURSOR_HEADER])["key"] == 2
+
+    # laatste pagina of offset pagination: geen header
+    response = Response()
+    set_next_cursor(response, rows, "name", "asc", 3, "")
+    set_next_cursor(response, rows, "name", "asc", 2, None)
+    assert NEXT_CURSOR_HEADER not in response.headers
@@ -0,0 +1,196 @@
+"""
+Tests tegen een echte postgres database.
+
+Gebruikt TEST_DATABASE_URL als die gezet is (bijv. een container:
+docker run -p 5432:5432 -e POSTGRES_HOST_AUTH_METHOD=trust postgres:16 en
+TEST_DATABASE_URL=postgresql+psycopg2://postgres@localhost:5432/postgres),
+anders wordt een tijdelijke server gestart met initdb/pg_ctl uit PG_BIN of PATH.
+Zonder postgres worden de tests overgeslagen.
+"""
+import asyncio
+import os
+import shutil
+import socket
+import subprocess
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+pytest.importorskip("psycopg2")
+
+from CargoHubV2.app.database import Base, engine_options, make_async_engine  # noqa: E402
+from CargoHubV2.app.models import Item, Location, Order, Warehouse  # noqa: E402
+from CargoHubV2.app.schemas.orders_schema import OrderCreate  # noqa: E402
+from CargoHubV2.app.services import locations_service, orders_service  # noqa: E402
+from CargoHubV2.app.services.loader_service import reset_sequences  # noqa: E402
+from CargoHubV2.app.services.pagination_service import next_cursor  # noqa: E402
+from CargoHubV2.app.services.reporting_service import general_report  # noqa: E402
+from CargoHubV2.app.services.rollup_service import rebuild_rollup  # noqa: E402
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture(scope="module")
+def postgres_url(tmp_path_factory):
+    url = os.getenv("TEST_DATABASE_URL")
+    if url:
+        yield url
+        return
+
+    pg_ctl = shutil.which("pg_ctl", path=os.getenv("PG_BIN"))
+    initdb = shutil.which("initdb", path=os.getenv("PG_BIN"))
+    if not pg_ctl or not initdb:
+        pytest.skip("no postgres available, set TEST_DATABASE_URL or PG_BIN")
+    if os.geteuid() == 0:
+        pytest.skip("postgres does not run as root, set TEST_DATABASE_URL")
+
+    data_dir = tmp_path_factory.mktemp("pgdata")
+    port = free_port()
+    subprocess.run([initdb, "-D", str(data_dir), "-U", "postgres", "--auth=trust"],
+                   check=True, capture_output=True)
+    subprocess.run([pg_ctl, "-D", str(data_dir), "-l", str(data_dir / "log"), "-w", "start",
+                    "-o", f"-p {port} -k {data_dir} -c listen_addresses=127.0.0.1"],
+                   check=True, capture_output=True)
+    try:
+        yield f"postgresql+psycopg2://postgres@127.0.0.1:{port}/postgres"
+    finally:
+        subprocess.run([pg_ctl, "-D", str(data_dir), "-m", "fast", "stop"], capture_output=True)
+
+
+@pytest.fixture(scope="module")
+def pg_engine(postgres_url):
+    engine = create_engine(postgres_url, **engine_options(postgres_url))
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    now = datetime.now()
+    with engine.begin() as conn:
+        conn.execute(Warehouse.__table__.insert(), [
+            {"id": 1, "code": "WH1", "name": "Main", "created_at": now, "updated_at": now, "is_deleted": False}
+        ])
+    try:
+        yield engine
+    finally:
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+
+
+@pytest.fixture
+def pg_db(pg_engine):
+    db = sessionmaker(bind=pg_engine, autoflush=False)()
+    try:
+        yield db
+    finally:
+        db.rollback()
+        db.close()
+
+
+def order_data(reference: str, order_date: datetime) -> dict:
+    return OrderCreate(
+        source_id=1, order_date=order_date, request_date=order_date, reference=reference,
+        order_status="Pending", warehouse_id=1, shipment_id=[0], total_amount=10.0, items=[]
+    ).model_dump()
+
+
+def test_postgres_engine_uses_pool_settings(pg_engine):
+    assert pg_engine.pool.size() == 10
+    assert pg_engine.pool._pre_ping is True
+
+
+def test_json_columns_are_jsonb(pg_engine):
+    columns = {column["name"]: column["type"] for column in inspect(pg_engine).get_columns("shipments")}
+    assert columns["items"].__class__.__name__ == "JSONB"
+
+
+def test_active_index_is_partial(pg_engine):
+    with pg_engine.connect() as conn:
+        definition = conn.execute(text(
+            "SELECT indexdef FROM pg_indexes WHERE indexname = 'ix_orders_active_order_date'"
+        )).scalar()
+    assert "WHERE (NOT is_deleted)" in definition
+
+
+def test_orders_keyset_walk(pg_db):
+    for n in range(5):
+        orders_service.create_order(pg_db, order_data(f"ORD9000{n}", datetime(2024, 1, 1 + n)))
+
+    seen, cursor = [], ""
+    while True:
+        page = orders_service.get_all_orders(pg_db, limit=2, sort_by="order_date", sort_order="asc", cursor=cursor)
+        seen += [order.reference for order in page]
+        cursor = next_cursor(page, "order_date", "asc", 2)
+        if cursor is None:
+            break
+    assert seen == [f"ORD9000{n}" for n in range(5)]
+
+
+def test_json_roundtrip_and_soft_delete(pg_db):
+    now = datetime.now()
+    location = Location(warehouse_id=1, code="A.1.0", name="Row A", stock=[{"item_id": "P1", "amount": 3}],
+                        created_at=now, updated_at=now, is_deleted=False)
+    pg_db.add(location)
+    pg_db.commit()
+
+    found = locations_service.get_location_by_id(pg_db, location.id)
+    assert found.stock == [{"item_id": "P1", "amount": 3}]
+    locations_service.delete_location(pg_db, location.id)
+    assert location.id not in [row.id for row in locations_service.get_all_locations(pg_db, limit=100)]
+
+
+def test_reset_sequences_after_explicit_ids(pg_db):
+    now = datetime.now()
+    pg_db.add(Warehouse(id=50, code="WH50", name="Loaded", created_at=now, updated_at=now, is_deleted=False))
+    pg_db.commit()
+
+    reset_sequences(pg_db, ["warehouses.json"])
+    warehouse = Warehouse(code="WH51", name="New", created_at=now, updated_at=now, is_deleted=False)
+    pg_db.add(warehouse)
+    pg_db.commit()
+    assert warehouse.id == 51
+
+
+def test_reset_sequences_skips_tables_without_id(pg_db):
+    # items heeft uid als primary key, geen id sequence
+    now = datetime.now()
+    pg_db.add(Item(uid="P000001", code="ITEM1", created_at=now, updated_at=now, is_deleted=False))
+    pg_db.add(Warehouse(id=60, code="WH60", name="Loaded", created_at=now, updated_at=now, is_deleted=False))
+    pg_db.commit()
+
+    reset_sequences(pg_db, ["items.json", "warehouses.json"])
+    warehouse = Warehouse(code="WH61", name="New", created_at=now, updated_at=now, is_deleted=False)
+    pg_db.add(warehouse)
+    pg_db.commit()
+    assert warehouse.id == 61
+
+
+def test_rollup_upsert_matches_rebuild(pg_db):
+    # ON CONFLICT DO UPDATE via de postgresql dialect
+    orders = [orders_service.create_order(pg_db, order_data(f"ORD8000{n}", datetime(2025, 3, 1 + n % 2)))
+              for n in range(4)]
+    orders_service.delete_order(pg_db, orders[0].id)
+
+    maintained = general_report(pg_db, 2025, 3)
+    assert maintained["orders_done"] == "3"
+    assert maintained["total_revenue"] == "30.0"
+    rebuild_rollup(pg_db)
+    assert general_report(pg_db, 2025, 3) == maintained
+
+
+def test_async_reads_with_asyncpg(pg_engine, postgres_url):
+    pytest.importorskip("asyncpg")
+
+    async def read():
+        engine = make_async_engine(postgres_url)
+        try:
+            async with engine.connect() as conn:
+                return (await conn.execute(Order.__table__.select().limit(5))).all()
+        finally:
+            await engine.dispose()
+
+    rows = asyncio.run(read())
+    assert len(rows) <= 5
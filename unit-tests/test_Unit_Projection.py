@@ -0,0 +1,122 @@
+import json
+import pytest
+from datetime import datetime
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+from CargoHubV2.app.models import Base, Inventory, Order, Transfer, Warehouse
+from CargoHubV2.app.schemas.orders_schema import OrderResponse
+from CargoHubV2.app.schemas.warehouses_schema import WarehouseResponse
+from CargoHubV2.app.services.pagination_service import next_cursor
+from CargoHubV2.app.services.projection_service import parse_fields, load_fields
+from CargoHubV2.app.services.response_service import orm_response
+from CargoHubV2.app.services.transfers_service import get_all_transfers
+from CargoHubV2.app.services.warehouses_service import get_all_warehouses
+
+NOW = datetime(2024, 9, 1, 12, 0)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def db(engine):
+    db = sessionmaker(bind=engine)()
+    for id in range(1, 4):
+        db.add(Order(id=id, source_id=1, order_date=datetime(2024, 9, id), reference=f"ORD{id:05d}",
+                     order_status="Pending", warehouse_id=1, shipment_id=[id], total_amount=10.0 * id,
+                     items=[{"item_id": "P000001", "amount": id}], is_deleted=False))
+        db.add(Warehouse(id=id, code=f"WH{id}", name=f"Warehouse {id}", city="Rotterdam",
+                         contact={"name": "Contact"}, is_deleted=False))
+        db.add(Transfer(id=id, reference=f"TR{id:05d}", transfer_to=id, items=[{"item_id": "P000001", "amount": id}],
+                        is_deleted=False))
+    db.commit()
+    db.expunge_all()
+    yield db
+    db.close()
+
+
+def statements(engine):
+    captured = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: captured.append(statement))
+    return captured
+
+
+def test_parse_fields():
+    assert parse_fields(None, OrderResponse) is None
+    assert parse_fields(" id, order_status,id ,", OrderResponse) == ("id", "order_status")
+
+
+def test_parse_fields_model():
+    # routes zonder response schema: alle kolommen van het model, geen relaties
+    assert parse_fields("item_reference,locations,is_deleted", Inventory) == ("item_reference", "locations", "is_deleted")
+    with pytest.raises(HTTPException) as excinfo:
+        parse_fields("item", Inventory)
+    assert excinfo.value.status_code == 400
+
+
+@pytest.mark.parametrize("fields", ["order_lines", "id,bogus", "lines"])
+def test_parse_fields_invalid(fields):
+    # alleen velden van het response schema
+    with pytest.raises(HTTPException) as excinfo:
+        parse_fields(fields, OrderResponse)
+    assert excinfo.value.status_code == 400
+
+
+def test_load_fields_invalid_name():
+    with pytest.raises(HTTPException) as excinfo:
+        load_fields(Order, ("id", "bogus"))
+    assert excinfo.value.status_code == 400
+
+
+def test_load_fields_selects_only_requested_columns(engine, db):
+    captured = statements(engine)
+    fields = ("order_status", "shipment_id")
+
+    orders = db.execute(select(Order).options(*load_fields(Order, fields, "order_date"))).scalars().all()
+
+    # een query: geen order_lines (selectin) want items is niet gevraagd
+    assert len(captured) == 1
+    columns = captured[0].split("FROM")[0]
+    assert "orders.order_status" in columns and "orders.order_date" in columns
+    assert "orders.total_amount" not in columns and "orders.notes" not in columns
+    # shipment_id als tekst, zonder json.loads
+    assert "CAST(orders.shipment_id AS TEXT)" in columns
+    assert json.loads(orm_response(orders, OrderResponse, fields=fields).body) == [
+        {"order_status": "Pending", "shipment_id": [id]} for id in range(1, 4)]
+    # sorteer kolom en primary key geladen, dus een cursor voor de volgende pagina
+    assert next_cursor(orders, "order_date", "asc", 3)
+
+
+def test_load_fields_items_loads_lines(engine, db):
+    captured = statements(engine)
+
+    orders = db.execute(select(Order).options(*load_fields(Order, ("id", "items")))).scalars().all()
+
+    assert len(captured) == 2
+    assert [order.items for order in orders] == [[{"item_id": "P000001", "amount": id}] for id in range(1, 4)]
+
+
+def test_get_all_warehouses_fields(engine, db):
+    captured = statements(engine)
+
+    warehouses = get_all_warehouses(db, limit=2, fields=("code",))
+
+    assert "warehouses.contact" not in captured[0]
+    assert json.loads(orm_response(warehouses, WarehouseResponse, fields=("code",)).body) == [
+        {"code": "WH1"}, {"code": "WH2"}]
+
+
+def test_get_all_transfers_fields(engine, db):
+    captured = statements(engine)
+
+    transfers = get_all_transfers(db, limit=2, fields=("reference",))
+
+    assert "transfers.items" not in captured[0]
+    assert json.loads(orm_response(transfers, Transfer, fields=("reference",)).body) == [
+        {"reference": "TR00001"}, {"reference": "TR00002"}]
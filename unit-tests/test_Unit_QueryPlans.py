@@ -0,0 +1,114 @@
+import re
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from CargoHubV2.app.models import Base, Item
+from CargoHubV2.app.services import (
+    clients_service, docks_service, inventories_service, items_service, locations_service,
+    orders_service, reporting_service, shipments_service, suppliers_service, transfers_service,
+    warehouses_service, item_groups_service, item_lines_service, item_types_service
+)
+
+
+# de lees queries van de services, met de standaard sortering van de controllers
+SERVICE_QUERIES = {
+    "get_client": lambda db: clients_service.get_client(db, 1),
+    "get_country_clients": lambda db: clients_service.get_country_clients(db, "Netherlands", 0, 100, "id", "asc"),
+    "get_all_clients": lambda db: clients_service.get_all_clients(db),
+    "get_all_docks": lambda db: docks_service.get_all_docks(db),
+    "get_docks_by_warehouse_id": lambda db: docks_service.get_docks_by_warehouse_id(db, 1),
+    "get_dock_by_code": lambda db: docks_service.get_dock_by_code(db, "D1"),
+    "get_inventory": lambda db: inventories_service.get_inventory(db, "P000001"),
+    "get_all_inventories": lambda db: inventories_service.get_all_inventories(db),
+    "get_locations_by_inventory": lambda db: inventories_service.get_locations_by_inventory(db, "P000001"),
+    "get_item": lambda db: items_service.get_item(db, "A"),
+    "get_all_items": lambda db: items_service.get_all_items(db, sort_by="uid"),
+    "get_orders_for_item": lambda db: items_service.get_orders_for_item(db, "A"),
+    "get_shipments_for_item": lambda db: items_service.get_shipments_for_item(db, "A"),
+    "get_all_locations": lambda db: locations_service.get_all_locations(db),
+    "get_location_by_id": lambda db: locations_service.get_location_by_id(db, 1),
+    "get_locations_by_warehouse_id": lambda db: locations_service.get_locations_by_warehouse_id(db, 1),
+    "get_order": lambda db: orders_service.get_order(db, 1),
+    "get_all_orders": lambda db: orders_service.get_all_orders(db),
+    "get_all_orders_cursor": lambda db: orders_service.get_all_orders(db, cursor=""),
+    "fetch_available": lambda db: orders_service.fetch_available(db, {1, 2}),
+    "get_shipments_by_order_id": lambda db: orders_service.get_shipments_by_order_id(db, 1),
+    "general_report": lambda db: reporting_service.general_report(db, 2024, 9),
+    "report_for_warehouse": lambda db: reporting_service.report_for_warehouse(db, 1, 2024, 9),
+    "get_shipment": lambda db: shipments_service.get_shipment(db, 1),
+    "get_all_shipments": lambda db: shipments_service.get_all_shipments(db),
+    "get_orders_by_shipment_id": lambda db: shipments_service.get_orders_by_shipment_id(db, 1),
+    "get_supplier": lambda db: suppliers_service.get_supplier(db, "S1"),
+    "get_all_suppliers": lambda db: suppliers_service.get_all_suppliers(db),
+    "get_items_by_supplier_id": lambda db: suppliers_service.get_items_by_supplier_id(db, 1),
+    "get_transfer": lambda db: transfers_service.get_transfer(db, 1),
+    "get_all_transfers": lambda db: transfers_service.get_all_transfers(db),
+    "get_warehouse_by_code": lambda db: warehouses_service.get_warehouse_by_code(db, "W1"),
+    "get_all_warehouses": lambda db: warehouses_service.get_all_warehouses(db),
+    "get_item_group": lambda db: item_groups_service.get_item_group(db, 1),
+    "get_all_item_groups": lambda db: item_groups_service.get_all_item_groups(db),
+    "get_item_line": lambda db: item_lines_service.get_item_line(db, 1),
+    "get_all_item_lines": lambda db: item_lines_service.get_all_item_lines(db),
+    "get_item_type": lambda db: item_types_service.get_item_type(db, 1),
+    "get_all_item_types": lambda db: item_types_service.get_all_item_types(db),
+}
+
+FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+
+
+@pytest.fixture(scope="module")
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    # item lookups door laten lopen tot de orders/shipments query
+    with engine.begin() as conn:
+        conn.execute(Item.__table__.insert(), [{"uid": "A", "code": "A", "is_deleted": False}])
+    return engine
+
+
+def captured_selects(engine, call):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    db = sessionmaker(bind=engine)()
+    try:
+        call(db)
+    except HTTPException:
+        # niet gevonden is prima, het gaat om de query
+        pass
+    finally:
+        db.close()
+        event.remove(engine, "before_cursor_execute", capture)
+    return statements
+
+
+def full_scans(engine, statement, parameters):
+    with engine.connect() as conn:
+        plan = [row[3] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+    # een gesorteerde scan met LIMIT stopt vroeg, alleen een scan die alles moet lezen telt
+    ordered_page = "ORDER BY" in statement and "LIMIT" in statement and not any("TEMP B-TREE" in step for step in plan)
+    return [step for step in plan if FULL_SCAN.match(step) and not ordered_page], plan
+
+
+@pytest.mark.parametrize("name", sorted(SERVICE_QUERIES))
+def test_service_query_uses_index(engine, name):
+    statements = captured_selects(engine, SERVICE_QUERIES[name])
+
+    assert statements, f"{name} ran no SELECT"
+    for statement, parameters in statements:
+        scans, plan = full_scans(engine, statement, parameters)
+        assert not scans, f"{name} does a full table scan:\n{statement}\n{plan}"
+
+
+def test_partial_indexes_only_cover_active_rows(engine):
+    with engine.connect() as conn:
+        sql = conn.exec_driver_sql(
+            "SELECT sql FROM sqlite_master WHERE name = 'ix_orders_active_warehouse_id_order_date'"
+        ).scalar()
+
+    assert sql.endswith("WHERE is_deleted = 0")
@@ -0,0 +1,160 @@
+import json
+import pytest
+from datetime import date, datetime
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from CargoHubV2.app.models import Base, Order, Inventory, DailyOrderRollup
+from CargoHubV2.app.schemas.orders_schema import OrderUpdate
+from CargoHubV2.app.services.orders_service import create_order, update_order, delete_order
+from CargoHubV2.app import config
+from CargoHubV2.app.services import job_service, reporting_service
+from CargoHubV2.app.services.reporting_service import general_report, report_for_warehouse, month_range
+from CargoHubV2.app.services.rollup_service import rebuild_rollup
+
+
+@pytest.fixture
+def report_db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    # 150 orders in september, meer dan de oude limit van 100
+    for id in range(1, 151):
+        db.add(Order(id=id, source_id=1, order_date=datetime(2024, 9, 1 + id % 30), reference=f"ORD{id:05d}",
+                     order_status="Delivered", warehouse_id=1 + id % 2, total_amount=10.0, total_discount=1.0,
+                     total_tax=2.0, total_surcharge=0.5, is_deleted=False,
+                     items=[{"item_id": "P000001", "amount": 2}, {"item_id": "P000002", "amount": 1}]))
+    # buiten de maand, verwijderd en zonder regels
+    db.add(Order(id=151, source_id=1, order_date=datetime(2024, 10, 1), reference="ORD00151", order_status="Pending",
+                 warehouse_id=1, total_amount=99.0, is_deleted=False, items=[{"item_id": "P000001", "amount": 5}]))
+    db.add(Order(id=152, source_id=1, order_date=datetime(2024, 9, 5), reference="ORD00152", order_status="Pending",
+                 warehouse_id=1, total_amount=99.0, is_deleted=True, items=[{"item_id": "P000001", "amount": 5}]))
+    db.add(Order(id=153, source_id=1, order_date=datetime(2024, 9, 30, 23, 59), reference="ORD00153",
+                 order_status="Pending", warehouse_id=1, total_amount=5.0, is_deleted=False, items=[]))
+    db.commit()
+    rebuild_rollup(db)
+    yield db
+    db.close()
+
+
+def test_general_report_totals_all_orders(report_db):
+    report = general_report(report_db, 2024, 9)
+
+    assert report == {
+        "target_month": "2024-9",
+        "orders_done": "151",
+        "amount_of_items_sold": "450",
+        "total_revenue": "1505.0",
+        "total_discount": "150.0",
+        "total_tax": "300.0",
+        "total_surcharge": "75.0",
+    }
+
+
+def test_report_for_warehouse(report_db):
+    report = report_for_warehouse(report_db, 2, 2024, 9)
+
+    assert report["warehouse"] == "2"
+    assert report["orders_done"] == "75"
+    assert report["amount_of_items_sold"] == "225"
+    assert report["total_revenue"] == "750.0"
+
+
+def test_report_empty_month(report_db):
+    report = report_for_warehouse(report_db, 3, 2024, 9)
+
+    assert report["orders_done"] == "0"
+    assert report["amount_of_items_sold"] == "0"
+    assert report["total_revenue"] == "0"
+
+
+def test_month_range_december():
+    assert month_range(2024, 12) == (date(2024, 12, 1), date(2025, 1, 1))
+    with pytest.raises(HTTPException) as excinfo:
+        month_range(2024, 13)
+    assert excinfo.value.status_code == 400
+
+
+def add_inventories(db):
+    # delete_order en create_order controleren de voorraad van P000001 en P000002
+    for id in (1, 2):
+        db.add(Inventory(id=id, item_id=f"P00000{id}", total_on_hand=100, total_expected=0, total_ordered=0,
+                         total_allocated=0, total_available=100, is_deleted=False))
+    db.commit()
+
+
+def rollup_rows(db):
+    return [
+        (row.warehouse_id, row.day, row.orders_done, row.items_sold, round(row.total_revenue, 2))
+        for row in db.query(DailyOrderRollup).order_by(DailyOrderRollup.warehouse_id, DailyOrderRollup.day)
+    ]
+
+
+def test_rollup_rebuild_per_warehouse_and_day(report_db):
+    rows = rollup_rows(report_db)
+    # 30 dagen in september (elke dag een warehouse) + order 153 en oktober, de verwijderde order niet
+    assert len(rows) == 32
+    assert (2, date(2024, 9, 30), 5, 15, 50.0) in rows
+    assert (1, date(2024, 9, 30), 1, 0, 5.0) in rows
+    assert (1, date(2024, 10, 1), 1, 5, 99.0) in rows
+
+
+def test_rollup_maintained_by_orders_service(report_db):
+    add_inventories(report_db)
+    order_data = {"id": 200, "source_id": 1, "order_date": datetime(2024, 9, 15, 12), "reference": "ORD00200",
+                  "order_status": "Pending", "warehouse_id": 1, "total_amount": 20.0, "total_discount": 2.0,
+                  "total_tax": 4.0, "total_surcharge": 1.0, "shipment_id": [None],
+                  "items": [{"item_id": "P000001", "amount": 4}]}
+    create_order(report_db, order_data)
+    update_order(report_db, 200, OrderUpdate(total_amount=25.0))
+    delete_order(report_db, 2)
+
+    report = general_report(report_db, 2024, 9)
+    assert report["orders_done"] == "151"
+    assert report["amount_of_items_sold"] == "451"
+    assert report["total_revenue"] == "1520.0"
+
+    # incrementeel bijgehouden is gelijk aan opnieuw opbouwen
+    maintained = rollup_rows(report_db)
+    rebuild_rollup(report_db)
+    assert rollup_rows(report_db) == maintained
+
+
+@pytest.fixture
+def pdf_renders(tmp_path, monkeypatch):
+    # geen wkhtmltopdf/matplotlib nodig, alleen tellen hoe vaak er gerenderd wordt
+    renders = []
+    monkeypatch.setattr(config, "PDF_WORKERS", 0)
+    monkeypatch.setattr(job_service, "jobs", {})
+    monkeypatch.setattr(reporting_service, "PDF_DIR", tmp_path)
+    monkeypatch.setattr(reporting_service, "create_charts", lambda content: {})
+    monkeypatch.setattr(reporting_service.pdfkit, "from_string",
+                        lambda html, path: renders.append(path) or open(path, "w").write(html))
+    return renders
+
+
+def test_generate_pdf_served_from_cache(report_db, pdf_renders):
+    rendered = reporting_service.generate_pdf(report_for_warehouse(report_db, 1, 2024, 9))
+    cached = reporting_service.generate_pdf(report_for_warehouse(report_db, 1, 2024, 9))
+    first, second = json.loads(rendered.body), json.loads(cached.body)
+
+    # inline gerenderd (PDF_WORKERS=0): beide keren 200, maar maar een keer gerenderd
+    assert rendered.status_code == 200
+    assert cached.status_code == 200
+    assert second["pdf_url"] == first["pdf_url"]
+    assert len(pdf_renders) == 1
+    assert [path.name for path in reporting_service.PDF_DIR.iterdir()] == [first["pdf_url"].rsplit("/", 1)[1]]
+
+
+def test_generate_pdf_new_version_after_order_change(report_db, pdf_renders):
+    first = json.loads(reporting_service.generate_pdf(report_for_warehouse(report_db, 1, 2024, 9)).body)
+    other = json.loads(reporting_service.generate_pdf(report_for_warehouse(report_db, 2, 2024, 9)).body)
+    add_inventories(report_db)
+    delete_order(report_db, 2)
+
+    second = json.loads(reporting_service.generate_pdf(report_for_warehouse(report_db, 1, 2024, 9)).body)
+    assert second["pdf_url"] != first["pdf_url"]
+    assert len(pdf_renders) == 3
+    # de oude versie van warehouse 1 is weg, het report van warehouse 2 blijft staan
+    assert sorted(path.name for path in reporting_service.PDF_DIR.iterdir()) == sorted(
+        url.rsplit("/", 1)[1] for url in (second["pdf_url"], other["pdf_url"]))
@@ -0,0 +1,205 @@
+import json
+import pytest
+from datetime import datetime
+from fastapi import Response
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from CargoHubV2.app.main import app
+from CargoHubV2.app.database import get_db, get_async_db
+from CargoHubV2.app.models import Base, Inventory, Location, Order, Shipment, Transfer
+from CargoHubV2.app.services import auth_service
+from CargoHubV2.app.schemas.locations_schema import Location as LocationSchema
+from CargoHubV2.app.schemas.orders_schema import OrderResponse
+from CargoHubV2.app.schemas.shipments_schema import ShipmentResponse, ShipmentListResponse
+from CargoHubV2.app.services.response_service import json_as_text, json_text_columns, orm_response
+
+NOW = datetime(2024, 9, 1, 12, 30)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    db.add(Shipment(id=1, order_id=[1, 2], source_id=3, order_date=NOW, request_date=NOW, shipment_date=NOW,
+                    shipment_type="O", shipment_status="Pending", carrier_code="DHL",
+                    carrier_description="DHL Express", service_code="NextDay", payment_type="Manual",
+                    transfer_mode="Ground", total_package_count=2, total_package_weight=4.5,
+                    items=[{"item_id": "P000001", "amount": 3}], created_at=NOW, updated_at=NOW, is_deleted=False))
+    db.add(Order(id=1, source_id=1, order_date=NOW, reference="ORD00001", order_status="Pending", warehouse_id=1,
+                 shipment_id=None, total_amount=10.0, items=[{"item_id": "P000001", "amount": 2}],
+                 created_at=NOW, updated_at=NOW, is_deleted=False))
+    db.commit()
+    yield db
+    db.close()
+
+
+def test_json_text_columns():
+    assert json_text_columns(Shipment) == ("order_id", "items")
+    assert json_text_columns(Order) == ("shipment_id",)
+
+
+def test_orm_response_passes_json_text_through(db):
+    shipment = db.execute(select(Shipment).options(*json_as_text(Shipment))).scalars().one()
+    # de JSON kolom is niet uitgelezen, de tekst uit de database gaat de response in
+    assert "items" not in shipment.__dict__
+    assert json.loads(shipment.items_json) == [{"item_id": "P000001", "amount": 3}]
+
+    body = json.loads(orm_response([shipment], ShipmentResponse).body)
+    assert body == [{
+        "order_id": [1, 2], "source_id": 3, "order_date": "2024-09-01T12:30:00",
+        "request_date": "2024-09-01T12:30:00", "shipment_date": "2024-09-01T12:30:00", "shipment_type": "O",
+        "shipment_status": "Pending", "notes": None, "carrier_code": "DHL", "carrier_description": "DHL Express",
+        "service_code": "NextDay", "payment_type": "Manual", "transfer_mode": "Ground", "total_package_count": 2,
+        "total_package_weight": 4.5, "items": [{"item_id": "P000001", "amount": 3}], "id": 1,
+        "created_at": "2024-09-01T12:30:00", "updated_at": "2024-09-01T12:30:00",
+    }]
+
+
+def test_orm_response_single_order(db):
+    order = db.execute(select(Order).options(*json_as_text(Order))).scalars().one()
+
+    body = json.loads(orm_response(order, OrderResponse).body)
+    # alleen de velden van het schema, items uit de order lines, SQL NULL blijft null
+    assert set(body) == set(OrderResponse.model_fields)
+    assert body["items"] == [{"item_id": "P000001", "amount": 2}]
+    assert body["shipment_id"] is None
+
+
+def test_orm_response_without_json_text(db):
+    shipment = db.query(Shipment).first()
+
+    body = json.loads(orm_response(shipment, ShipmentResponse, status_code=201).body)
+    assert body["order_id"] == [1, 2]
+    assert body["items"] == [{"item_id": "P000001", "amount": 3}]
+
+
+def test_orm_response_keeps_route_headers(db):
+    response = Response()
+    del response.headers["content-length"]
+    response.headers["X-Next-Cursor"] = "abc"
+
+    result = orm_response(db.query(Shipment).all(), ShipmentResponse, response)
+    assert result.headers["x-next-cursor"] == "abc"
+    assert result.headers["content-type"] == "application/json"
+    assert int(result.headers["content-length"]) == len(result.body)
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    # de list routes tegen een sqlite file (aiosqlite voor de async routes), zoals de loader die vult:
+    # ontbrekende JSON velden worden SQL NULL (geen JSON null)
+    path = tmp_path / "responses.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Order.__table__), [
+            {"id": id, "source_id": 1, "order_date": NOW, "reference": f"ORD0000{id}", "order_status": "Pending",
+             "warehouse_id": 1, "total_amount": 10.0, "created_at": NOW, "updated_at": NOW, "is_deleted": False}
+            for id in (1, 2)
+        ])
+        conn.execute(insert(Shipment.__table__), [{
+            "id": 1, "source_id": 3, "order_date": NOW, "request_date": NOW, "shipment_date": NOW,
+            "shipment_type": "O", "shipment_status": "Pending", "carrier_code": "DHL", "service_code": "NextDay",
+            "payment_type": "Manual", "transfer_mode": "Ground", "total_package_count": 1,
+            "total_package_weight": 1.0, "created_at": NOW, "updated_at": NOW, "is_deleted": False,
+        }])
+        conn.execute(insert(Location.__table__), [{
+            "id": 1, "warehouse_id": 1, "code": "A.1.0", "name": "Row: A, Rack: 1, Shelf: 0", "stock": [],
+            "max_weight": 100.0, "created_at": NOW, "updated_at": NOW, "is_deleted": False,
+        }])
+        conn.execute(insert(Inventory.__table__), [{
+            "id": 1, "item_id": "P000001", "item_reference": "REF00001", "locations": [1], "total_on_hand": 5,
+            "created_at": NOW, "updated_at": NOW, "is_deleted": False,
+        }])
+        conn.execute(insert(Transfer.__table__), [{
+            "id": 1, "reference": "TR00001", "transfer_to": 1, "transfer_status": "Scheduled",
+            "items": [{"item_id": "P000001", "amount": 5}], "created_at": NOW, "updated_at": NOW, "is_deleted": False,
+        }])
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    AsyncSession = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with AsyncSession() as db:
+            yield db
+
+    SyncSession = sessionmaker(bind=engine)
+
+    def override_get_db():
+        db = SyncSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setitem(app.dependency_overrides, get_async_db, override_get_async_db)
+    monkeypatch.setitem(app.dependency_overrides, get_db, override_get_db)
+    monkeypatch.setitem(auth_service.static_roles, "test-key", "warehouse_manager")
+    yield TestClient(app, headers={"api-key": "test-key"})
+    engine.dispose()
+
+
+@pytest.mark.parametrize("url, field", [
+    ("/api/v2/orders/?sort_by=id", "shipment_id"),
+    ("/api/v2/orders/?sort_by=id&fields=id,shipment_id", "shipment_id"),
+    ("/api/v2/orders/?sort_by=id&order_date__gte=2024-09-01", "shipment_id"),
+    ("/api/v2/orders/?sort_by=id&cursor=", "shipment_id"),
+    ("/api/v2/shipments/", "order_id"),
+    ("/api/v2/shipments/", "items"),
+])
+def test_list_route_null_json_column(client, url, field):
+    # de deferred kolom mag niet lazy geladen worden (MissingGreenlet op de AsyncSession)
+    response = client.get(url)
+    assert response.status_code == 200
+    assert all(row[field] is None for row in response.json())
+
+
+@pytest.mark.parametrize("url, schema", [
+    ("/api/v2/orders/", OrderResponse),
+    ("/api/v2/orders/?id=1", OrderResponse),
+    ("/api/v2/shipments/", ShipmentListResponse),
+    ("/api/v2/shipments/?id=1", ShipmentListResponse),
+])
+def test_list_route_response_shape(client, url, schema):
+    # precies de velden van het response_model van de route, inclusief is_deleted zoals voorheen
+    body = client.get(url).json()
+    for row in body if isinstance(body, list) else [body]:
+        assert set(row) == set(schema.model_fields)
+        assert row["is_deleted"] is False
+
+
+def test_location_list_shape(client):
+    # locations gaat via orm_response en wordt niet meer tegen het response_model gevalideerd:
+    # precies de velden van locations_schema.Location, dus zonder is_deleted
+    body = client.get("/api/v2/locations/").json()
+    assert body == [{
+        "id": 1, "warehouse_id": 1, "code": "A.1.0", "name": "Row: A, Rack: 1, Shelf: 0", "stock": [],
+        "max_weight": 100.0, "created_at": "2024-09-01T12:30:00", "updated_at": "2024-09-01T12:30:00",
+    }]
+    assert set(body[0]) == set(LocationSchema.model_fields)
+
+
+@pytest.mark.parametrize("url, model", [
+    ("/api/v2/inventories/", Inventory),
+    ("/api/v2/transfers/", Transfer),
+    ("/api/v2/transfers/?id=1", Transfer),
+])
+def test_list_route_model_shape(client, url, model):
+    # routes zonder response_model: zoals voorheen alle kolommen van het model
+    body = client.get(url).json()
+    for row in body if isinstance(body, list) else [body]:
+        assert set(row) == set(model.__table__.columns.keys())
+        assert row["is_deleted"] is False
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("/api/v2/inventories/?fields=item_reference,total_on_hand", {"item_reference": "REF00001", "total_on_hand": 5}),
+    ("/api/v2/inventories/?fields=locations", {"locations": [1]}),
+    ("/api/v2/transfers/?fields=reference,items", {"reference": "TR00001", "items": [{"item_id": "P000001", "amount": 5}]}),
+    ("/api/v2/transfers/?id=1&fields=transfer_status", {"transfer_status": "Scheduled"}),
+])
+def test_list_route_fields(client, url, expected):
+    body = client.get(url).json()
+    assert (body[0] if isinstance(body, list) else body) == expected
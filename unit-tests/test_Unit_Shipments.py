@@ -1,9 +1,11 @@
+import asyncio
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, AsyncMock, patch
 from fastapi import HTTPException
 from datetime import datetime
 from CargoHubV2.app.services.shipments_service import (
-    create_shipment, get_shipment, get_all_shipments, update_shipment, delete_shipment
+    create_shipment, get_shipment, get_all_shipments, update_shipment, delete_shipment,
+    get_shipment_async, get_all_shipments_async, index_shipment_items
 )
 from CargoHubV2.app.models.shipments_model import Shipment
 from CargoHubV2.app.schemas.shipments_schema import ShipmentCreate, ShipmentUpdate
@@ -42,6 +44,31 @@ def test_create_shipment():
     db.refresh.assert_called_once_with(new_shipment)
 
 
+def test_create_shipment_indexes_items():
+    db = MagicMock()
+    shipment_data = {**SAMPLE_SHIPMENT_DATA,
+                     "items": [{"item_id": "P123", "amount": 5}, {"item_id": "P456", "amount": 1},
+                               {"item_id": "P123", "amount": 2}]}
+
+    new_shipment = create_shipment(db, shipment_data)
+
+    assert [row.item_uid for row in new_shipment.item_index] == ["P123", "P456"]
+
+
+def test_update_shipment_items_updates_index():
+    db = MagicMock()
+    shipment = Shipment(**SAMPLE_SHIPMENT_DATA)
+    index_shipment_items(shipment)
+    kept = shipment.item_index[0]
+    db.query().filter().first.return_value = shipment
+
+    update_shipment(db, 1, ShipmentUpdate(items=[{"item_id": "P789", "amount": 1}, {"item_id": "P123", "amount": 1}]))
+
+    assert [row.item_uid for row in shipment.item_index] == ["P789", "P123"]
+    # bestaande rij wordt hergebruikt, niet verwijderd en opnieuw toegevoegd
+    assert shipment.item_index[1] is kept
+
+
 def test_get_shipment_by_id_found():
     db = MagicMock()
     db.query().filter().first.return_value = Shipment(**SAMPLE_SHIPMENT_DATA)
@@ -118,3 +145,23 @@ def test_delete_shipment_found():
     db.commit.assert_called_once()
     db.delete.assert_not_called()
 
+
+def async_db(first=None, rows=None):
+    db = MagicMock()
+    result = MagicMock()
+    result.scalars().first.return_value = first
+    result.scalars().all.return_value = rows or []
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+def test_get_shipment_async():
+    shipment = Shipment(id=1)
+
+    assert asyncio.run(get_shipment_async(async_db(first=shipment), 1)) == shipment
+
+
+def test_get_all_shipments_async():
+    shipments = [Shipment(id=1)]
+
+    assert asyncio.run(get_all_shipments_async(async_db(rows=shipments))) == shipments
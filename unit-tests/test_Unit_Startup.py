@@ -0,0 +1,39 @@
+import os
+import sys
+import subprocess
+import pytest
+from unittest.mock import MagicMock
+from CargoHubV2 import profile_imports
+from CargoHubV2.app.controllers import reporting_controller
+
+
+@pytest.fixture(scope="module")
+def times():
+    return profile_imports.import_times()
+
+
+def test_import_times(times):
+    own, cumulative = times[profile_imports.APP_MODULE]
+    assert 0 < own <= cumulative
+    assert "CargoHubV2.app.controllers.reporting_controller" in times
+
+
+def test_app_import_skips_heavy_modules(times):
+    # matplotlib, pdfkit, jinja2, tqdm en de PDF services pas bij het eerste gebruik
+    assert profile_imports.heavy_imports(times) == []
+
+
+def test_app_import_creates_no_pdf_dir(tmp_path):
+    env = {**os.environ, "PYTHONPATH": profile_imports.ROOT}
+    subprocess.run([sys.executable, "-c", "import CargoHubV2.app.main"], check=True, cwd=tmp_path, env=env)
+    assert not (tmp_path / "generated_pdfs").exists()
+
+
+def test_report_controller_loads_service_on_first_use(monkeypatch):
+    from CargoHubV2.app.services import reporting_service
+
+    monkeypatch.setattr(reporting_service, "general_report", MagicMock(return_value={"warehouse": "all"}))
+    monkeypatch.setattr(reporting_service, "generate_pdf", MagicMock(return_value="queued"))
+
+    assert reporting_controller.generate_general_report(db=MagicMock(), api_key="key") == "queued"
+    reporting_service.generate_pdf.assert_called_once_with({"warehouse": "all"})